@@ -0,0 +1,55 @@
+"""
+    Validation time of large typed collections, comparing the native pydantic-core
+    item validation of `list[int]` with the item loop the validators used to run.
+"""
+import common  # type: ignore
+import phaistos  # type: ignore
+import phaistos.typings  # type: ignore
+
+ITEMS = 10_000
+RECORDS = 200
+PYTHON_ITEM_LOOP = """
+for item in value:
+  if not item:
+    raise ValueError('Items in list cannot be empty')
+  if not isinstance(item, int):
+    raise ValueError(f"Items in numbers must be of type int")
+"""
+
+
+def make_schema(name: str, field_type: str, validator: str | None = None) -> phaistos.typings.SchemaInputFile:
+    field: phaistos.typings.RawSchemaProperty = {
+        'type': field_type,
+        'description': 'Numbers of the record'
+    }
+    if validator:
+        field['validator'] = validator
+    return {
+        'version': 'v1',
+        'name': name,
+        'description': 'A record with a large collection',
+        'properties': {
+            'numbers': field
+        }
+    }
+
+
+def run_benchmark() -> None:
+    manager = common.start_manager()
+    manager.load_schema(make_schema('PythonItemLoop', 'list', PYTHON_ITEM_LOOP))
+    manager.load_schema(make_schema('NativeItems', 'list[int]'))
+    payloads = [{'numbers': list(range(1, ITEMS + 1))} for _ in range(RECORDS)]
+
+    python_loop = common.measure(
+        f'Python item loop, {RECORDS} x {ITEMS} items',
+        lambda: [manager.validate(payload, 'PythonItemLoop') for payload in payloads]
+    )
+    native = common.measure(
+        f'pydantic-core list[int], {RECORDS} x {ITEMS} items',
+        lambda: [manager.validate(payload, 'NativeItems') for payload in payloads]
+    )
+    print(f'Speedup: {python_loop / native:.2f}x')
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,113 @@
+"""
+    Shared helpers for the Phaistos benchmarks.
+
+    Every benchmark is a standalone script, meant to be run from the repository root:
+
+        python3 benchmarks/<benchmark>.py
+"""
+import logging
+import random
+import time
+import typing
+
+import phaistos  # type: ignore
+import phaistos.consts  # type: ignore
+import phaistos.typings  # type: ignore
+
+BENCHMARK_SCHEMA: phaistos.typings.SchemaInputFile = {
+    'version': 'v1',
+    'name': 'BenchmarkRecord',
+    'description': 'A record with a mix of plain, validated and nested fields',
+    'properties': {
+        'name': {
+            'type': 'str',
+            'description': 'Name of the record',
+            'validator': "if not value[0].isupper(): raise ValueError('Name must start with an uppercase letter')"
+        },
+        'age': {
+            'type': 'int',
+            'description': 'Age of the record',
+            'constraints': {
+                'ge': 1,
+                'le': 120
+            }
+        },
+        'score': {
+            'type': 'float',
+            'description': 'Score of the record',
+            'validator': "if value > 100.0: raise ValueError('Score must be at most 100')"
+        },
+        'tags': {
+            'type': 'list[str]',
+            'description': 'Tags of the record'
+        },
+        'address': {
+            'description': 'Address of the record',
+            'properties': {
+                'city': {
+                    'type': 'str',
+                    'description': 'City of the address'
+                },
+                'zip_code': {
+                    'type': 'int',
+                    'description': 'ZIP code of the address'
+                }
+            }
+        }
+    }
+}
+
+
+def quiet() -> None:
+    """
+    Silence the Phaistos loggers, so that logging does not skew the measurements.
+    """
+    for logger in [
+        phaistos.consts.TRANSPILATION_LOGGER,
+        phaistos.consts.MANAGER_LOGGER,
+        phaistos.consts.COMPILATION_LOGGER,
+        phaistos.consts.VALIDATION_LOGGER,
+    ]:
+        logger.setLevel(logging.CRITICAL)
+
+
+def make_payloads(count: int, invalid_ratio: float = 0.1, seed: int = 42) -> list[dict[str, typing.Any]]:
+    generator = random.Random(seed)
+    payloads = []
+    for index in range(count):
+        payload = {
+            'name': f'Record{index}',
+            'age': generator.randint(1, 120),
+            'score': generator.uniform(0, 100),
+            'tags': [f'tag{generator.randint(0, 9)}' for _ in range(3)],
+            'address': {
+                'city': 'Heraklion',
+                'zip_code': generator.randint(10000, 99999)
+            }
+        }
+        if generator.random() < invalid_ratio:
+            payload['age'] = 0
+        payloads.append(payload)
+    return payloads
+
+
+def start_manager() -> phaistos.Manager:
+    quiet()
+    phaistos.Manager.reset()
+    manager = phaistos.Manager.start(discover=False)
+    manager.load_schema(BENCHMARK_SCHEMA)
+    return manager
+
+
+def measure(label: str, function: typing.Callable[[], typing.Any], repeat: int = 3) -> float:
+    """
+    Run the function a few times and report the best wall-clock time.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    print(f'{label:<48} {best * 1000:>10.2f} ms')
+    return best
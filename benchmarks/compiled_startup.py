@@ -0,0 +1,59 @@
+"""
+    Manager startup time in a fresh process, discovering and transpiling the schema manifests
+    versus importing the same schemas generated ahead of time (with the `phaistos compile` command),
+    with the bytecode of the generated modules already cached.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import yaml
+
+import common  # type: ignore
+from transpile_scaling import make_wide_schema  # type: ignore
+import phaistos.cli  # type: ignore
+
+SCHEMAS = 50
+WIDTH = 100
+RUNS = 3
+STARTUP_SCRIPT = 'import phaistos; phaistos.Manager.start(%s)'
+
+
+def measure_startup(label: str, arguments: str, working_directory: str) -> None:
+    environment = os.environ | {'PYTHONPATH': os.pathsep.join([working_directory, *sys.path])}
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, '-c', STARTUP_SCRIPT % arguments],
+            cwd=working_directory,
+            env=environment,
+            check=True,
+            stderr=subprocess.DEVNULL
+        )
+        timings.append(time.perf_counter() - start)
+    print(f'{label:<40} {min(timings) * 1000:>10.2f} ms')
+
+
+def run_benchmark() -> None:
+    common.quiet()
+    with tempfile.TemporaryDirectory() as working_directory:
+        schemas_path = os.path.join(working_directory, 'schemas')
+        os.makedirs(schemas_path)
+        for index in range(SCHEMAS):
+            with open(os.path.join(schemas_path, f'schema_{index}.yaml'), 'w', encoding='utf-8') as schema_file:
+                yaml.safe_dump(make_wide_schema(WIDTH) | {'name': f'Schema{index}'}, schema_file)
+        phaistos.cli.compile_schemas(schemas_path, os.path.join(working_directory, 'compiled_schemas'))
+
+        print(f'{SCHEMAS} schemas x {WIDTH} properties, best of {RUNS} runs')
+        measure_startup('Discovered manifests', f'schemas_path={schemas_path!r}', working_directory)
+        # The first import writes the bytecode cache, so it is not measured
+        measure_startup('Compiled package (writing bytecode)', "compiled_package='compiled_schemas'", working_directory)
+        measure_startup('Compiled package', "compiled_package='compiled_schemas'", working_directory)
+        measure_startup('Import of phaistos only', 'discover=False', working_directory)
+
+
+if __name__ == '__main__':
+    run_benchmark()
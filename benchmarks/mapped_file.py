@@ -0,0 +1,47 @@
+"""
+    Validation of a large JSONL file mapped into memory (MappedRecordsFile) compared to reading it
+    line by line with validate_stream, and the cost of re-validating only the failed records by the index.
+"""
+import json
+import os
+import tempfile
+
+import common  # type: ignore
+
+import phaistos  # type: ignore
+
+RECORDS = 100_000
+
+
+def run_benchmark() -> None:
+    manager = common.start_manager()
+    factory = manager.get_factory(common.BENCHMARK_SCHEMA['name'])
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        records_path = os.path.join(temporary_directory, 'records.jsonl')
+        with open(records_path, 'w', encoding='utf-8') as records_file:
+            for payload in common.make_payloads(RECORDS):
+                records_file.write(json.dumps(payload) + '\n')
+
+        def validate_stream():
+            with open(records_path, 'rb') as records_file:
+                return sum(not record.valid for record in factory.validate_stream(records_file))
+
+        def validate_mapped():
+            with phaistos.MappedRecordsFile(records_path) as records:
+                return records.validate(factory).invalid_count
+
+        streamed = common.measure(f'validate_stream() over {RECORDS} records', validate_stream)
+        mapped = common.measure(f'mapped index + validate() over {RECORDS} records', validate_mapped)
+        with phaistos.MappedRecordsFile(records_path) as records:
+            results = records.validate(factory)
+            revalidated = common.measure(
+                f'revalidate() of {results.invalid_count} failed records',
+                lambda: records.revalidate(factory, results)
+            )
+            index_size = records.offsets.itemsize * len(records.offsets) + records.lines.itemsize * len(records.lines)
+        print(f'Full pass: {streamed * 1000:.0f} -> {mapped * 1000:.0f} ms, failed records only: {revalidated * 1000:.0f} ms')
+        print(f'Index size: {index_size / 1024:.0f} KiB for {os.path.getsize(records_path) / 1024 / 1024:.1f} MiB of records')
+
+
+if __name__ == '__main__':
+    run_benchmark()
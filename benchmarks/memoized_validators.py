@@ -0,0 +1,40 @@
+"""
+    Validation of a field with few distinct values and an expensive validator,
+    with the validator memoized (`cache_size`) compared to calling it for each record.
+"""
+import copy
+
+import common  # type: ignore
+import phaistos.typings  # type: ignore
+
+RECORDS = 20_000
+DISTINCT_CITIES = 20
+# A stand-in for an expensive check, e.g. a lookup in a large table
+CITY_VALIDATOR = "if sum(map(ord, value * 50)) % 97 == 0 and value == 'Atlantis': raise ValueError('Unknown city')"
+
+
+def run_benchmark() -> None:
+    manager = common.start_manager()
+    payloads = common.make_payloads(RECORDS)
+    for index, payload in enumerate(payloads):
+        payload['address']['city'] = f'City{index % DISTINCT_CITIES}'
+
+    timings = {}
+    for cache_size in [None, DISTINCT_CITIES]:
+        schema = copy.deepcopy(common.BENCHMARK_SCHEMA)
+        schema['name'] = f'BenchmarkRecord{cache_size or ""}'
+        city_validator: phaistos.typings.RawValidator = {'source': CITY_VALIDATOR, 'mode': 'after'}
+        if cache_size is not None:
+            city_validator['cache_size'] = cache_size
+        schema['properties']['address']['properties']['city']['validator'] = city_validator  # type: ignore
+        factory = manager.get_factory(manager.load_schema(schema))
+        timings[cache_size] = common.measure(
+            f'validate() of {RECORDS} records, validator cache size: {cache_size}',
+            lambda: [factory.validate(payload) for payload in payloads]  # pylint: disable=cell-var-from-loop
+        )
+    print(f'Per call: {timings[None] / RECORDS * 1e6:.2f} -> {timings[DISTINCT_CITIES] / RECORDS * 1e6:.2f} us, '
+          f'memo: {factory.validator_cache_info()}')
+
+
+if __name__ == '__main__':
+    run_benchmark()
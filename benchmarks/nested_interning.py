@@ -0,0 +1,74 @@
+"""
+    Transpilation time and the number of created classes for a schema repeating
+    the same nested blocks, with and without the interning of the nested schemas.
+"""
+import itertools
+import time
+
+import common  # type: ignore
+import phaistos.schema  # type: ignore
+import phaistos.transpiler  # type: ignore
+import phaistos.typings  # type: ignore
+
+REPETITIONS = 200
+ADDRESS: phaistos.typings.RawSchemaProperty = {
+    'description': 'Address',
+    'properties': {
+        'street': {'type': 'str', 'description': 'Street'},
+        'city': {'type': 'str', 'description': 'City'},
+        'zip_code': {'type': 'int', 'description': 'ZIP code'}
+    }
+}
+MONEY: phaistos.typings.RawSchemaProperty = {
+    'description': 'Amount of money',
+    'properties': {
+        'amount': {'type': 'decimal.Decimal', 'description': 'Amount'},
+        'currency': {'type': 'str', 'description': 'Currency code'}
+    }
+}
+
+
+def make_schema() -> phaistos.typings.SchemaInputFile:
+    return {
+        'version': 'v1',
+        'name': 'Ledger',
+        'description': 'A schema repeating the same nested blocks',
+        'properties': {
+            f'entry_{index}': {
+                'description': f'Entry number {index}',
+                'properties': {
+                    'address': ADDRESS,
+                    'money': MONEY
+                }
+            }
+            for index in range(REPETITIONS)
+        }
+    }
+
+
+def transpile(schema: phaistos.typings.SchemaInputFile) -> tuple[float, int]:
+    created_models = len(phaistos.schema.TranspiledSchema.__subclasses__())
+    start = time.perf_counter()
+    model = phaistos.transpiler.Transpiler.make_schema(schema)
+    elapsed = time.perf_counter() - start
+    del model
+    return elapsed, len(phaistos.schema.TranspiledSchema.__subclasses__()) - created_models
+
+
+def run_benchmark() -> None:
+    common.quiet()
+    schema = make_schema()
+    interned_time, interned_models = transpile(schema)
+    print(f'{"Interned nested schemas":<32} {interned_time * 1000:>10.2f} ms {interned_models:>6} classes')
+
+    unique_fingerprints = itertools.count()
+    fingerprint = phaistos.transpiler.Transpiler.__dict__['fingerprint']
+    phaistos.transpiler.Transpiler.fingerprint = staticmethod(lambda schema: str(next(unique_fingerprints)))  # type: ignore
+    separate_time, separate_models = transpile(schema)
+    phaistos.transpiler.Transpiler.fingerprint = fingerprint  # type: ignore
+    print(f'{"Separate nested schemas":<32} {separate_time * 1000:>10.2f} ms {separate_models:>6} classes')
+    print(f'Speedup: {separate_time / interned_time:.2f}x')
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,31 @@
+"""
+    Validation of payloads repeated unchanged with the results cache of SchemaInstancesFactory
+    enabled, compared to validating each of them from scratch.
+"""
+import common  # type: ignore
+
+RECORDS = 20_000
+DISTINCT_PAYLOADS = 200
+
+
+def run_benchmark() -> None:
+    manager = common.start_manager()
+    factory = manager.get_factory(common.BENCHMARK_SCHEMA['name'])
+    distinct_payloads = common.make_payloads(DISTINCT_PAYLOADS)
+    payloads = [distinct_payloads[index % DISTINCT_PAYLOADS] for index in range(RECORDS)]
+
+    uncached = common.measure(
+        f'validate() of {RECORDS} records, no cache',
+        lambda: [factory.validate(payload) for payload in payloads]
+    )
+    factory.enable_cache(max_size=DISTINCT_PAYLOADS)
+    cached = common.measure(
+        f'validate() of {RECORDS} records, cached',
+        lambda: [factory.validate(payload) for payload in payloads]
+    )
+    print(f'Per call: {uncached / RECORDS * 1e6:.2f} -> {cached / RECORDS * 1e6:.2f} us, '
+          f'hits: {factory.result_cache.hits}, misses: {factory.result_cache.misses}')
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,80 @@
+"""
+    Transpilation time and peak memory over the size of the schema, for wide
+    (many properties) and deep (many nesting levels) generated schemas.
+"""
+import time
+import tracemalloc
+
+import common  # type: ignore
+import phaistos.transpiler  # type: ignore
+import phaistos.typings  # type: ignore
+
+WIDTHS = [100, 500, 1_000, 2_000, 4_000]
+DEPTHS = [5, 10, 20, 40]
+
+
+def make_property(index: int) -> phaistos.typings.RawSchemaProperty:
+    prop: phaistos.typings.RawSchemaProperty = {
+        'type': ['str', 'int', 'float', 'list[int]'][index % 4],
+        'description': f'Field number {index}'
+    }
+    if index % 10 == 0:
+        prop['validator'] = 'if not value: raise ValueError("Value is required")'
+    return prop
+
+
+def make_wide_schema(width: int) -> phaistos.typings.SchemaInputFile:
+    return {
+        'version': 'v1',
+        'name': f'Wide{width}',
+        'description': 'A generated schema with many properties',
+        'properties': {
+            f'field_{index}': make_property(index)
+            for index in range(width)
+        }
+    }
+
+
+def make_deep_schema(depth: int, width: int = 20) -> phaistos.typings.SchemaInputFile:
+    properties: dict = {
+        f'field_{index}': make_property(index)
+        for index in range(width)
+    }
+    for level in range(depth):
+        properties = {
+            f'level_{level}': {
+                'description': f'Nesting level {level}',
+                'properties': properties
+            }
+        } | {
+            f'field_{index}': make_property(index)
+            for index in range(width)
+        }
+    return {
+        'version': 'v1',
+        'name': f'Deep{depth}',
+        'description': 'A generated schema with many nesting levels',
+        'properties': properties
+    }
+
+
+def measure_transpilation(label: str, schema: phaistos.typings.SchemaInputFile) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    phaistos.transpiler.Transpiler.make_schema(schema)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{label:<32} {elapsed * 1000:>10.2f} ms {peak / 2**20:>10.2f} MiB peak')
+
+
+def run_benchmark() -> None:
+    common.quiet()
+    for width in WIDTHS:
+        measure_transpilation(f'{width} properties', make_wide_schema(width))
+    for depth in DEPTHS:
+        measure_transpilation(f'{depth} levels x 20 properties', make_deep_schema(depth))
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,65 @@
+"""
+    Transpilation time of a schema with thousands of properties, resolving the property
+    types with the TypeRegistry compared to resolving each of them with pydoc.locate.
+"""
+import pydoc
+import time
+
+import common  # type: ignore
+import phaistos.transpiler  # type: ignore
+import phaistos.type_expressions  # type: ignore
+
+PROPERTIES = 5_000
+TYPES = ['str', 'int', 'float', 'bool', 'datetime.datetime', 'decimal.Decimal', 'uuid.UUID', 'list[int]', 'dict[str, float]']
+
+
+def make_schema() -> phaistos.typings.SchemaInputFile:
+    return {
+        'version': 'v1',
+        'name': 'WideRecord',
+        'description': 'A record with thousands of properties',
+        'properties': {
+            f'field_{index}': {
+                'type': TYPES[index % len(TYPES)],
+                'description': f'Field number {index}'
+            }
+            for index in range(PROPERTIES)
+        }
+    }
+
+
+def transpile(schema: phaistos.typings.SchemaInputFile) -> float:
+    phaistos.type_expressions.TypeExpressionParser._parsed.clear()  # pylint: disable=protected-access
+    start = time.perf_counter()
+    phaistos.transpiler.Transpiler.make_schema(schema)
+    return time.perf_counter() - start
+
+
+def run_benchmark() -> None:
+    common.quiet()
+    schema = make_schema()
+    registry = phaistos.type_expressions.TypeRegistry
+
+    with_registry = min(transpile(schema) for _ in range(3))
+    print(f'{f"TypeRegistry, {PROPERTIES} properties":<48} {with_registry * 1000:>10.2f} ms')
+
+    # Emulates the previous resolution, which located the type of each property anew
+    parser = phaistos.type_expressions.TypeExpressionParser
+    original_resolve, original_parse = registry.__dict__['resolve'], parser.__dict__['parse']
+
+    def locate(cls, name):  # pylint: disable=unused-argument
+        return pydoc.locate(name)
+
+    def parse_uncached(cls, expression):
+        cls._parsed.clear()  # pylint: disable=protected-access
+        return original_parse.__func__(cls, expression)
+
+    registry.resolve, parser.parse = classmethod(locate), classmethod(parse_uncached)  # type: ignore
+    with_locate = min(transpile(schema) for _ in range(3))
+    registry.resolve, parser.parse = original_resolve, original_parse  # type: ignore
+    print(f'{f"pydoc.locate, {PROPERTIES} properties":<48} {with_locate * 1000:>10.2f} ms')
+    print(f'Speedup: {with_locate / with_registry:.2f}x')
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,38 @@
+"""
+    Scaling of SchemaInstancesFactory.validate_concurrently with the number of threads.
+
+    On regular CPython builds the GIL serialises the validators, so the gains are limited
+    to the parts of pydantic-core that release it. On free-threaded builds (python3.13t and newer,
+    with the GIL disabled) the validation should scale with the number of cores.
+"""
+import os
+import sys
+
+import common  # type: ignore
+
+RECORDS = 20_000
+THREADS = [1, 2, 4, 8]
+
+
+def run_benchmark() -> None:
+    manager = common.start_manager()
+    factory = manager.get_factory(common.BENCHMARK_SCHEMA['name'])
+    payloads = common.make_payloads(RECORDS)
+
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL enabled: {is_gil_enabled}, CPUs: {os.cpu_count()}')
+
+    baseline = common.measure(
+        'sequential validate() loop',
+        lambda: [factory.validate(payload) for payload in payloads]
+    )
+    for threads in THREADS:
+        timing = common.measure(
+            f'validate_concurrently(max_workers={threads})',
+            lambda threads=threads: factory.validate_concurrently(payloads, max_workers=threads)
+        )
+        print(f'  speedup over sequential: {baseline / timing:.2f}x')
+
+
+if __name__ == '__main__':
+    run_benchmark()
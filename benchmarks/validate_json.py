@@ -0,0 +1,29 @@
+"""
+    Validation of raw JSON documents with SchemaInstancesFactory.validate_json compared
+    to decoding them with json.loads and validating the decoded dictionaries with validate.
+"""
+import json
+
+import common  # type: ignore
+
+RECORDS = 20_000
+
+
+def run_benchmark() -> None:
+    manager = common.start_manager()
+    factory = manager.get_factory(common.BENCHMARK_SCHEMA['name'])
+    documents = [json.dumps(payload).encode() for payload in common.make_payloads(RECORDS)]
+
+    decoded = common.measure(
+        f'json.loads() + validate() for {RECORDS} documents',
+        lambda: [factory.validate(json.loads(document)) for document in documents]
+    )
+    direct = common.measure(
+        f'validate_json() for {RECORDS} documents',
+        lambda: [factory.validate_json(document) for document in documents]
+    )
+    print(f'Per document: {decoded / RECORDS * 1e6:.2f} -> {direct / RECORDS * 1e6:.2f} us ({decoded / direct:.2f}x)')
+
+
+if __name__ == '__main__':
+    run_benchmark()
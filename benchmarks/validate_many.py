@@ -0,0 +1,27 @@
+"""
+    Throughput of SchemaInstancesFactory.validate_many compared
+    to validating the same records one by one with validate.
+"""
+import common  # type: ignore
+
+RECORDS = 20_000
+
+
+def run_benchmark() -> None:
+    manager = common.start_manager()
+    factory = manager.get_factory(common.BENCHMARK_SCHEMA['name'])
+    payloads = common.make_payloads(RECORDS)
+
+    per_record = common.measure(
+        f'validate() loop over {RECORDS} records',
+        lambda: [factory.validate(payload) for payload in payloads]
+    )
+    batched = common.measure(
+        f'validate_many() over {RECORDS} records',
+        lambda: factory.validate_many(payloads, chunk_size=1000)
+    )
+    print(f'Throughput: {RECORDS / per_record:,.0f} -> {RECORDS / batched:,.0f} records/s ({per_record / batched:.2f}x)')
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,54 @@
+"""
+    Per-call cost of validating a record without instantiating the model (SchemaInstancesFactory.validate)
+    compared to instantiating it, and of building a valid instance in a single pass (validate_and_build)
+    compared to validating the record first and instantiating the model afterwards.
+"""
+import common  # type: ignore
+
+import phaistos.schema  # type: ignore
+import phaistos.typings  # type: ignore
+
+RECORDS = 20_000
+
+
+def run_benchmark() -> None:
+    manager = common.start_manager()
+    factory = manager.get_factory(common.BENCHMARK_SCHEMA['name'])
+    payloads = common.make_payloads(RECORDS)
+    valid_payloads = common.make_payloads(RECORDS, invalid_ratio=0.0)
+
+    def instantiate(data):
+        # The validation as done before the validate-only path
+        with phaistos.schema.validation_scope() as collected_errors:
+            factory._model(**data)  # pylint: disable=protected-access
+        return phaistos.typings.ValidationResults(
+            errors=[*set(collected_errors)],
+            data=data,
+            schema_source=factory._model.cached_json_schema  # pylint: disable=protected-access
+        )
+
+    def validate_then_build(data):
+        return factory._model(**data) if factory.validate(data).valid else None  # pylint: disable=protected-access
+
+    instantiated = common.measure(
+        f'instantiate the model for {RECORDS} records',
+        lambda: [instantiate(payload) for payload in payloads]
+    )
+    validated = common.measure(
+        f'validate() for {RECORDS} records',
+        lambda: [factory.validate(payload) for payload in payloads]
+    )
+    two_passes = common.measure(
+        f'validate(), then build for {RECORDS} records',
+        lambda: [validate_then_build(payload) for payload in valid_payloads]
+    )
+    single_pass = common.measure(
+        f'validate_and_build() for {RECORDS} records',
+        lambda: [factory.validate_and_build(payload) for payload in valid_payloads]
+    )
+    print(f'Validation per call: {instantiated / RECORDS * 1e6:.2f} -> {validated / RECORDS * 1e6:.2f} us')
+    print(f'Build per call: {two_passes / RECORDS * 1e6:.2f} -> {single_pass / RECORDS * 1e6:.2f} us')
+
+
+if __name__ == '__main__':
+    run_benchmark()
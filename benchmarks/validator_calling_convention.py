@@ -0,0 +1,45 @@
+"""
+    Per-call overhead of the compiled validators, comparing the bound calling
+    convention with the legacy one (which imports logging and copies the values
+    into the module globals on every call).
+"""
+import timeit
+import typing
+
+import common  # type: ignore
+import phaistos.compiler  # type: ignore
+import phaistos.schema  # type: ignore
+import phaistos.transpiler  # type: ignore
+
+CALLS = 200_000
+RECORDS = 20_000
+
+
+class _Info:  # pylint: disable=too-few-public-methods
+    field_name = 'name'
+
+
+def compile_schema(calling_convention: str) -> typing.Any:
+    phaistos.compiler.ValidationFunctionsCompiler.set_calling_convention(calling_convention)  # type: ignore
+    return phaistos.transpiler.Transpiler.make_schema(common.BENCHMARK_SCHEMA)
+
+
+def run_benchmark() -> None:
+    common.quiet()
+    payloads = common.make_payloads(RECORDS)
+    timings = {}
+    for calling_convention in ['legacy', 'bound']:
+        schema = compile_schema(calling_convention)
+        validator = schema.name_validator
+        per_call = min(timeit.repeat(lambda: validator('Record', _Info), number=CALLS, repeat=3)) / CALLS  # pylint: disable=cell-var-from-loop
+        print(f'{calling_convention:<8} field validator call {per_call * 1e9:>10.1f} ns')
+        factory = phaistos.schema.SchemaInstancesFactory(name=schema.transpilation_name, _model=schema)
+        timings[calling_convention] = common.measure(
+            f'{calling_convention:<8} validate() over {RECORDS} records',
+            lambda: [factory.validate(payload) for payload in payloads]  # pylint: disable=cell-var-from-loop
+        )
+    print(f'Speedup of the bound convention: {timings["legacy"] / timings["bound"]:.2f}x')
+
+
+if __name__ == '__main__':
+    run_benchmark()
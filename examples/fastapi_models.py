@@ -106,8 +106,25 @@ def get_mockument(
     return mockument
 
 
+@app.post("/mockuments/validate")
+async def validate_mockument(mockument_data: dict[str, typing.Any]):
+    """
+    Validate a mockument sent in the request body.
+    The validation is offloaded from the event loop, so a burst
+    of large payloads does not block other requests.
+    """
+    results = await manager.avalidate(mockument_data, 'Mockument')
+    if not results.valid:
+        raise fastapi.HTTPException(
+            status_code=422,
+            detail=[str(error) for error in results.errors]
+        )
+    return {"valid": True}
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)  # Set logging level to INFO
+    phaistos.Manager.configure_async(max_concurrency=8)  # At most 8 validations offloaded at once
     uvicorn.run(
         app,
         host="localhost",
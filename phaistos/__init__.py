@@ -1,7 +1,13 @@
+from phaistos.checkpoints import CheckpointedValidation
+from phaistos.files import MappedRecordsFile
 from phaistos.manager import Manager
 from phaistos.transpiler import Transpiler
+from phaistos.type_expressions import TypeRegistry
 
 __all__ = [
+    'CheckpointedValidation',
+    'MappedRecordsFile',
     'Manager',
     'Transpiler',
+    'TypeRegistry',
 ]
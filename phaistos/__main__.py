@@ -0,0 +1,5 @@
+import sys
+
+from phaistos.cli import main
+
+sys.exit(main())
@@ -0,0 +1,208 @@
+from __future__ import annotations
+import collections
+import dataclasses
+import hashlib
+import logging
+import marshal
+import os
+import tempfile
+import threading
+import time
+import types
+import typing
+
+import phaistos.consts
+from phaistos.exceptions import FieldValidationErrorInfo
+from phaistos.typings import SchemaInputFile
+
+
+class TranspilationCacheEntry(typing.TypedDict):
+    """
+    A dictionary that represents a cached transpilation of a schema file.
+
+    Attributes:
+        schema (SchemaInputFile): The parsed schema manifest.
+        code (dict[str, types.CodeType]): The compiled validators code objects, keyed by the hash of their rendered source.
+    """
+    schema: SchemaInputFile
+    code: dict[str, types.CodeType]
+
+
+@dataclasses.dataclass(kw_only=True)
+class TranspilationCache:
+    """
+    A persistent cache of parsed schema manifests and compiled validators, so that unchanged
+    schema files skip the YAML parsing and the validators compilation on the next start.
+
+    Entries are keyed by the hash of the schema file content combined with the Phaistos,
+    pydantic and Python versions, so any change to either of them results in a cache miss.
+
+    Attributes:
+        path (str): The directory where the cache entries are stored.
+    """
+    path: str
+    _logger: typing.ClassVar[logging.Logger] = phaistos.consts.MANAGER_LOGGER
+
+    def __post_init__(self) -> None:
+        os.makedirs(self.path, exist_ok=True)
+
+    @staticmethod
+    def key(content: bytes) -> str:
+        content_hash = hashlib.sha256(content)
+        content_hash.update(phaistos.consts.TRANSPILATION_ENVIRONMENT.encode())
+        return content_hash.hexdigest()
+
+    def load(self, key: str) -> TranspilationCacheEntry | None:
+        try:
+            with open(self._entry_path(key), 'rb') as entry_file:
+                return marshal.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except (EOFError, ValueError, TypeError) as corrupted_entry:
+            self._logger.warning(f'Ignoring corrupted transpilation cache entry {key}: {corrupted_entry}')
+            return None
+
+    def store(self, key: str, entry: TranspilationCacheEntry) -> None:
+        try:
+            serialized_entry = marshal.dumps(dict(entry))
+        except ValueError:
+            self._logger.info(f'Schema {entry["schema"].get("name")} contains values that cannot be cached')
+            return
+        # Written to a temporary file first, so that concurrently starting processes never read a partial entry
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as entry_file:
+            entry_file.write(serialized_entry)
+        os.replace(temporary_path, self._entry_path(key))
+
+    def clear(self) -> None:
+        for entry in os.scandir(self.path):
+            if entry.name.endswith('.marshal'):
+                os.remove(entry.path)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, f'{key}.marshal')
+
+
+@dataclasses.dataclass(kw_only=True)
+class ValidationResultsCache:
+    """
+    A bounded, thread-safe cache of the validation errors of payloads, keyed by the hash of the canonical form
+    of a payload (or of a raw JSON document) combined with the fingerprint of the schema. The least recently used
+    entries are evicted when the cache is full, and the entries older than the time to live are never returned.
+
+    The canonical form of a payload is its marshalled form, with the keys of its dictionaries sorted, so it is
+    type-preserving (e.g. a tuple is never taken for a list). Payloads with values that cannot be marshalled
+    (e.g. datetimes or instances of custom classes) or with keys that cannot be sorted are always validated.
+
+    Attributes:
+        fingerprint (str): The fingerprint of the schema the results are cached for.
+        max_size (int): The maximum number of cached results.
+        ttl (float | None): The time to live of the cached results, in seconds (unlimited if not given).
+        hits (int): The number of validations answered from the cache.
+        misses (int): The number of validations not found in the cache (including the ones that cannot be cached).
+    """
+    fingerprint: str
+    max_size: int = 1024
+    ttl: float | None = None
+    hits: int = 0
+    misses: int = 0
+    _entries: collections.OrderedDict[bytes, tuple[float, list[FieldValidationErrorInfo]]] = dataclasses.field(
+        default_factory=collections.OrderedDict,
+        repr=False
+    )
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError('Cache size must be a positive integer')
+        if self.ttl is not None and self.ttl <= 0:
+            raise ValueError('Cache time to live must be a positive number of seconds')
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(
+        self,
+        data: dict[str, typing.Any] | None = None,
+        raw: str | bytes | bytearray | memoryview | None = None,
+        context: dict[str, typing.Any] | None = None
+    ) -> bytes | None:
+        """
+        Compute the cache key of a payload or a raw JSON document.
+
+        Args:
+            data (dict[str, typing.Any] | None): The payload, if no raw JSON document is given.
+            raw (str | bytes | bytearray | memoryview | None): The raw JSON document (hashed in place, without copying it).
+            context (dict[str, typing.Any] | None): The context merged over the schema context for the validation, if any.
+
+        Returns:
+            bytes | None: The key, or None if the payload (or the context) has no canonical form.
+        """
+        content_hash = hashlib.blake2b(self.fingerprint.encode(), digest_size=16)
+        try:
+            if context:
+                # The results depend on the context as well, so the ones of different contexts never share the keys
+                content_hash.update(b'context:')
+                content_hash.update(marshal.dumps(self._canonical(context), 2))
+            if raw is not None:
+                # Documents are validated in the JSON mode, so they never share the keys with the payloads
+                content_hash.update(b'json:')
+                content_hash.update(raw.encode() if isinstance(raw, str) else raw)
+                return content_hash.digest()
+            # The version 2 of the marshal format has no references, so equal payloads are always marshalled the same
+            canonical_form = marshal.dumps(self._canonical(data), 2)
+        except (TypeError, ValueError):
+            return None
+        content_hash.update(b'data:')
+        content_hash.update(canonical_form)
+        return content_hash.digest()
+
+    @classmethod
+    def _canonical(cls, value: typing.Any) -> typing.Any:
+        value_type = type(value)
+        if value_type is dict:
+            return {key: cls._canonical(value[key]) for key in sorted(value)}
+        if value_type is list:
+            return [cls._canonical(item) for item in value]
+        return value
+
+    def get(self, key: bytes | None) -> list[FieldValidationErrorInfo] | None:
+        """
+        Get the cached errors of a payload, marking them as the most recently used.
+        The errors are rebuilt for each hit, so that they are timestamped with the validation they are returned for.
+
+        Args:
+            key (bytes | None): The key of the payload.
+
+        Returns:
+            list[FieldValidationErrorInfo] | None: The cached errors, or None if they are not cached (or have expired).
+        """
+        with self._lock:
+            if key is not None and (entry := self._entries.get(key)) is not None:
+                if self.ttl is None or time.monotonic() - entry[0] < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return [FieldValidationErrorInfo(name=error.name, message=error.message) for error in entry[1]]
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes | None, errors: list[FieldValidationErrorInfo]) -> None:
+        """
+        Cache the errors of a payload, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (bytes | None): The key of the payload (nothing is cached if it is None).
+            errors (list[FieldValidationErrorInfo]): The validation errors of the payload.
+        """
+        if key is None:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), errors)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,115 @@
+import collections
+import dataclasses
+import logging
+import threading
+import types
+import typing
+from typing import Any, ClassVar
+
+from phaistos.exceptions import FieldValidationErrorInfo
+from phaistos.typings import SchemaInputFile
+
+
+class TranspilationCacheEntry(typing.TypedDict):
+    """
+    A dictionary that represents a cached transpilation of a schema file.
+
+    Attributes:
+        schema (SchemaInputFile): The parsed schema manifest.
+        code (dict[str, types.CodeType]): The compiled validators code objects, keyed by the hash of their rendered source.
+    """
+    schema: SchemaInputFile
+    code: dict[str, types.CodeType]
+
+
+@dataclasses.dataclass(kw_only=True)
+class TranspilationCache:
+    """
+    A persistent cache of parsed schema manifests and compiled validators, so that unchanged
+    schema files skip the YAML parsing and the validators compilation on the next start.
+
+    Entries are keyed by the hash of the schema file content combined with the Phaistos,
+    pydantic and Python versions, so any change to either of them results in a cache miss.
+
+    Attributes:
+        path (str): The directory where the cache entries are stored.
+    """
+    path: str
+    _logger: ClassVar[logging.Logger]
+
+    def __post_init__(self) -> None: ...
+    @staticmethod
+    def key(content: bytes) -> str: ...
+    def load(self, key: str) -> TranspilationCacheEntry | None: ...
+    def store(self, key: str, entry: TranspilationCacheEntry) -> None: ...
+    def clear(self) -> None: ...
+    def _entry_path(self, key: str) -> str: ...
+
+
+@dataclasses.dataclass(kw_only=True)
+class ValidationResultsCache:
+    """
+    A bounded, thread-safe cache of the validation errors of payloads, keyed by the hash of the canonical form
+    of a payload (or of a raw JSON document) combined with the fingerprint of the schema. The least recently used
+    entries are evicted when the cache is full, and the entries older than the time to live are never returned.
+
+    The canonical form of a payload is its marshalled form, with the keys of its dictionaries sorted, so it is
+    type-preserving (e.g. a tuple is never taken for a list). Payloads with values that cannot be marshalled
+    (e.g. datetimes or instances of custom classes) or with keys that cannot be sorted are always validated.
+
+    Attributes:
+        fingerprint (str): The fingerprint of the schema the results are cached for.
+        max_size (int): The maximum number of cached results.
+        ttl (float | None): The time to live of the cached results, in seconds (unlimited if not given).
+        hits (int): The number of validations answered from the cache.
+        misses (int): The number of validations not found in the cache (including the ones that cannot be cached).
+    """
+    fingerprint: str
+    max_size: int = ...
+    ttl: float | None = ...
+    hits: int = ...
+    misses: int = ...
+    _entries: collections.OrderedDict[bytes, tuple[float, list[FieldValidationErrorInfo]]] = ...
+    _lock: threading.Lock = ...
+
+    def __post_init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def key(
+        self,
+        data: dict[str, Any] | None = ...,
+        raw: str | bytes | bytearray | memoryview | None = ...,
+        context: dict[str, Any] | None = ...
+    ) -> bytes | None:
+        """
+        Compute the cache key of a payload or a raw JSON document.
+
+        Args:
+            data (dict[str, typing.Any] | None): The payload, if no raw JSON document is given.
+            raw (str | bytes | bytearray | memoryview | None): The raw JSON document (hashed in place, without copying it).
+            context (dict[str, typing.Any] | None): The context merged over the schema context for the validation, if any.
+
+        Returns:
+            bytes | None: The key, or None if the payload (or the context) has no canonical form.
+        """
+    @classmethod
+    def _canonical(cls, value: Any) -> Any: ...
+    def get(self, key: bytes | None) -> list[FieldValidationErrorInfo] | None:
+        """
+        Get the cached errors of a payload, marking them as the most recently used.
+        The errors are rebuilt for each hit, so that they are timestamped with the validation they are returned for.
+
+        Args:
+            key (bytes | None): The key of the payload.
+
+        Returns:
+            list[FieldValidationErrorInfo] | None: The cached errors, or None if they are not cached (or have expired).
+        """
+    def put(self, key: bytes | None, errors: list[FieldValidationErrorInfo]) -> None:
+        """
+        Cache the errors of a payload, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (bytes | None): The key of the payload (nothing is cached if it is None).
+            errors (list[FieldValidationErrorInfo]): The validation errors of the payload.
+        """
+    def clear(self) -> None: ...
@@ -0,0 +1,169 @@
+"""
+    Checkpointed, resumable validation of long-running inputs.
+
+    The progress of a run (the position in the input, the running counts and a summary of the errors)
+    is written to a checkpoint file every given number of entries, replacing the previous checkpoint
+    atomically. A run started again with the same checkpoint file resumes from the last checkpoint,
+    as long as the schema has not changed since, as told by its fingerprint.
+"""
+from __future__ import annotations
+import dataclasses
+import itertools
+import json
+import logging
+import os
+import tempfile
+import typing
+
+import phaistos.consts
+from phaistos.exceptions import CheckpointMismatchException, FieldValidationErrorInfo
+from phaistos.schema import SchemaInstancesFactory
+from phaistos.typings import ValidationCheckpoint
+
+
+@dataclasses.dataclass(kw_only=True)
+class CheckpointedValidation:
+    """
+    A validation run of a (possibly very long) input against the schema of a factory, resumable from its checkpoints.
+
+    Attributes:
+        factory (SchemaInstancesFactory): The factory of the schema, which has to know its source manifest.
+        checkpoint_path (str): The path of the checkpoint file.
+        checkpoint_every (int): The number of entries validated between the checkpoints.
+        max_failures (int): The maximum number of invalid entries recorded with their errors in the checkpoint.
+    """
+    factory: SchemaInstancesFactory
+    checkpoint_path: str
+    checkpoint_every: int = 10_000
+    max_failures: int = 100
+    _logger: typing.ClassVar[logging.Logger] = phaistos.consts.VALIDATION_LOGGER
+
+    def __post_init__(self) -> None:
+        if self.checkpoint_every < 1:
+            raise ValueError('Checkpoint interval must be a positive integer')
+        self.checkpoint_path = os.fspath(self.checkpoint_path)
+
+    def load_checkpoint(self) -> ValidationCheckpoint | None:
+        """
+        Load the last checkpoint of the run, verifying that it was written for the current version of the schema.
+
+        Returns:
+            ValidationCheckpoint | None: The last checkpoint, or None if the run has not been started yet.
+
+        Raises:
+            CheckpointMismatchException: If the checkpoint was written for another schema or another version of it.
+        """
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as checkpoint_file:
+                checkpoint = ValidationCheckpoint(**json.load(checkpoint_file))
+        except FileNotFoundError:
+            return None
+        if checkpoint.schema != self.factory.name or checkpoint.fingerprint != self.factory.fingerprint:
+            raise CheckpointMismatchException(
+                f'Checkpoint {self.checkpoint_path} was written for another version of schema {checkpoint.schema}, '
+                f'so the validation against the current version of schema {self.factory.name} cannot be resumed from it'
+            )
+        return checkpoint
+
+    def run(self, payloads: typing.Iterable[dict], resume: bool = True) -> ValidationCheckpoint:
+        """
+        Validate the data entries, resuming from the last checkpoint. The entries consumed before
+        the checkpoint are skipped, so the iterable has to yield the same entries in the same order on each run.
+
+        Args:
+            payloads (typing.Iterable[dict]): The data entries to validate.
+            resume (bool): Whether to resume from the last checkpoint (if not, the run starts over).
+
+        Returns:
+            ValidationCheckpoint: The final checkpoint of the run, with the counts and the errors summary.
+        """
+        checkpoint = self._start(resume)
+        if checkpoint.completed:
+            return checkpoint
+        entries = (
+            (position, position + 1, data)
+            for position, data in enumerate(itertools.islice(payloads, checkpoint.position, None), start=checkpoint.position)
+        )
+        return self._validate_entries(checkpoint, entries, self.factory._collect_errors)  # pylint: disable=protected-access
+
+    def run_file(self, path: str | os.PathLike, resume: bool = True) -> ValidationCheckpoint:
+        """
+        Validate the records of a newline-delimited JSON (JSONL/NDJSON) file, resuming from the byte offset
+        of the last checkpoint (without reading the file up to it). Blank lines are skipped.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+            resume (bool): Whether to resume from the last checkpoint (if not, the run starts over).
+
+        Returns:
+            ValidationCheckpoint: The final checkpoint of the run, with the counts and the errors summary.
+        """
+        checkpoint = self._start(resume)
+        if checkpoint.completed:
+            return checkpoint
+        with open(path, 'rb') as records_file:
+            records_file.seek(checkpoint.position)
+            return self._validate_entries(
+                checkpoint,
+                self._read_records(records_file, checkpoint.position),
+                self.factory._collect_json_errors  # pylint: disable=protected-access
+            )
+
+    @staticmethod
+    def _read_records(records_file: typing.BinaryIO, offset: int) -> typing.Generator[tuple[int, int, bytes], None, None]:
+        for line in records_file:
+            next_offset = offset + len(line)
+            if line.strip():
+                yield offset, next_offset, line
+            offset = next_offset
+
+    def _start(self, resume: bool) -> ValidationCheckpoint:
+        if resume and (checkpoint := self.load_checkpoint()) is not None:
+            self._logger.info(f'{self.factory.name}: resuming the validation from position {checkpoint.position} after {checkpoint.total} entries')
+            return checkpoint
+        return ValidationCheckpoint(
+            schema=self.factory.name,
+            fingerprint=self.factory.fingerprint
+        )
+
+    def _validate_entries(
+        self,
+        checkpoint: ValidationCheckpoint,
+        entries: typing.Iterable[tuple[int, int, typing.Any]],
+        collect_errors: typing.Callable[[typing.Any], list[FieldValidationErrorInfo]]
+    ) -> ValidationCheckpoint:
+        error_counts = checkpoint.error_counts
+        entries_since_checkpoint = 0
+        try:
+            for position, next_position, entry in entries:
+                if collected_errors := collect_errors(entry):
+                    checkpoint.invalid_count += 1
+                    for error in collected_errors:
+                        error_counts[error.name] = error_counts.get(error.name, 0) + 1
+                    if len(checkpoint.failures) < self.max_failures:
+                        checkpoint.failures.append({
+                            'position': position,
+                            'errors': [f'{error.name}: {error.message}' for error in collected_errors]
+                        })
+                checkpoint.total += 1
+                checkpoint.position = next_position
+                entries_since_checkpoint += 1
+                if entries_since_checkpoint == self.checkpoint_every:
+                    self._write_checkpoint(checkpoint)
+                    entries_since_checkpoint = 0
+            checkpoint.completed = True
+        finally:
+            # The checkpoint is always consistent with the validated entries, so it is written on errors as well
+            self._write_checkpoint(checkpoint)
+        return checkpoint
+
+    def _write_checkpoint(self, checkpoint: ValidationCheckpoint) -> None:
+        # Written to a temporary file first, so that a run killed while writing never leaves a partial checkpoint
+        checkpoint_directory = os.path.dirname(os.path.abspath(self.checkpoint_path))
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=checkpoint_directory, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'w', encoding='utf-8') as checkpoint_file:
+            json.dump(dataclasses.asdict(checkpoint), checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temporary_path, self.checkpoint_path)
+        self._logger.debug(f'{self.factory.name}: checkpoint after {checkpoint.total} entries written to {self.checkpoint_path}')
@@ -0,0 +1,78 @@
+import logging
+import os
+from typing import Any, BinaryIO, Callable, ClassVar, Generator, Iterable
+
+from phaistos.exceptions import FieldValidationErrorInfo
+from phaistos.schema import SchemaInstancesFactory
+from phaistos.typings import ValidationCheckpoint
+
+
+class CheckpointedValidation:
+    """
+    A validation run of a (possibly very long) input against the schema of a factory, resumable from its checkpoints.
+
+    Attributes:
+        factory (SchemaInstancesFactory): The factory of the schema, which has to know its source manifest.
+        checkpoint_path (str): The path of the checkpoint file.
+        checkpoint_every (int): The number of entries validated between the checkpoints.
+        max_failures (int): The maximum number of invalid entries recorded with their errors in the checkpoint.
+    """
+    factory: SchemaInstancesFactory
+    checkpoint_path: str
+    checkpoint_every: int
+    max_failures: int
+    _logger: ClassVar[logging.Logger]
+
+    def __init__(
+        self,
+        *,
+        factory: SchemaInstancesFactory,
+        checkpoint_path: str | os.PathLike,
+        checkpoint_every: int = ...,
+        max_failures: int = ...
+    ) -> None: ...
+    def __post_init__(self) -> None: ...
+    def load_checkpoint(self) -> ValidationCheckpoint | None:
+        """
+        Load the last checkpoint of the run, verifying that it was written for the current version of the schema.
+
+        Returns:
+            ValidationCheckpoint | None: The last checkpoint, or None if the run has not been started yet.
+
+        Raises:
+            CheckpointMismatchException: If the checkpoint was written for another schema or another version of it.
+        """
+    def run(self, payloads: Iterable[dict], resume: bool = ...) -> ValidationCheckpoint:
+        """
+        Validate the data entries, resuming from the last checkpoint. The entries consumed before
+        the checkpoint are skipped, so the iterable has to yield the same entries in the same order on each run.
+
+        Args:
+            payloads (typing.Iterable[dict]): The data entries to validate.
+            resume (bool): Whether to resume from the last checkpoint (if not, the run starts over).
+
+        Returns:
+            ValidationCheckpoint: The final checkpoint of the run, with the counts and the errors summary.
+        """
+    def run_file(self, path: str | os.PathLike, resume: bool = ...) -> ValidationCheckpoint:
+        """
+        Validate the records of a newline-delimited JSON (JSONL/NDJSON) file, resuming from the byte offset
+        of the last checkpoint (without reading the file up to it). Blank lines are skipped.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+            resume (bool): Whether to resume from the last checkpoint (if not, the run starts over).
+
+        Returns:
+            ValidationCheckpoint: The final checkpoint of the run, with the counts and the errors summary.
+        """
+    @staticmethod
+    def _read_records(records_file: BinaryIO, offset: int) -> Generator[tuple[int, int, bytes], None, None]: ...
+    def _start(self, resume: bool) -> ValidationCheckpoint: ...
+    def _validate_entries(
+        self,
+        checkpoint: ValidationCheckpoint,
+        entries: Iterable[tuple[int, int, Any]],
+        collect_errors: Callable[[Any], list[FieldValidationErrorInfo]]
+    ) -> ValidationCheckpoint: ...
+    def _write_checkpoint(self, checkpoint: ValidationCheckpoint) -> None: ...
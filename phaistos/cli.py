@@ -0,0 +1,59 @@
+"""
+    The command line interface of Phaistos.
+
+    Commands:
+    - compile: Transpile the schemas found under a path and generate a package of Python modules
+      with the models of all their versions, to be imported by the manager (see the compiled_package argument of Manager.start).
+"""
+from __future__ import annotations
+import argparse
+import sys
+
+from phaistos.codegen import CodeGenerator
+from phaistos.manager import Manager
+
+
+def compile_schemas(schemas_path: str, package_path: str) -> dict[str, dict[str, str]]:
+    """
+    Transpile the schemas found under a path and generate a package of Python modules with their models,
+    one module for each version of each schema.
+
+    Args:
+        schemas_path (str): The path to the schemas.
+        package_path (str): The directory of the generated package.
+
+    Returns:
+        dict[str, dict[str, str]]: The names of the generated modules, by the names and versions of their schemas.
+    """
+    manager = Manager.start(discover=False, schemas_path=schemas_path)
+    return CodeGenerator.write_package(
+        [
+            manager.get_factory(schema_name, version)
+            for schema_name in Manager.get_available_schemas()
+            for version in manager.get_versions(schema_name)
+        ],
+        package_path
+    )
+
+
+def main(arguments: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='phaistos', description='Phaistos schemas tooling')
+    commands = parser.add_subparsers(dest='command', required=True)
+    compile_parser = commands.add_parser(
+        'compile',
+        help='Generate a package of Python modules with the models of the schemas'
+    )
+    compile_parser.add_argument('schemas_path', help='The path to the schemas')
+    compile_parser.add_argument('package_path', help='The directory of the generated package')
+    parsed_arguments = parser.parse_args(arguments)
+
+    if parsed_arguments.command == 'compile':
+        module_names = compile_schemas(parsed_arguments.schemas_path, parsed_arguments.package_path)
+        for schema_name, schema_modules in module_names.items():
+            for version, module_name in schema_modules.items():
+                print(f'{schema_name} {version}: {module_name}' if version else f'{schema_name}: {module_name}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
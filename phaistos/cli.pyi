@@ -0,0 +1,13 @@
+def compile_schemas(schemas_path: str, package_path: str) -> dict[str, dict[str, str]]:
+    """
+    Transpile the schemas found under a path and generate a package of Python modules with their models,
+    one module for each version of each schema.
+
+    Args:
+        schemas_path (str): The path to the schemas.
+        package_path (str): The directory of the generated package.
+
+    Returns:
+        dict[str, dict[str, str]]: The names of the generated modules, by the names and versions of their schemas.
+    """
+def main(arguments: list[str] | None = ...) -> int: ...
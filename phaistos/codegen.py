@@ -0,0 +1,498 @@
+"""
+    Ahead-of-time code generation.
+
+    The transpiled schemas are written out as a package of plain Python modules, one per schema version,
+    defining the same models with class statements and the validator functions rendered by the compiler
+    as module-level functions. Importing such a package (see the compiled_package argument of Manager.start)
+    skips parsing the manifests and compiling the validators, and its modules are cached as bytecode
+    like any other Python modules.
+"""
+from __future__ import annotations
+import builtins
+import dataclasses
+import datetime
+import decimal
+import functools
+import importlib
+import keyword
+import logging
+import math
+import os
+import re
+import sys
+import types
+import typing
+
+import pydantic
+import pydantic_core
+
+import phaistos.consts
+import phaistos.utils
+from phaistos.compiler import ValidationFunctionsCompiler
+from phaistos.exceptions import SchemaLoadingException
+from phaistos.schema import SchemaInstancesFactory, TranspiledSchema
+from phaistos.transpiler import Transpiler
+from phaistos.type_expressions import TypeRegistry
+
+# The names used by the generated modules themselves (and the validators), which the models cannot be bound to
+_RESERVED_NAMES = {
+    'typing', 'pydantic', 'pydantic_core', 'annotated_types', 'phaistos', 'datetime', 'decimal',
+    'logger', 'TranspiledSchema', 'ISOLATION_FROM_UNWANTED_LIBRARIES', 'VALIDATION_LOGGER',
+    'SCHEMA', 'SOURCE', 'REFERENCES',
+    *phaistos.consts.BLOCKED_MODULES
+}
+
+
+@dataclasses.dataclass
+class _Namespace:
+    """
+    The names bound in a module being generated: the aliases of its models, the names of their class statements
+    and all the other names, which must not collide with the reserved ones.
+    """
+    reserved_names: set[str]
+    bound_names: set[str] = dataclasses.field(default_factory=set)
+    model_names: dict[type[TranspiledSchema], str] = dataclasses.field(default_factory=dict)
+    statement_names: set[str] = dataclasses.field(default_factory=set)
+
+    def bind(self, name: str) -> str:
+        identifier = re.sub(r'\W', '_', name)
+        if not identifier.isidentifier() or keyword.iskeyword(identifier):
+            identifier = f'_{identifier}'
+        candidate, suffix = identifier, 2
+        while candidate in self.bound_names or candidate in self.reserved_names:
+            candidate, suffix = f'{identifier}_{suffix}', suffix + 1
+        self.bound_names.add(candidate)
+        return candidate
+
+
+@dataclasses.dataclass
+class _GeneratedModule:
+    """
+    The state of a module being generated: its imports, the names bound in it and its definitions.
+    """
+    root: type[TranspiledSchema]
+    referred_schemas: dict[type[TranspiledSchema], str]
+    module_names: dict[str, str]
+    namespace: _Namespace
+    imports: set[str] = dataclasses.field(default_factory=set)
+    reference_imports: list[str] = dataclasses.field(default_factory=list)
+    definitions: list[str] = dataclasses.field(default_factory=list)
+
+
+class CodeGenerator:
+    _logger: typing.ClassVar[logging.Logger] = phaistos.consts.TRANSPILATION_LOGGER
+
+    @classmethod
+    def write_package(cls, factories: typing.Iterable[SchemaInstancesFactory], package_path: str) -> dict[str, dict[str, str]]:
+        """
+        Generate a package of Python modules defining the models of the given schemas, one module per schema version.
+
+        Args:
+            factories (typing.Iterable[SchemaInstancesFactory]): The factories of all versions of the schemas,
+                which have to know their source manifests.
+            package_path (str): The directory of the package, created if it does not exist.
+
+        Returns:
+            dict[str, dict[str, str]]: The names of the generated modules, by the names and versions of their schemas.
+
+        Raises:
+            SchemaLoadingException: If a schema has no source manifest or a part of it cannot be expressed as Python code.
+        """
+        factories_by_version: dict[str, dict[str, SchemaInstancesFactory]] = {}
+        for factory in factories:
+            version = str(factory.source.get('version', '')) if factory.source is not None else ''
+            factories_by_version.setdefault(factory.name, {})[version] = factory
+        latest_versions = {
+            schema_name: max(schema_factories, key=phaistos.utils.version_sort_key)
+            for schema_name, schema_factories in factories_by_version.items()
+        }
+        # The latest versions keep the plain module names, as the references to the other schemas are resolved to them
+        module_names = cls.make_module_names([*factories_by_version])
+        version_module_names = cls._make_version_module_names(module_names, factories_by_version, latest_versions)
+        referred_schemas = {
+            factories_by_version[schema_name][version]._model: schema_name  # pylint: disable=protected-access
+            for schema_name, version in latest_versions.items()
+        }
+        os.makedirs(package_path, exist_ok=True)
+        for schema_name, schema_factories in factories_by_version.items():
+            for version, factory in schema_factories.items():
+                cls._logger.info(f'Generating module of schema: {schema_name} {version}'.rstrip())
+                module_path = os.path.join(package_path, f'{version_module_names[schema_name][version]}.py')
+                with open(module_path, 'w', encoding='utf-8') as module_file:
+                    module_file.write(cls.generate_module(factory, module_names, referred_schemas))
+        with open(os.path.join(package_path, '__init__.py'), 'w', encoding='utf-8') as package_file:
+            package_file.write(cls.generate_package_index(module_names, version_module_names))
+        importlib.invalidate_caches()
+        return version_module_names
+
+    @classmethod
+    def _make_version_module_names(
+        cls,
+        module_names: dict[str, str],
+        factories_by_version: dict[str, dict[str, SchemaInstancesFactory]],
+        latest_versions: dict[str, str]
+    ) -> dict[str, dict[str, str]]:
+        version_module_names: dict[str, dict[str, str]] = {}
+        taken_module_names = set(module_names.values())
+        for schema_name, schema_factories in factories_by_version.items():
+            schema_modules = version_module_names[schema_name] = {}
+            for version in schema_factories:
+                if version == latest_versions[schema_name]:
+                    schema_modules[version] = module_names[schema_name]
+                    continue
+                module_key = f'{schema_name}_{version}'
+                schema_modules[version] = cls.make_module_names([module_key], reserved_names=taken_module_names)[module_key]
+                taken_module_names.add(schema_modules[version])
+        return version_module_names
+
+    @staticmethod
+    def make_module_names(schema_names: list[str], reserved_names: typing.Collection[str] = ()) -> dict[str, str]:
+        """
+        Make unique Python module names (in snake case) for the schemas.
+
+        Args:
+            schema_names (list[str]): The names of the schemas.
+            reserved_names (typing.Collection[str]): The module names already taken, which are not given again.
+
+        Returns:
+            dict[str, str]: The module names, by the names of their schemas.
+        """
+        module_names: dict[str, str] = {}
+        for schema_name in schema_names:
+            module_name = re.sub(r'\W', '_', re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '_', schema_name)).lower()
+            if not module_name.isidentifier() or keyword.iskeyword(module_name):
+                module_name = f'schema_{module_name}'
+            candidate, suffix = module_name, 2
+            while candidate in module_names.values() or candidate in reserved_names:
+                candidate, suffix = f'{module_name}_{suffix}', suffix + 1
+            module_names[schema_name] = candidate
+        return module_names
+
+    @staticmethod
+    def generate_package_index(module_names: dict[str, str], version_module_names: dict[str, dict[str, str]]) -> str:
+        """
+        Generate the `__init__` module of a package of generated schemas, listing their modules.
+
+        Args:
+            module_names (dict[str, str]): The names of the modules of the latest versions, by the names of their schemas.
+            version_module_names (dict[str, dict[str, str]]): The names of the modules of all versions,
+                by the names and versions of their schemas.
+
+        Returns:
+            str: The source code of the module.
+        """
+        schema_entries = ''.join(
+            f'    {schema_name!r}: {module_name!r},\n'
+            for schema_name, module_name in module_names.items()
+        )
+        version_entries = ''.join(
+            f'    {schema_name!r}: {schema_modules!r},\n'
+            for schema_name, schema_modules in version_module_names.items()
+        )
+        return (
+            '"""\n'
+            f'    Schemas generated ahead of time by phaistos {phaistos.consts.PHAISTOS_VERSION}. Do not edit, generate them again with:\n'
+            '    phaistos compile <schemas_path> <package_path>\n'
+            '"""\n'
+            f'PHAISTOS_VERSION = {phaistos.consts.PHAISTOS_VERSION!r}\n'
+            f'PYDANTIC_VERSION = {pydantic.VERSION!r}\n'
+            '# The modules of the latest versions of the schemas, by the names of the schemas\n'
+            'SCHEMAS = {\n'
+            f'{schema_entries}'
+            '}\n'
+            '# The modules of all versions of the schemas, by the names and versions of the schemas\n'
+            'VERSIONS = {\n'
+            f'{version_entries}'
+            '}\n'
+        )
+
+    @classmethod
+    def generate_module(
+        cls,
+        factory: SchemaInstancesFactory,
+        module_names: dict[str, str],
+        referred_schemas: dict[type[TranspiledSchema], str]
+    ) -> str:
+        """
+        Generate the source code of a module defining the model of a schema (with its nested models).
+
+        Args:
+            factory (SchemaInstancesFactory): The factory of the schema, which has to know its source manifest.
+            module_names (dict[str, str]): The names of the generated modules, by the names of their schemas.
+            referred_schemas (dict[type[TranspiledSchema], str]): The names of the schemas, by their models,
+                that are imported from their own modules when referred to.
+
+        Returns:
+            str: The source code of the module.
+        """
+        if factory.source is None:
+            raise SchemaLoadingException(
+                f'Schema {factory.name} has no source manifest to be generated from'
+            )
+        reserved_names = set(_RESERVED_NAMES)
+        while True:
+            module = _GeneratedModule(
+                root=factory._model,  # pylint: disable=protected-access
+                referred_schemas=referred_schemas,
+                module_names=module_names,
+                namespace=_Namespace(reserved_names=reserved_names)
+            )
+            root_name = cls._generate_model(module, module.root)
+            source = cls._render_value(module, factory.source)
+            # The models cannot shadow the modules imported for the annotations (known only after generating them)
+            if not (shadowed_names := module.namespace.statement_names & {name.split('.')[0] for name in module.imports}):
+                break
+            reserved_names |= shadowed_names
+
+        referred_names = Transpiler.find_references(factory.source)
+        module_imports = '\n'.join(f'import {name}' for name in sorted(module.imports | {'pydantic', 'pydantic.fields'}))
+        # The nested models report their errors to the top-level one, unlike the imported models of the other schemas
+        model_names = [
+            model_name
+            for model, model_name in module.namespace.model_names.items()
+            if model is module.root or model not in referred_schemas
+        ]
+        return '\n'.join([
+            '"""',
+            f'    The {factory.name} schema, generated ahead of time by phaistos {phaistos.consts.PHAISTOS_VERSION}. Do not edit.',
+            '"""',
+            '# pylint: skip-file',
+            module_imports,
+            '',
+            'from phaistos.consts import ISOLATION_FROM_UNWANTED_LIBRARIES, VALIDATION_LOGGER',
+            'from phaistos.schema import TranspiledSchema',
+            *module.reference_imports,
+            '',
+            '# The validators run in the same isolation as the ones compiled at runtime',
+            'globals().update(ISOLATION_FROM_UNWANTED_LIBRARIES)',
+            'logger = VALIDATION_LOGGER',
+            *module.definitions,
+            '',
+            *[f'{model_name}.parent = {root_name}' for model_name in model_names],
+            '',
+            f'SCHEMA = {root_name}',
+            f'SOURCE = {source}',
+            f'REFERENCES = {referred_names!r}',
+            ''
+        ])
+
+    @classmethod
+    def _generate_model(cls, module: _GeneratedModule, model: type[TranspiledSchema]) -> str:
+        if (model_name := module.namespace.model_names.get(model)) is not None:
+            return model_name
+        if model is not module.root and (referred_name := module.referred_schemas.get(model)) is not None:
+            model_name = module.namespace.model_names[model] = module.namespace.bind(f'_{referred_name}')
+            module.reference_imports.append(
+                f'from .{module.module_names[referred_name]} import SCHEMA as {model_name}'
+            )
+            return model_name
+        if model.__base__ is not TranspiledSchema:
+            return cls._generate_renamed_model(module, model)
+
+        # The nested models are defined before the model using them
+        fields = [
+            cls._render_field(module, model, field_name, field_info)
+            for field_name, field_info in model.model_fields.items()
+        ]
+        model_name, statement_name = cls._bind_model(module, model)
+        transpilation_name = model.transpilation_name
+        # The models have been built when transpiled, so building their validators can be safely left until their first use
+        model_config = 'defer_build=True' if statement_name == transpilation_name else f'defer_build=True, title={transpilation_name!r}'
+        return cls._define_model(module, model, statement_name, 'TranspiledSchema', [
+            f'    model_config = pydantic.ConfigDict({model_config})',
+            f'    transpilation_name = {transpilation_name!r}',
+            f'    context = {cls._render_value(module, model.context)}',
+            *fields,
+            *cls._render_validators(module, model, model_name)
+        ])
+
+    @classmethod
+    def _render_field(cls, module: _GeneratedModule, model: type[TranspiledSchema], field_name: str, field_info: pydantic.fields.FieldInfo) -> str:
+        if not field_name.isidentifier() or keyword.iskeyword(field_name):
+            raise SchemaLoadingException(
+                f'Field {field_name} of {model.transpilation_name} is not a Python identifier, so it cannot be generated ahead of time'
+            )
+        # The attributes the field was created with (without the annotation, which is kept whole in the class annotations)
+        rendered_arguments = ', '.join(
+            f'{argument}={cls._render_value(module, value)}'
+            for argument, value in field_info._attributes_set.items()  # pylint: disable=protected-access
+            if argument != 'annotation'
+        )
+        return (
+            f'    {field_name}: {cls._render_annotation(module, model.__annotations__[field_name])}'
+            f' = pydantic.fields.FieldInfo({rendered_arguments})'
+        )
+
+    @classmethod
+    def _render_validators(cls, module: _GeneratedModule, model: type[TranspiledSchema], model_name: str) -> list[str]:
+        validators = []
+        for attribute_name, decorator in model.__pydantic_decorators__.field_validators.items():
+            function_name = cls._generate_validator(module, decorator.func, f'{model_name}_{attribute_name}')
+            validated_fields = ', '.join(repr(field) for field in decorator.info.fields)
+            validators.append(
+                f'    {attribute_name} = pydantic.field_validator({validated_fields}, mode={decorator.info.mode!r}, '
+                f'check_fields={decorator.info.check_fields!r})({function_name})'
+            )
+        if (global_validator := model.__dict__.get('global_validator')) is not None:
+            function_name = cls._generate_validator(module, global_validator, f'{model_name}_global_validator')
+            validators.append(f'    global_validator = {function_name}')
+        return validators
+
+    @classmethod
+    def _generate_renamed_model(cls, module: _GeneratedModule, model: type[TranspiledSchema]) -> str:
+        # A shared nested model renamed for another property is generated as a subclass of the shared model as well
+        base_name = cls._generate_model(module, model.__mro__[1])
+        _, statement_name = cls._bind_model(module, model)
+        return cls._define_model(module, model, statement_name, base_name, [
+            f'    model_config = pydantic.ConfigDict(defer_build=True, title={model.transpilation_name!r})',
+            f'    transpilation_name = {model.transpilation_name!r}'
+        ])
+
+    @staticmethod
+    def _bind_model(module: _GeneratedModule, model: type[TranspiledSchema]) -> tuple[str, str]:
+        transpilation_name = model.transpilation_name
+        # The models are referred to by private aliases, as they are usually named like the fields annotated with them,
+        # while the class statements bind their own names, which end up in the validation errors and the JSON schemas
+        model_name = module.namespace.model_names[model] = module.namespace.bind(f'_{transpilation_name}')
+        statement_name = transpilation_name
+        if not statement_name.isidentifier() or keyword.iskeyword(statement_name) or statement_name in module.namespace.reserved_names:
+            statement_name = model_name
+        module.namespace.statement_names.add(statement_name)
+        return model_name, statement_name
+
+    @staticmethod
+    def _define_model(module: _GeneratedModule, model: type[TranspiledSchema], statement_name: str, base_name: str, body: list[str]) -> str:
+        model_name = module.namespace.model_names[model]
+        module.definitions.extend([
+            '',
+            '',
+            f'class {statement_name}({base_name}):',
+            *body,
+            '',
+            ''
+        ])
+        if statement_name != model.transpilation_name:
+            module.definitions.append(f'{model_name}.__name__ = {model_name}.__qualname__ = {model.transpilation_name!r}')
+        else:
+            module.definitions.append(f'{model_name} = {statement_name}')
+        return model_name
+
+    @classmethod
+    def _generate_validator(cls, module: _GeneratedModule, validator: typing.Any, function_name: str) -> str:
+        function = getattr(validator, '__func__', validator)
+        if (data := getattr(function, '__phaistos_validator__', None)) is None:
+            raise SchemaLoadingException(
+                f'Validator {function.__name__} was not compiled by phaistos, so it cannot be generated ahead of time'
+            )
+        function_name = module.namespace.bind(function_name)
+        module.definitions.extend([
+            '',
+            '',
+            ValidationFunctionsCompiler.render_validator(data | {'name': function_name}).strip()
+        ])
+        if (cache_size := data.get('cache_size')) is not None:
+            module.imports.add('phaistos.compiler')
+            module.definitions.append(
+                f'{function_name} = phaistos.compiler.ValidationFunctionsCompiler.memoize({function_name}, {cache_size!r})'
+            )
+        return function_name
+
+    @classmethod
+    def _render_annotation(cls, module: _GeneratedModule, annotation: typing.Any) -> str:
+        if annotation is Ellipsis:
+            return '...'
+        if annotation is None or annotation is types.NoneType:
+            return 'None'
+        if isinstance(annotation, type) and issubclass(annotation, TranspiledSchema):
+            return cls._generate_model(module, annotation)
+        if (origin := typing.get_origin(annotation)) is not None:
+            return cls._render_generic_annotation(module, annotation, origin)
+        return cls._render_object_path(module, annotation)
+
+    @classmethod
+    def _render_generic_annotation(cls, module: _GeneratedModule, annotation: typing.Any, origin: typing.Any) -> str:
+        if origin is typing.Annotated:
+            module.imports.add('typing')
+            metadata = ', '.join(cls._render_value(module, item) for item in annotation.__metadata__)
+            return f'typing.Annotated[{cls._render_annotation(module, annotation.__origin__)}, {metadata}]'
+        arguments = ', '.join(cls._render_annotation(module, argument) for argument in typing.get_args(annotation))
+        if origin in {typing.Union, types.UnionType}:
+            module.imports.add('typing')
+            return f'typing.Union[{arguments}]'
+        return f'{cls._render_object_path(module, origin)}[{arguments}]'
+
+    @classmethod
+    def _render_object_path(cls, module: _GeneratedModule, target: typing.Any) -> str:
+        name, qualified_name = getattr(target, '__name__', None), getattr(target, '__qualname__', '')
+        if name is not None and getattr(builtins, name, None) is target:
+            return name
+        module_name = getattr(target, '__module__', None)
+        if module_name and module_name != '__main__' and '<locals>' not in qualified_name:
+            with_module = sys.modules.get(module_name) or importlib.import_module(module_name)
+            try:
+                found = functools.reduce(getattr, qualified_name.split('.'), with_module)
+            except AttributeError:
+                found = None
+            if found is target:
+                module.imports.add(module_name)
+                return f'{module_name}.{qualified_name}'
+        # The types defined in places that cannot be imported are taken from the registry of the importing process
+        for registered_name, registered_type in TypeRegistry._types.items():  # pylint: disable=protected-access
+            if registered_type is target:
+                module.imports.add('phaistos.type_expressions')
+                return f'phaistos.type_expressions.TypeRegistry.resolve({registered_name!r})'
+        raise SchemaLoadingException(
+            f'{target!r} cannot be imported, so it cannot be generated ahead of time'
+        )
+
+    @classmethod
+    def _render_value(cls, module: _GeneratedModule, value: typing.Any) -> str:
+        if value is Ellipsis:
+            return '...'
+        if value is None or isinstance(value, (bool, int, str, bytes)):
+            return repr(value)
+        if isinstance(value, float):
+            return repr(value) if math.isfinite(value) else f'float({str(value)!r})'
+        if value is pydantic_core.PydanticUndefined:
+            module.imports.add('pydantic_core')
+            return 'pydantic_core.PydanticUndefined'
+        if isinstance(value, (list, tuple, set, frozenset, dict)):
+            return cls._render_collection(module, value)
+        return cls._render_object(module, value)
+
+    @classmethod
+    def _render_collection(cls, module: _GeneratedModule, value: list | tuple | set | frozenset | dict) -> str:
+        if isinstance(value, list):
+            return f'[{", ".join(cls._render_value(module, item) for item in value)}]'
+        if isinstance(value, tuple):
+            return f'({"".join(f"{cls._render_value(module, item)}, " for item in value)})'
+        if isinstance(value, (set, frozenset)):
+            items = ', '.join(cls._render_value(module, item) for item in value)
+            return f'{type(value).__name__}([{items}])'
+        return '{' + ', '.join(
+            f'{cls._render_value(module, key)}: {cls._render_value(module, item)}'
+            for key, item in value.items()
+        ) + '}'
+
+    @classmethod
+    def _render_object(cls, module: _GeneratedModule, value: typing.Any) -> str:
+        if isinstance(value, (datetime.date, datetime.time, datetime.timedelta, datetime.timezone)):
+            module.imports.add('datetime')
+            return repr(value)
+        if isinstance(value, decimal.Decimal):
+            module.imports.add('decimal')
+            return f'decimal.Decimal({str(value)!r})'
+        if isinstance(value, type) or typing.get_origin(value) is not None:
+            return cls._render_annotation(module, value)
+        if dataclasses.is_dataclass(value):
+            arguments = ', '.join(
+                f'{field.name}={cls._render_value(module, getattr(value, field.name))}'
+                for field in dataclasses.fields(value)
+                if field.init
+            )
+            return f'{cls._render_object_path(module, type(value))}({arguments})'
+        if callable(value):
+            return cls._render_object_path(module, value)
+        raise SchemaLoadingException(
+            f'{value!r} cannot be expressed as Python code, so it cannot be generated ahead of time'
+        )
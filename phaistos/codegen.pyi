@@ -0,0 +1,136 @@
+import dataclasses
+import logging
+import typing
+from typing import ClassVar
+
+import pydantic.fields
+
+from phaistos.schema import SchemaInstancesFactory, TranspiledSchema
+
+_RESERVED_NAMES: set[str]
+
+
+@dataclasses.dataclass
+class _Namespace:
+    """
+    The names bound in a module being generated: the aliases of its models, the names of their class statements
+    and all the other names, which must not collide with the reserved ones.
+    """
+    reserved_names: set[str]
+    bound_names: set[str]
+    model_names: dict[type[TranspiledSchema], str]
+    statement_names: set[str]
+
+    def bind(self, name: str) -> str: ...
+
+
+@dataclasses.dataclass
+class _GeneratedModule:
+    """
+    The state of a module being generated: its imports, the names bound in it and its definitions.
+    """
+    root: type[TranspiledSchema]
+    referred_schemas: dict[type[TranspiledSchema], str]
+    module_names: dict[str, str]
+    namespace: _Namespace
+    imports: set[str]
+    reference_imports: list[str]
+    definitions: list[str]
+
+
+class CodeGenerator:
+    _logger: ClassVar[logging.Logger]
+
+    @classmethod
+    def write_package(cls, factories: typing.Iterable[SchemaInstancesFactory], package_path: str) -> dict[str, dict[str, str]]:
+        """
+        Generate a package of Python modules defining the models of the given schemas, one module per schema version.
+
+        Args:
+            factories (typing.Iterable[SchemaInstancesFactory]): The factories of all versions of the schemas,
+                which have to know their source manifests.
+            package_path (str): The directory of the package, created if it does not exist.
+
+        Returns:
+            dict[str, dict[str, str]]: The names of the generated modules, by the names and versions of their schemas.
+
+        Raises:
+            SchemaLoadingException: If a schema has no source manifest or a part of it cannot be expressed as Python code.
+        """
+    @classmethod
+    def _make_version_module_names(
+        cls,
+        module_names: dict[str, str],
+        factories_by_version: dict[str, dict[str, SchemaInstancesFactory]],
+        latest_versions: dict[str, str]
+    ) -> dict[str, dict[str, str]]: ...
+    @staticmethod
+    def make_module_names(schema_names: list[str], reserved_names: typing.Collection[str] = ...) -> dict[str, str]:
+        """
+        Make unique Python module names (in snake case) for the schemas.
+
+        Args:
+            schema_names (list[str]): The names of the schemas.
+            reserved_names (typing.Collection[str]): The module names already taken, which are not given again.
+
+        Returns:
+            dict[str, str]: The module names, by the names of their schemas.
+        """
+    @staticmethod
+    def generate_package_index(module_names: dict[str, str], version_module_names: dict[str, dict[str, str]]) -> str:
+        """
+        Generate the `__init__` module of a package of generated schemas, listing their modules.
+
+        Args:
+            module_names (dict[str, str]): The names of the modules of the latest versions, by the names of their schemas.
+            version_module_names (dict[str, dict[str, str]]): The names of the modules of all versions,
+                by the names and versions of their schemas.
+
+        Returns:
+            str: The source code of the module.
+        """
+    @classmethod
+    def generate_module(
+        cls,
+        factory: SchemaInstancesFactory,
+        module_names: dict[str, str],
+        referred_schemas: dict[type[TranspiledSchema], str]
+    ) -> str:
+        """
+        Generate the source code of a module defining the model of a schema (with its nested models).
+
+        Args:
+            factory (SchemaInstancesFactory): The factory of the schema, which has to know its source manifest.
+            module_names (dict[str, str]): The names of the generated modules, by the names of their schemas.
+            referred_schemas (dict[type[TranspiledSchema], str]): The names of the schemas, by their models,
+                that are imported from their own modules when referred to.
+
+        Returns:
+            str: The source code of the module.
+        """
+    @classmethod
+    def _generate_model(cls, module: _GeneratedModule, model: type[TranspiledSchema]) -> str: ...
+    @classmethod
+    def _render_field(cls, module: _GeneratedModule, model: type[TranspiledSchema], field_name: str, field_info: pydantic.fields.FieldInfo) -> str: ...
+    @classmethod
+    def _render_validators(cls, module: _GeneratedModule, model: type[TranspiledSchema], model_name: str) -> list[str]: ...
+    @classmethod
+    def _generate_renamed_model(cls, module: _GeneratedModule, model: type[TranspiledSchema]) -> str: ...
+    @staticmethod
+    def _bind_model(module: _GeneratedModule, model: type[TranspiledSchema]) -> tuple[str, str]: ...
+    @staticmethod
+    def _define_model(module: _GeneratedModule, model: type[TranspiledSchema], statement_name: str, base_name: str, body: list[str]) -> str: ...
+    @classmethod
+    def _generate_validator(cls, module: _GeneratedModule, validator: typing.Any, function_name: str) -> str: ...
+    @classmethod
+    def _render_annotation(cls, module: _GeneratedModule, annotation: typing.Any) -> str: ...
+    @classmethod
+    def _render_generic_annotation(cls, module: _GeneratedModule, annotation: typing.Any, origin: typing.Any) -> str: ...
+    @classmethod
+    def _render_object_path(cls, module: _GeneratedModule, target: typing.Any) -> str: ...
+    @classmethod
+    def _render_value(cls, module: _GeneratedModule, value: typing.Any) -> str: ...
+    @classmethod
+    def _render_collection(cls, module: _GeneratedModule, value: list | tuple | set | frozenset | dict) -> str: ...
+    @classmethod
+    def _render_object(cls, module: _GeneratedModule, value: typing.Any) -> str: ...
@@ -1,11 +1,21 @@
+import collections
+import contextlib
+import contextvars
+import copy
+import functools
+import hashlib
+import keyword
 import logging
+import threading
 import types
 import typing
+import weakref
 
 import pydantic
 
 import phaistos.consts
 import phaistos.sources
+from phaistos.type_expressions import TypeExpressionParser
 from phaistos.typings import (
     ParsedProperty,
     CompiledValidator,
@@ -14,52 +24,241 @@ from phaistos.typings import (
 import phaistos.utils
 
 
+CallingConvention = typing.Literal['bound', 'legacy']
+
+# Marks the memoized outcomes of the validators which returned the validated value itself
+_SAME_VALUE = object()
+# The types of the memoized results which can be shared by the calls as they are
+_IMMUTABLE_TYPES = frozenset({str, bytes, int, float, bool, type(None)})
+
+
+class _MemoizedCall:
+    """
+    A call of a memoized validator, equal to the other calls with the same (hashable projections of)
+    the value and the validation context, carrying the arguments of the call until it is evaluated.
+    """
+    __slots__ = ('key', 'key_hash', 'owner', 'value', 'info')
+
+    def __init__(self, owner: typing.Any, value: typing.Any, info: typing.Any) -> None:
+        self.key = (_hashable(value), _hashable(context) if (context := getattr(info, 'context', None)) else None)
+        self.key_hash = hash(self.key)
+        self.owner = owner
+        self.value = value
+        self.info = info
+
+    def __hash__(self) -> int:
+        return self.key_hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _MemoizedCall) and self.key == other.key
+
+
+def _hashable(value: typing.Any) -> typing.Any:
+    # The type is a part of the projection, as e.g. 1, 1.0 and True are equal, but can be validated differently
+    value_type = type(value)
+    if value_type is list or value_type is tuple:
+        return value_type, tuple(_hashable(item) for item in value)
+    if value_type is dict:
+        return value_type, tuple((_hashable(key), _hashable(item)) for key, item in value.items())
+    if value_type is set or value_type is frozenset:
+        return value_type, frozenset(_hashable(item) for item in value)
+    hash(value)
+    return value_type, value
+
+
+def _is_immutable(value: typing.Any) -> bool:
+    value_type = type(value)
+    if value_type is tuple or value_type is frozenset:
+        return all(_is_immutable(item) for item in value)
+    return value_type in _IMMUTABLE_TYPES
+
+
 class ValidationFunctionsCompiler:
     _logger: typing.ClassVar[logging.Logger] = phaistos.consts.COMPILATION_LOGGER
+    # The bound convention exposes the logger and the validated values without touching the module globals on each call,
+    # the legacy one renders the original templates, which copy them into the globals of the validator module
+    calling_convention: typing.ClassVar[CallingConvention] = 'bound'
+    # Code objects of the rendered validator sources, keyed by the hash of the source (the least recently used first)
+    _code_cache: typing.ClassVar[collections.OrderedDict[str, types.CodeType]] = collections.OrderedDict()
+    _code_cache_lock: typing.ClassVar[threading.Lock] = threading.Lock()
+    _recorded_code: typing.ClassVar[
+        contextvars.ContextVar[dict[str, types.CodeType] | None]
+    ] = contextvars.ContextVar('phaistos_recorded_code', default=None)
+    # Validator functions by their code objects, shared by all schemas (and their versions) with the same validators,
+    # for as long as any of them uses them
+    _shared_functions: typing.ClassVar[
+        weakref.WeakValueDictionary[types.CodeType, types.FunctionType]
+    ] = weakref.WeakValueDictionary()
+
+    @classmethod
+    def preload(cls, code_objects: dict[str, types.CodeType]) -> None:
+        """
+        Make already compiled validator code objects (e.g. read from the transpilation cache)
+        available to the compiler, so that their sources are not compiled again.
+
+        Args:
+            code_objects (dict[str, types.CodeType]): Code objects keyed by the hash of their rendered source.
+        """
+        for source_hash, code in code_objects.items():
+            cls._cache_code(source_hash, code)
+
+    @classmethod
+    @contextlib.contextmanager
+    def recording(cls) -> typing.Generator[dict[str, types.CodeType], None, None]:
+        """
+        Record the code objects of all validators compiled within the block.
+
+        Yields:
+            dict[str, types.CodeType]: The recorded code objects, keyed by the hash of their rendered source.
+        """
+        recorded_code: dict[str, types.CodeType] = {}
+        token = cls._recorded_code.set(recorded_code)
+        try:
+            yield recorded_code
+        finally:
+            cls._recorded_code.reset(token)
+
+    @classmethod
+    def set_calling_convention(cls, calling_convention: CallingConvention) -> None:
+        """
+        Select the way the compiled validators get the logger and the validated values.
+        Affects only the validators compiled afterwards.
+
+        Args:
+            calling_convention (CallingConvention): Either 'bound' (the default), where the logger is bound once,
+                when the function is created, and the values are the function locals, or 'legacy', where both
+                are copied into the globals of the validator module on each call.
+
+        Raises:
+            ValueError: If the calling convention is not known.
+        """
+        if calling_convention not in typing.get_args(CallingConvention):
+            raise ValueError(f'Unknown calling convention: {calling_convention}')
+        cls.calling_convention = calling_convention
 
     @classmethod
     def compile(cls, prop: ParsedProperty) -> CompiledValidator:
-        if isinstance(prop['data']['validator'], str):
-            prop['data']['validator'] = RawValidator({
-                'source': prop['data']['validator'],
-                'mode': 'after' if 'type' in prop['data'] else 'before'
-            })
+        # The parsed manifest is never modified, the validator is normalized into a new record instead
+        raw_validator = prop['data']['validator']
+        default_mode: typing.Literal['before', 'after'] = 'after' if 'type' in prop['data'] else 'before'
+        validator = RawValidator(
+            source=raw_validator,
+            mode=default_mode
+        ) if isinstance(raw_validator, str) else RawValidator(
+            source=raw_validator['source'],
+            mode=raw_validator.get('mode', default_mode),
+            pure=raw_validator.get('pure', True),
+            cache=raw_validator.get('cache', 'cache_size' in raw_validator),
+            cache_size=raw_validator.get('cache_size', phaistos.consts.DEFAULT_VALIDATOR_CACHE_SIZE)
+        )
         phaistos.utils.check_for_forbidden_imports(
-            source=prop['data']['validator']['source']
+            source=validator['source']
         )
-        return cls._compile_for_model(prop) \
+        return cls._compile_for_model(prop, validator) \
             if 'type' not in prop['data'] \
-            else cls._compile_for_field(prop)
+            else cls._compile_for_field(prop, validator)
 
     @classmethod
-    def _compile_for_field(cls, prop: ParsedProperty) -> CompiledValidator:
+    def _compile_for_field(cls, prop: ParsedProperty, validator: RawValidator) -> CompiledValidator:
         cls._logger.info(f'Compiling field validator for {prop["name"]}')
         validator_key = phaistos.sources.FIELD_VALIDATOR_FUNCTION_NAME_TEMPLATE % prop['name']
-        validator_function = cls._compile_validator({
+        annotation = TypeExpressionParser.parse(str(prop['data']['type']))
+        # The values validated against the annotation are not checked again for the constraints it already carries
+        validates_annotation = validator['mode'] == 'after'
+        # Only the values validated against the annotation are known to be collections
+        checks_items = validates_annotation and TypeExpressionParser.has_non_empty_items(annotation)
+        validator_function: typing.Any = cls._compile_validator({
             'name': validator_key,
-            'source': prop['data']['validator']['source'],
+            'source': validator['source'],
             'kind': 'field',
             'decorator': '@classmethod',
-            'extra_arguments': ''
+            'extra_arguments': '',
+            'fields': [prop['name']],
+            'optional': TypeExpressionParser.allows_none(annotation),
+            'non_empty': not validates_annotation or not TypeExpressionParser.checks_non_empty(annotation),
+            'items': checks_items and not TypeExpressionParser.checks_non_empty_items(annotation)
         })
+        if validator.get('cache'):
+            if not validator.get('pure', True) or 'info.data' in validator['source']:
+                cls._logger.warning(f'Validator of {prop["name"]} is not memoized, as it is impure or depends on the other fields')
+            else:
+                validator_function = cls.memoize(validator_function, validator['cache_size'])
         return CompiledValidator(
             field=prop['name'],
             name=validator_key,
             method=pydantic.field_validator(
                 prop['name'],
-                mode=prop['data']['validator']['mode'],
+                mode=validator['mode'],
                 check_fields=True,
             )(validator_function)
         )
 
     @classmethod
-    def _compile_for_model(cls, prop: ParsedProperty) -> CompiledValidator:
+    def memoize(cls, validator_function: typing.Any, cache_size: int) -> classmethod:
+        """
+        Wrap a field validator, which has to be a pure function of the validated value (and the validation context),
+        in a bounded memo, keyed by the value or by its hashable projection (for lists, tuples, dictionaries and sets).
+        Both the returned values and the validation errors raised (as ValueError or AssertionError) are memoized,
+        while the validators of the values with no hashable projection are always called. The memoized results
+        of mutable types are deep-copied for each call, so that changing the validated data never changes them.
+        The statistics of the memo are available via the `cache_info` method of the wrapped function.
+
+        Args:
+            validator_function (typing.Any): The compiled field validator (a class method).
+            cache_size (int): The maximum number of memoized outcomes, the least recently used of which are evicted first.
+
+        Returns:
+            classmethod: The memoized field validator.
+        """
+        if cache_size < 1:
+            raise ValueError('Validator cache size must be a positive integer')
+        function = getattr(validator_function, '__func__', validator_function)
+
+        @functools.lru_cache(maxsize=cache_size)
+        def memoized_outcome(call: _MemoizedCall) -> tuple[bool, typing.Any]:
+            try:
+                result = function(call.owner, call.value, call.info)
+            except (ValueError, AssertionError) as validation_error:
+                return False, validation_error
+            else:
+                return True, _SAME_VALUE if result is call.value else result
+            finally:
+                # The memoized call is kept as the key, without the validated data
+                call.owner = call.value = call.info = None
+
+        def memoized_validator(owner: typing.Any, value: typing.Any, info: typing.Any) -> typing.Any:
+            try:
+                call = _MemoizedCall(owner, value, info)
+            except TypeError:
+                return function(owner, value, info)
+            succeeded, outcome = memoized_outcome(call)
+            if not succeeded:
+                raise outcome.with_traceback(None)
+            if outcome is _SAME_VALUE:
+                return value
+            # The mutable results are copied, so that the validated data never shares (and changes) the memoized ones
+            return outcome if _is_immutable(outcome) else copy.deepcopy(outcome)
+
+        functools.update_wrapper(memoized_validator, function)
+        memoized_validator.cache_info = memoized_outcome.cache_info  # type: ignore
+        memoized_validator.cache_clear = memoized_outcome.cache_clear  # type: ignore
+        memoized_validator.__phaistos_validator__ = {  # type: ignore
+            **getattr(function, '__phaistos_validator__', {}),
+            'cache_size': cache_size
+        }
+        return classmethod(memoized_validator)
+
+    @classmethod
+    def _compile_for_model(cls, prop: ParsedProperty, validator: RawValidator) -> CompiledValidator:
         cls._logger.info(f'Compiling {prop['name']} model validator')
+        if validator.get('cache'):
+            cls._logger.warning(f'Validator of {prop["name"]} is not memoized, as only the field validators can be')
         validator_function = cls._compile_validator({
             'name': phaistos.sources.MODEL_VALIDATOR_FUNCTION_NAME,
-            'source': prop['data']['validator']['source'],
+            'source': validator['source'],
             'kind': 'model',
-            'decorator': '@classmethod' if prop['data']['validator']['mode'] == 'before' else '',
+            'decorator': '@classmethod' if validator['mode'] == 'before' else '',
+            'fields': list(prop['data'].get('properties', {}))
         })
         return CompiledValidator(
             field=prop['name'],
@@ -67,22 +266,92 @@ class ValidationFunctionsCompiler:
             method=validator_function
         )
 
-    @staticmethod
-    def _compile_validator(data: dict[str, str]) -> types.FunctionType:
-        template = phaistos.sources.FIELD_VALIDATOR_FUNCTION_SOURCE_TEMPLATE if data['kind'] == 'field' else phaistos.sources.MODEL_VALIDATOR_FUNCTION_SOURCE_TEMPLATE
-        rendered_function_source_code = template % {
+    @classmethod
+    def _compile_source(cls, source: str) -> types.CodeType:
+        source_hash = hashlib.sha256(source.encode()).hexdigest()
+        with cls._code_cache_lock:
+            if (code := cls._code_cache.get(source_hash)) is not None:
+                cls._code_cache.move_to_end(source_hash)
+        if code is None:
+            code = compile(source, '<phaistos validator>', 'exec')
+            cls._cache_code(source_hash, code)
+        if (recorded_code := cls._recorded_code.get()) is not None:
+            recorded_code[source_hash] = code
+        return code
+
+    @classmethod
+    def _cache_code(cls, source_hash: str, code: types.CodeType) -> None:
+        with cls._code_cache_lock:
+            cls._code_cache[source_hash] = code
+            cls._code_cache.move_to_end(source_hash)
+            while len(cls._code_cache) > phaistos.consts.VALIDATOR_CODE_CACHE_SIZE:
+                cls._code_cache.popitem(last=False)
+
+    @classmethod
+    def render_validator(cls, data: dict[str, typing.Any]) -> str:
+        """
+        Render the source code of a validator function module, in the current calling convention.
+
+        Args:
+            data (dict[str, typing.Any]): The name, source, kind ('field' or 'model'), decorator, extra arguments
+                and the names of the validated fields of the validator, optionally with the calling convention to render it in
+                and, for the field validators, whether None is accepted as it is and whether the value and its items are checked to be non-empty.
+
+        Returns:
+            str: The source code defining the validator function.
+        """
+        first_argument = 'cls' if data.get('decorator') == '@classmethod' else 'self'
+        calling_convention = data.get('calling_convention', cls.calling_convention)
+        if calling_convention == 'legacy':
+            template = phaistos.sources.FIELD_VALIDATOR_FUNCTION_SOURCE_TEMPLATE if data['kind'] == 'field' else phaistos.sources.MODEL_VALIDATOR_FUNCTION_SOURCE_TEMPLATE
+            bindings = ''
+        else:
+            template = phaistos.sources.BOUND_FIELD_VALIDATOR_FUNCTION_SOURCE_TEMPLATE if data['kind'] == 'field' else phaistos.sources.BOUND_MODEL_VALIDATOR_FUNCTION_SOURCE_TEMPLATE
+            binding_template = phaistos.sources.FIELD_VALUE_BINDING_TEMPLATE if data['kind'] == 'field' else phaistos.sources.MODEL_VALUE_BINDING_TEMPLATE
+            bindings = ''.join(
+                binding_template % {'field': field}
+                for field in data.get('fields', [])
+                if cls._is_bindable(field, first_argument)
+            )
+        return template % {
             'decorator': data.get('decorator', ''),
             'name': data['name'],
-            'first_argument': 'cls' if data.get('decorator') == '@classmethod' else 'self',
+            'first_argument': first_argument,
             'extra_arguments': data.get('extra_arguments', ''),
+            'bindings': bindings,
+            'checks': ''.join([
+                phaistos.sources.OPTIONAL_VALUE_CHECK_TEMPLATE if data.get('optional') else '',
+                phaistos.sources.NON_EMPTY_VALUE_CHECK_TEMPLATE if data.get('non_empty', True) else '',
+                phaistos.sources.NON_EMPTY_ITEMS_CHECK_TEMPLATE if data.get('items') else ''
+            ]),
             'source': data['source'].replace('\n', '\n  ')
         }
-        temporary_module = types.ModuleType('temporary_module')
-        temporary_module.__dict__.update(
-            phaistos.consts.ISOLATION_FROM_UNWANTED_LIBRARIES
-        )
-        exec(  # pylint: disable=exec-used
-            rendered_function_source_code,
-            temporary_module.__dict__,
-        )
-        return getattr(temporary_module, data['name'])
+
+    @classmethod
+    def _compile_validator(cls, data: dict[str, typing.Any]) -> types.FunctionType:
+        code = cls._compile_source(cls.render_validator(data))
+        # The legacy validators write into the globals of their modules on each call, so they are never shared
+        if cls.calling_convention != 'bound' or (validator_function := cls._shared_functions.get(code)) is None:
+            temporary_module = types.ModuleType('temporary_module')
+            temporary_module.__dict__.update(
+                phaistos.consts.ISOLATION_FROM_UNWANTED_LIBRARIES
+            )
+            if cls.calling_convention == 'bound':
+                temporary_module.__dict__['logger'] = phaistos.consts.VALIDATION_LOGGER
+            exec(code, temporary_module.__dict__)  # pylint: disable=exec-used
+            defined_function = getattr(temporary_module, data['name'])
+            validator_function = getattr(defined_function, '__func__', defined_function)
+            # The rendering data is kept with the function, so that it can be rendered again (e.g. into a generated module)
+            validator_function.__phaistos_validator__ = data | {
+                'calling_convention': cls.calling_convention
+            }
+            if cls.calling_convention == 'bound':
+                cls._shared_functions[code] = validator_function
+        return classmethod(validator_function) if data.get('decorator') == '@classmethod' else validator_function  # type: ignore
+
+    @staticmethod
+    def _is_bindable(field: str, first_argument: str) -> bool:
+        # Fields named like the arguments (or the logger) would shadow them, so they are not exposed as locals
+        return field.isidentifier() \
+            and not keyword.iskeyword(field) \
+            and field not in {first_argument, 'value', 'info', 'logger', 'typing'}
@@ -1,17 +1,118 @@
+import collections
+import contextvars
 import logging
-from typing import ClassVar
+import threading
+import types
+import weakref
+from typing import Any, ClassVar, ContextManager, Literal
 
 import phaistos
 import phaistos.typings
 
 
+CallingConvention = Literal['bound', 'legacy']
+
+_SAME_VALUE: object
+
+
+class _MemoizedCall:
+    """
+    A call of a memoized validator, equal to the other calls with the same (hashable projections of)
+    the value and the validation context, carrying the arguments of the call until it is evaluated.
+    """
+    __slots__ = ('key', 'key_hash', 'owner', 'value', 'info')
+    key: tuple[Any, Any]
+    key_hash: int
+    owner: Any
+    value: Any
+    info: Any
+    def __init__(self, owner: Any, value: Any, info: Any) -> None: ...
+    def __hash__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+
+
+def _hashable(value: Any) -> Any: ...
+
+
 class ValidationFunctionsCompiler:
     _logger: ClassVar[logging.Logger] = ...
+    calling_convention: ClassVar[CallingConvention]
+    _code_cache: ClassVar[collections.OrderedDict[str, types.CodeType]]
+    _code_cache_lock: ClassVar[threading.Lock]
+    _recorded_code: ClassVar[contextvars.ContextVar[dict[str, types.CodeType] | None]]
+    _shared_functions: ClassVar[weakref.WeakValueDictionary[types.CodeType, types.FunctionType]]
+    @classmethod
+    def preload(cls, code_objects: dict[str, types.CodeType]) -> None:
+        """
+        Make already compiled validator code objects (e.g. read from the transpilation cache)
+        available to the compiler, so that their sources are not compiled again.
+
+        Args:
+            code_objects (dict[str, types.CodeType]): Code objects keyed by the hash of their rendered source.
+        """
+    @classmethod
+    def recording(cls) -> ContextManager[dict[str, types.CodeType]]:
+        """
+        Record the code objects of all validators compiled within the block.
+
+        Yields:
+            dict[str, types.CodeType]: The recorded code objects, keyed by the hash of their rendered source.
+        """
+    @classmethod
+    def set_calling_convention(cls, calling_convention: CallingConvention) -> None:
+        """
+        Select the way the compiled validators get the logger and the validated values.
+        Affects only the validators compiled afterwards.
+
+        Args:
+            calling_convention (CallingConvention): Either 'bound' (the default), where the logger is bound once,
+                when the function is created, and the values are the function locals, or 'legacy', where both
+                are copied into the globals of the validator module on each call.
+
+        Raises:
+            ValueError: If the calling convention is not known.
+        """
     @classmethod
     def compile(cls, prop: phaistos.typings.ParsedProperty) -> phaistos.typings.CompiledValidator: ...
     @classmethod
-    def _compile_for_field(cls, prop: phaistos.typings.ParsedProperty) -> phaistos.typings.CompiledValidator: ...
+    def _compile_for_field(cls, prop: phaistos.typings.ParsedProperty, validator: phaistos.typings.RawValidator) -> phaistos.typings.CompiledValidator: ...
+    @classmethod
+    def memoize(cls, validator_function: Any, cache_size: int) -> classmethod:
+        """
+        Wrap a field validator, which has to be a pure function of the validated value (and the validation context),
+        in a bounded memo, keyed by the value or by its hashable projection (for lists, tuples, dictionaries and sets).
+        Both the returned values and the validation errors raised (as ValueError or AssertionError) are memoized,
+        while the validators of the values with no hashable projection are always called. The memoized results
+        of mutable types are deep-copied for each call, so that changing the validated data never changes them.
+        The statistics of the memo are available via the `cache_info` method of the wrapped function.
+
+        Args:
+            validator_function (typing.Any): The compiled field validator (a class method).
+            cache_size (int): The maximum number of memoized outcomes, the least recently used of which are evicted first.
+
+        Returns:
+            classmethod: The memoized field validator.
+        """
+    @classmethod
+    def _compile_for_model(cls, prop: phaistos.typings.ParsedProperty, validator: phaistos.typings.RawValidator) -> phaistos.typings.CompiledValidator: ...
+    @classmethod
+    def _compile_source(cls, source: str) -> types.CodeType: ...
+    @classmethod
+    def _cache_code(cls, source_hash: str, code: types.CodeType) -> None: ...
+    @classmethod
+    def render_validator(cls, data: dict[str, Any]) -> str:
+        """
+        Render the source code of a validator function module, in the current calling convention.
+
+        Args:
+            data (dict[str, typing.Any]): The name, source, kind ('field' or 'model'), decorator, extra arguments
+                and the names of the validated fields of the validator, optionally with the calling convention to render it in
+                and, for the field validators, whether None is accepted as it is and whether the value and its items are checked to be non-empty.
+
+        Returns:
+            str: The source code defining the validator function.
+        """
     @classmethod
-    def _compile_for_model(cls, prop: phaistos.typings.ParsedProperty) -> phaistos.typings.CompiledValidator: ...
+    def _compile_validator(cls, data: dict[str, Any]) -> types.FunctionType: ...
     @staticmethod
-    def _compile_validator(data: dict) -> function: ...
+    def _is_bindable(field: str, first_argument: str) -> bool: ...
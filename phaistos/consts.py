@@ -1,6 +1,11 @@
+import importlib.metadata
 import os
+import sys
 import types
 
+import pydantic
+import yaml
+
 import phaistos.utils
 
 TRANSPILATION_LOGGER = phaistos.utils.setup_logger('PHAISTOS (T)')
@@ -8,9 +13,50 @@ MANAGER_LOGGER = phaistos.utils.setup_logger('PHAISTOS (M)')
 COMPILATION_LOGGER = phaistos.utils.setup_logger('PHAISTOS (C)')
 VALIDATION_LOGGER = phaistos.utils.setup_logger('PHAISTOS (V)')
 
-ALLOWED_COLLECTION_TYPES = {'list', 'set'}
 
-COLLECTION_TYPE_REGEX = r'(?P<collection>\w+)\[(?P<item>\w+)\]'
+# The libyaml based loader is an order of magnitude faster, but it is available only if PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)  # pylint: disable=invalid-name
+
+try:
+    PHAISTOS_VERSION = importlib.metadata.version('phaistos')
+except importlib.metadata.PackageNotFoundError:
+    PHAISTOS_VERSION = 'dev'
+
+# Everything that can change the outcome of a transpilation (or the format of marshalled code) apart from the schema itself
+TRANSPILATION_ENVIRONMENT = f'phaistos={PHAISTOS_VERSION};pydantic={pydantic.VERSION};python={sys.implementation.cache_tag}'
+
+# The number of outcomes memoized by a cached field validator, unless its cache_size is given
+DEFAULT_VALIDATOR_CACHE_SIZE = 1024
+
+# The number of compiled validator code objects kept in memory, the least recently used ones are dropped beyond it
+VALIDATOR_CODE_CACHE_SIZE = 4096
+
+# Generic types allowed in the field type expressions, with the number of their type arguments (None if it is not fixed)
+TYPE_EXPRESSION_GENERICS: dict[str, int | None] = {
+    'list': 1,
+    'set': 1,
+    'frozenset': 1,
+    'tuple': None,
+    'dict': 2,
+    'Optional': 1,
+    'Union': None,
+}
+# Items of these types are validated without type coercion (e.g. "1" is not an item of list[int])
+STRICT_ITEM_TYPES = {str, int, float, bool, bytes}
+TYPE_EXPRESSION_SYMBOLS = {'[', ']', ',', '|', '...'}
+TYPE_EXPRESSION_TOKEN_REGEX = r'\s*(\.\.\.|[A-Za-z_][\w.]*|[\[\],|])'
+
+REFERENCE_KEY = '$ref'
+LOCAL_REFERENCE_PREFIX = '#/definitions/'
+# A reference to another schema, in the JSON form of a parsed schema
+EXTERNAL_REFERENCE_REGEX = r'"\$ref": "(?!#/definitions/)'
+
+# A top-level, plain (or quoted) scalar name key of a schema manifest, used to index manifests without parsing them
+SCHEMA_NAME_REGEX = r'^name:[ \t]*(?P<quote>[\'"]?)(?P<name>[\w.-]+)(?P=quote)[ \t]*(#.*)?$'
+# The same for the version key of a schema manifest
+SCHEMA_VERSION_REGEX = r'^version:[ \t]*(?P<quote>[\'"]?)(?P<version>[\w.+-]+)(?P=quote)[ \t]*(#.*)?$'
+# The versions are ordered naturally, by their numeric and textual parts (e.g. v2 < v10)
+VERSION_PART_REGEX = r'\d+|\D+'
 
 # This is a list of modules that should not be available to the user
 # when they are writing validators, so they are shadowed by fake modules
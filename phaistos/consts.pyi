@@ -9,8 +9,21 @@ class NullModule(ModuleType):
         to prevent the module from being accessed.
         """
 
-ALLOWED_COLLECTION_TYPES: set
-COLLECTION_TYPE_REGEX: str
+YAML_LOADER: type
+PHAISTOS_VERSION: str
+TRANSPILATION_ENVIRONMENT: str
+DEFAULT_VALIDATOR_CACHE_SIZE: int
+VALIDATOR_CODE_CACHE_SIZE: int
+TYPE_EXPRESSION_GENERICS: dict[str, int | None]
+STRICT_ITEM_TYPES: set[type]
+TYPE_EXPRESSION_SYMBOLS: set[str]
+TYPE_EXPRESSION_TOKEN_REGEX: str
+REFERENCE_KEY: str
+LOCAL_REFERENCE_PREFIX: str
+EXTERNAL_REFERENCE_REGEX: str
+SCHEMA_NAME_REGEX: str
+SCHEMA_VERSION_REGEX: str
+VERSION_PART_REGEX: str
 BLOCKED_MODULES: list
 ISOLATION_FROM_UNWANTED_LIBRARIES: dict
 DISCOVERY_EXCEPTIONS: dict
@@ -12,6 +12,11 @@ class SchemaLoadingException(Exception):
         super().__init__(message)
 
 
+class CheckpointMismatchException(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+
+
 class IncorrectFieldTypeError(ValueError):
     def __init__(self, field_type: str):
         if field_type in {'dict', 'object'}:
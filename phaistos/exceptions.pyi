@@ -5,6 +5,8 @@ class ForbiddenModuleUseInValidator(ImportError): ...
 
 class SchemaLoadingException(Exception): ...
 
+class CheckpointMismatchException(Exception): ...
+
 class IncorrectFieldTypeError(ValueError): ...
 
 @dataclasses.dataclass(kw_only=True)
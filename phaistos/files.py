@@ -0,0 +1,189 @@
+"""
+    Memory-mapped validation of large JSONL files.
+
+    The file is mapped into memory instead of being read, so only the pages of the records being
+    validated are loaded (and the OS can evict them again). A single scan of the file builds a compact
+    index of the record start offsets and line numbers, which then allows to validate any subset
+    of the records again (e.g. only the failed ones) without rescanning the file.
+"""
+from __future__ import annotations
+import array
+import mmap
+import os
+import re
+import types
+import typing
+
+from phaistos.consts import VALIDATION_LOGGER
+from phaistos.schema import SchemaInstancesFactory
+from phaistos.typings import BatchValidationResults, RecordValidationResults
+
+# A line with anything but whitespace in it is a record
+_RECORD_CONTENT_REGEX = re.compile(rb'\S')
+
+
+class MappedRecordsFile:
+    """
+    A newline-delimited JSON (JSONL/NDJSON) file, mapped into memory and indexed by its records.
+    Blank lines are not records. The records are referred to by their indexes in the index,
+    which are also the indexes of the entries in the validation results.
+
+    Attributes:
+        path (str): The path of the file.
+        offsets (array.array): The byte offsets of the record starts, in the file order.
+        lines (array.array): The line numbers (starting from 1) of the records, in the file order.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = os.fspath(path)
+        self.offsets = array.array('Q')
+        self.lines = array.array('Q')
+        self._file = open(self.path, 'rb')  # pylint: disable=consider-using-with
+        try:
+            # Empty files cannot be mapped, but they have no records anyway
+            self._mapping = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) \
+                if os.fstat(self._file.fileno()).st_size \
+                else None
+        except Exception:
+            self._file.close()
+            raise
+        self._view = memoryview(self._mapping if self._mapping is not None else b'')
+        self._build_index()
+
+    def __enter__(self) -> MappedRecordsFile:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: types.TracebackType | None
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def close(self) -> None:
+        """
+        Unmap and close the file. The memoryview slices returned by the record method have to be released before.
+        """
+        self._view.release()
+        if self._mapping is not None:
+            self._mapping.close()
+        self._file.close()
+
+    def _build_index(self) -> None:
+        if (mapping := self._mapping) is None:
+            return
+        size = len(mapping)
+        find_line_end = mapping.find
+        has_content = _RECORD_CONTENT_REGEX.search
+        add_offset = self.offsets.append
+        add_line = self.lines.append
+        start = 0
+        line = 1
+        while start < size:
+            if (end := find_line_end(b'\n', start)) == -1:
+                end = size
+            if has_content(mapping, start, end):
+                add_offset(start)
+                add_line(line)
+            start = end + 1
+            line += 1
+        VALIDATION_LOGGER.debug(f'{self.path}: indexed {len(self.offsets)} records')
+
+    def _record_end(self, start: int) -> int:
+        end = self._mapping.find(b'\n', start)  # type: ignore
+        return len(self._view) if end == -1 else end
+
+    def record(self, index: int) -> memoryview:
+        """
+        Get the raw content of a record, without copying it out of the mapped file.
+
+        Args:
+            index (int): The index of the record.
+
+        Returns:
+            memoryview: The slice of the mapped file with the record (without the line end).
+        """
+        start = self.offsets[index]
+        return self._view[start:self._record_end(start)]
+
+    def validate(self, factory: SchemaInstancesFactory) -> BatchValidationResults:
+        """
+        Validate all records of the file against the schema of the factory.
+
+        Args:
+            factory (SchemaInstancesFactory): The factory of the schema to validate the records against.
+
+        Returns:
+            BatchValidationResults: The validity mask and the errors of the records, by their indexes.
+        """
+        results = BatchValidationResults(
+            mask=bytearray(b'\x01') * len(self.offsets),
+            schema_source=factory._model.cached_json_schema  # pylint: disable=protected-access
+        )
+        self._validate_records(factory, range(len(self.offsets)), results)
+        return results
+
+    def revalidate(self, factory: SchemaInstancesFactory, results: BatchValidationResults) -> BatchValidationResults:
+        """
+        Validate again only the records that failed the previous validation of the file
+        (e.g. against a fixed version of the schema), finding them by the index instead of scanning the file.
+
+        Args:
+            factory (SchemaInstancesFactory): The factory of the schema to validate the records against.
+            results (BatchValidationResults): The results of the previous validation of the file.
+
+        Returns:
+            BatchValidationResults: The updated results, with the records that now pass marked as valid.
+        """
+        if results.total != len(self.offsets):
+            raise ValueError(f'Results of {results.total} records do not match the {len(self.offsets)} records of {self.path}')
+        revalidated_results = BatchValidationResults(
+            mask=bytearray(results.mask),
+            errors=dict(results.errors),
+            schema_source=factory._model.cached_json_schema  # pylint: disable=protected-access
+        )
+        self._validate_records(factory, sorted(results.errors), revalidated_results)
+        return revalidated_results
+
+    def _validate_records(self, factory: SchemaInstancesFactory, indexes: typing.Iterable[int], results: BatchValidationResults) -> None:
+        # The records are passed as slices of the mapped file, so they are not copied unless they are parsed
+        collect_json_errors = factory._collect_json_errors  # pylint: disable=protected-access
+        view = self._view
+        offsets = self.offsets
+        record_end = self._record_end
+        mask = results.mask
+        errors = results.errors
+        validated_records = 0
+        for index in indexes:
+            start = offsets[index]
+            with view[start:record_end(start)] as record:
+                collected_errors = collect_json_errors(record)
+            if collected_errors:
+                errors[index] = collected_errors
+                mask[index] = 0
+            else:
+                errors.pop(index, None)
+                mask[index] = 1
+            validated_records += 1
+        VALIDATION_LOGGER.debug(f'{factory.name}: validated {validated_records} records of {self.path}')
+
+    def failures(self, results: BatchValidationResults) -> typing.Generator[RecordValidationResults, None, None]:
+        """
+        Locate the failed records of a validation of the file by their line numbers and byte offsets.
+
+        Args:
+            results (BatchValidationResults): The results of a validation of the file.
+
+        Yields:
+            RecordValidationResults: The errors of each failed record, with its line number and offset, in the file order.
+        """
+        for index in sorted(results.errors):
+            yield RecordValidationResults(
+                line=self.lines[index],
+                offset=self.offsets[index],
+                errors=results.errors[index]
+            )
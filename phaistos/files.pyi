@@ -0,0 +1,89 @@
+import array
+import mmap
+import os
+import re
+import types
+from typing import BinaryIO, Generator, Iterable
+
+from phaistos.schema import SchemaInstancesFactory
+from phaistos.typings import BatchValidationResults, RecordValidationResults
+
+_RECORD_CONTENT_REGEX: re.Pattern[bytes]
+
+
+class MappedRecordsFile:
+    """
+    A newline-delimited JSON (JSONL/NDJSON) file, mapped into memory and indexed by its records.
+    Blank lines are not records. The records are referred to by their indexes in the index,
+    which are also the indexes of the entries in the validation results.
+
+    Attributes:
+        path (str): The path of the file.
+        offsets (array.array): The byte offsets of the record starts, in the file order.
+        lines (array.array): The line numbers (starting from 1) of the records, in the file order.
+    """
+    path: str
+    offsets: array.array
+    lines: array.array
+    _file: BinaryIO
+    _mapping: mmap.mmap | None
+    _view: memoryview
+
+    def __init__(self, path: str | os.PathLike) -> None: ...
+    def __enter__(self) -> MappedRecordsFile: ...
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: types.TracebackType | None
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def close(self) -> None:
+        """
+        Unmap and close the file. The memoryview slices returned by the record method have to be released before.
+        """
+    def _build_index(self) -> None: ...
+    def _record_end(self, start: int) -> int: ...
+    def record(self, index: int) -> memoryview:
+        """
+        Get the raw content of a record, without copying it out of the mapped file.
+
+        Args:
+            index (int): The index of the record.
+
+        Returns:
+            memoryview: The slice of the mapped file with the record (without the line end).
+        """
+    def validate(self, factory: SchemaInstancesFactory) -> BatchValidationResults:
+        """
+        Validate all records of the file against the schema of the factory.
+
+        Args:
+            factory (SchemaInstancesFactory): The factory of the schema to validate the records against.
+
+        Returns:
+            BatchValidationResults: The validity mask and the errors of the records, by their indexes.
+        """
+    def revalidate(self, factory: SchemaInstancesFactory, results: BatchValidationResults) -> BatchValidationResults:
+        """
+        Validate again only the records that failed the previous validation of the file
+        (e.g. against a fixed version of the schema), finding them by the index instead of scanning the file.
+
+        Args:
+            factory (SchemaInstancesFactory): The factory of the schema to validate the records against.
+            results (BatchValidationResults): The results of the previous validation of the file.
+
+        Returns:
+            BatchValidationResults: The updated results, with the records that now pass marked as valid.
+        """
+    def _validate_records(self, factory: SchemaInstancesFactory, indexes: Iterable[int], results: BatchValidationResults) -> None: ...
+    def failures(self, results: BatchValidationResults) -> Generator[RecordValidationResults, None, None]:
+        """
+        Locate the failed records of a validation of the file by their line numbers and byte offsets.
+
+        Args:
+            results (BatchValidationResults): The results of a validation of the file.
+
+        Yields:
+            RecordValidationResults: The errors of each failed record, with its line number and offset, in the file order.
+        """
@@ -1,17 +1,41 @@
 from __future__ import annotations
+import concurrent.futures
+import dataclasses
+import hashlib
+import importlib
 import logging
 import os
+import re
+import threading
+import time
 import typing
+import pydantic
 import yaml
 
-
+import phaistos.utils
+from phaistos.cache import TranspilationCache
+from phaistos.compiler import ValidationFunctionsCompiler
 from phaistos.transpiler import Transpiler
+from phaistos.parallel import validate_in_processes
 from phaistos.typings import (
     SchemaInputFile,
-    ValidationResults
+    ParsedSchemaFile,
+    SchemaDiscoveryTiming,
+    SchemaFileState,
+    SchemaReloadResults,
+    ValidationResults,
+    BatchValidationResults,
+    RecordValidationResults
+)
+from phaistos.schema import SchemaInstancesFactory, TranspiledSchema
+from phaistos.consts import (
+    DISCOVERY_EXCEPTIONS,
+    MANAGER_LOGGER,
+    PHAISTOS_VERSION,
+    SCHEMA_NAME_REGEX,
+    SCHEMA_VERSION_REGEX,
+    YAML_LOADER
 )
-from phaistos.schema import TranspiledSchema, SchemaInstancesFactory
-from phaistos.consts import DISCOVERY_EXCEPTIONS, MANAGER_LOGGER
 from phaistos.exceptions import SchemaLoadingException
 
 
@@ -21,26 +45,187 @@ class Manager:
     _discover: bool
     _current_schemas_path: typing.ClassVar[str] = ''
     _schemas: dict[str, SchemaInstancesFactory] = {}
+    # The factories of all loaded versions of the schemas, by their names and versions (the latest ones are also in _schemas)
+    _versions: typing.ClassVar[dict[str, dict[str, SchemaInstancesFactory]]] = {}
     _started: typing.ClassVar[bool] = False
+    _cache: typing.ClassVar[TranspilationCache | None] = None
+    _discovery_report: typing.ClassVar[list[SchemaDiscoveryTiming]] = []
+    _lazy: typing.ClassVar[bool] = False
+    # The files of the indexed schemas (or the modules of the compiled ones), by their names
+    _schema_index: typing.ClassVar[dict[str, str]] = {}
+    # The files (or modules) of all versions of the indexed schemas, by their names and versions (the latest ones are also in _schema_index)
+    _version_index: typing.ClassVar[dict[str, dict[str, str]]] = {}
+    _loading_lock: typing.ClassVar[threading.RLock] = threading.RLock()
+    _file_states: typing.ClassVar[dict[str, SchemaFileState]] = {}
+    _reload_lock: typing.ClassVar[threading.Lock] = threading.Lock()
+    _watcher_stop: typing.ClassVar[threading.Event | None] = None
+    _compiled_package: typing.ClassVar[str] = ''
+    # The names of the schemas being transpiled, each one referred to by the previous one
+    _loading_schemas: typing.ClassVar[list[str]] = []
+    # The names of the schemas whose versions are being loaded on first use (some of them may already be registered)
+    _lazily_loading: typing.ClassVar[set[str]] = set()
 
     __instance: typing.Optional[Manager] = None
 
-    def validate(self, data: dict, schema: str) -> ValidationResults:
+    def validate(
+        self,
+        data: dict,
+        schema: str,
+        context: dict[str, typing.Any] | None = None,
+        version: str | None = None
+    ) -> ValidationResults:
         self.logger.info(f'Validating data against schema: {schema}')
-        return self.get_factory(schema).validate(data)
+        return self.get_factory(schema, version).validate(data, context=context)
+
+    def validate_json(
+        self,
+        raw: str | bytes | bytearray | memoryview,
+        schema: str,
+        context: dict[str, typing.Any] | None = None,
+        version: str | None = None
+    ) -> ValidationResults:
+        self.logger.info(f'Validating a JSON document against schema: {schema}')
+        return self.get_factory(schema, version).validate_json(raw, context=context)
+
+    async def avalidate(
+        self,
+        data: dict,
+        schema: str,
+        context: dict[str, typing.Any] | None = None,
+        version: str | None = None
+    ) -> ValidationResults:
+        self.logger.info(f'Validating data asynchronously against schema: {schema}')
+        return await self.get_factory(schema, version).avalidate(data, context=context)
+
+    def avalidate_stream(
+        self,
+        payloads: typing.AsyncIterable[dict] | typing.Iterable[dict],
+        schema: str,
+        context: dict[str, typing.Any] | None = None,
+        version: str | None = None
+    ) -> typing.AsyncGenerator[ValidationResults, None]:
+        self.logger.info(f'Validating a stream of data entries asynchronously against schema: {schema}')
+        return self.get_factory(schema, version).avalidate_stream(payloads, context=context)
+
+    @classmethod
+    def configure_async(cls, max_concurrency: int = 16, executor: concurrent.futures.Executor | None = None) -> None:
+        """
+        Configure the executor and the concurrency limit used by the asynchronous validation methods.
+
+        Args:
+            max_concurrency (int): The maximum number of validations running at once (per event loop).
+            executor (concurrent.futures.Executor | None): The executor to run the validations in (the loop default executor if not given).
+        """
+        SchemaInstancesFactory.configure_async(max_concurrency=max_concurrency, executor=executor)
+
+    def validate_many(
+        self,
+        payloads: typing.Iterable[dict],
+        schema: str,
+        chunk_size: int = 1000,
+        context: dict[str, typing.Any] | None = None,
+        version: str | None = None
+    ) -> BatchValidationResults:
+        self.logger.info(f'Validating a batch of data entries against schema: {schema}')
+        return self.get_factory(schema, version).validate_many(payloads, chunk_size=chunk_size, context=context)
+
+    def validate_stream(
+        self,
+        source: typing.IO | typing.Iterable[str | bytes],
+        schema: str,
+        context: dict[str, typing.Any] | None = None,
+        version: str | None = None
+    ) -> typing.Generator[RecordValidationResults, None, None]:
+        self.logger.info(f'Validating a stream of JSON records against schema: {schema}')
+        return self.get_factory(schema, version).validate_stream(source, context=context)
+
+    def validate_concurrently(  # pylint: disable=too-many-arguments
+        self,
+        payloads: typing.Iterable[dict],
+        schema: str,
+        max_workers: int | None = None,
+        chunk_size: int = 100,
+        *,
+        context: dict[str, typing.Any] | None = None,
+        version: str | None = None
+    ) -> list[ValidationResults]:
+        self.logger.info(f'Validating data entries concurrently against schema: {schema}')
+        return self.get_factory(schema, version).validate_concurrently(payloads, max_workers=max_workers, chunk_size=chunk_size, context=context)
+
+    def validate_parallel(  # pylint: disable=too-many-arguments
+        self,
+        payloads: typing.Iterable[dict],
+        schema: str,
+        processes: int | None = None,
+        chunk_size: int = 1000,
+        *,
+        context: dict[str, typing.Any] | None = None,
+        version: str | None = None
+    ) -> BatchValidationResults:
+        """
+        Validate data entries in a pool of processes, each transpiling the schema
+        from its manifest once at the pool start. Useful for schemas with CPU-heavy validators.
+
+        Args:
+            payloads (typing.Iterable[dict]): The data entries to validate.
+            schema (str): The name of the schema
+            processes (int | None): The number of worker processes (the number of CPUs if not given).
+            chunk_size (int): The number of entries sent to a worker at once.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for all entries of this call only
+                (sent to the worker processes, so it has to be picklable).
+            version (str | None): The version of the schema (the latest one if not given).
+
+        Returns:
+            BatchValidationResults: The validity mask, errors and counts for the whole batch, in the input order.
+        """
+        self.logger.info(f'Validating data entries in worker processes against schema: {schema}')
+        return validate_in_processes(
+            self.get_factory(schema, version),
+            payloads,
+            processes=processes,
+            chunk_size=chunk_size,
+            context=context
+        )
 
     @classmethod
-    def start(
+    def start(  # pylint: disable=too-many-arguments
         cls,
         discover: bool = True,
-        schemas_path: str = ''
+        schemas_path: str = '',
+        *,
+        cache_path: str = '',
+        lazy: bool = False,
+        preload: typing.Iterable[str] = (),
+        compiled_package: str = ''
     ) -> Manager:
+        """
+        Start the manager (or return the already started one) and discover the schemas.
+
+        Args:
+            discover (bool): Whether to discover the schemas found under the schemas path.
+            schemas_path (str): The path to the schemas (PHAISTOS__SCHEMA_PATH environment variable if not given).
+            cache_path (str): The directory of the persistent transpilation cache (PHAISTOS__CACHE_PATH environment variable if not given).
+                If neither is set, the discovered schemas are always parsed and compiled from scratch.
+            lazy (bool): Whether to only index the discovered schemas by name and transpile each of them on its first use.
+            preload (typing.Iterable[str]): The names of the schemas to be transpiled right away in the lazy mode.
+            compiled_package (str): The name of an importable package of schemas generated ahead of time (PHAISTOS__COMPILED_PACKAGE
+                environment variable if not given), whose modules are imported instead of discovering the schemas under the schemas path.
+
+        Returns:
+            Manager: The manager instance.
+        """
         cls._discover = discover
         if 'PHAISTOS__DISABLE_SCHEMA_DISCOVERY' in os.environ:
             cls._discover = False
         if not cls._started:
             cls._current_schemas_path = schemas_path or os.environ.get('PHAISTOS__SCHEMA_PATH', '')
+            if selected_cache_path := cache_path or os.environ.get('PHAISTOS__CACHE_PATH', ''):
+                cls._cache = TranspilationCache(path=selected_cache_path)
+            cls._lazy = lazy
+            cls._compiled_package = compiled_package or os.environ.get('PHAISTOS__COMPILED_PACKAGE', '')
             cls.__instance = cls()
+            for schema_name in preload:
+                cls.__instance.get_factory(schema_name)
         return cls.__instance  # type: ignore
 
     @classmethod
@@ -52,7 +237,7 @@ class Manager:
         if cls.__instance:
             return cls.__instance
         cls.logger.info('Starting Phaistos manager!')
-        if not cls._current_schemas_path and cls._discover:
+        if not cls._current_schemas_path and not cls._compiled_package and cls._discover:
             raise RuntimeError(
                 'Schemas path must be provided or PHAISTOS__SCHEMA_PATH environment variable must be set'
             )
@@ -63,35 +248,79 @@ class Manager:
 
     @classmethod
     def reset(cls) -> None:
+        cls.stop_watching()
         cls._started = False
         cls._current_schemas_path = ''
         cls._schemas = {}
+        cls._versions = {}
+        cls._cache = None
+        cls._discovery_report = []
+        cls._lazy = False
+        cls._schema_index = {}
+        cls._version_index = {}
+        cls._file_states = {}
+        cls._loading_schemas = []
+        cls._lazily_loading = set()
+        cls._compiled_package = ''
 
-    def get_factory(self, name: str) -> SchemaInstancesFactory:
+    def get_factory(self, name: str, version: str | None = None) -> SchemaInstancesFactory:
         """
-        Get a schema factory by name
+        Get a schema factory by name (and version)
 
         Args:
             name (str): The name of the schema
+            version (str | None): The version of the schema (the latest one if not given)
 
         Returns:
             SchemaInstancesFactory: The schema factory, that can be used to validate data and create instances of the model
+
+        Raises:
+            SchemaLoadingException: If the schema (or the version of it) is not found
         """
+        # A schema still being loaded on first use is waited for, so that all of its versions are seen together
+        if name in self._schema_index and (name not in self._schemas or name in self._lazily_loading):
+            self.__load_indexed_schema(name)
         if name not in self._schemas:
             raise SchemaLoadingException(
                 f'Schema {name} not found'
             )
-        return self._schemas[name]
+        if version is None:
+            return self._schemas[name]
+        if (factory := self._versions[name].get(str(version))) is None:
+            raise SchemaLoadingException(
+                f'Version {version} of schema {name} not found'
+            )
+        return factory
+
+    def get_versions(self, name: str) -> list[str]:
+        """
+        Get the loaded versions of a schema, from the oldest to the latest one
+
+        Args:
+            name (str): The name of the schema
+
+        Returns:
+            list[str]: The versions of the schema, in their natural order (e.g. v2 before v10)
+
+        Raises:
+            SchemaLoadingException: If the schema is not found
+        """
+        self.get_factory(name)
+        return sorted(self._versions[name], key=phaistos.utils.version_sort_key)
 
     @classmethod
     def get_available_schemas(cls) -> dict[str, SchemaInstancesFactory]:
-        discovered_schemas = getattr(cls, '_schemas', {})
         try:
-            for schema in cls.__discover_schemas(cls._current_schemas_path):
-                discovered_schemas[schema.transpilation_name] = SchemaInstancesFactory(
-                    name=schema.transpilation_name,
-                    _model=schema
-                )
+            if cls._compiled_package:
+                cls._schema_index = cls.__index_compiled_package(cls._compiled_package)
+                if not cls._lazy:
+                    cls._discovery_report = []
+                    for schema_name in cls._schema_index:
+                        cls.__load_indexed_schema(schema_name)
+            elif cls._lazy:
+                cls._schema_index = cls.__index_schemas(cls._current_schemas_path)
+            else:
+                cls._discovery_report = cls.__discover_schemas(cls._current_schemas_path)
         except tuple(DISCOVERY_EXCEPTIONS.keys()) as schema_discovery_error:
             cls.logger.error(
                 DISCOVERY_EXCEPTIONS.get(type(schema_discovery_error), f'Error while discovering schemas: {schema_discovery_error}')
@@ -99,37 +328,557 @@ class Manager:
             raise schema_discovery_error
 
         cls.logger.info(
-            f'Available schemas: {", ".join(discovered_schemas.keys())}'
+            f'Available schemas: {", ".join(cls._schema_index.keys() if cls._lazy else cls._schemas.keys())}'
         )
-        return discovered_schemas
+        return cls._schemas
+
+    @classmethod
+    def get_discovery_report(cls) -> list[SchemaDiscoveryTiming]:
+        """
+        Get the timings of the last schema discovery, for each of the discovered schema files
+
+        Returns:
+            list[SchemaDiscoveryTiming]: The parse and transpile timings of the schema files, in the order of transpilation
+        """
+        return cls._discovery_report
 
     @classmethod
-    def __discover_schemas(cls, target_path: str) -> list[type[TranspiledSchema]]:
+    def __discover_schemas(cls, target_path: str) -> list[SchemaDiscoveryTiming]:
         cls.logger.info(f'Discovering schemas in: {target_path}')
-        schemas: list[type[TranspiledSchema]] = []
-        for schema in os.listdir(target_path):
-            if schema.startswith('_'):
-                continue
+        schema_paths = cls.__find_schema_files(target_path)
+        # Reading and parsing is I/O bound (especially on network volumes), so it is done in parallel,
+        # while the transpilation itself is done one schema at a time, in a deterministic order
+        with concurrent.futures.ThreadPoolExecutor(thread_name_prefix='phaistos-discovery') as executor:
+            parsed_schema_files = list(executor.map(cls.__parse_schema_file, schema_paths))
+
+        discovery_report: list[SchemaDiscoveryTiming] = []
+        for parsed_schema_file in cls.__order_by_dependencies(parsed_schema_files):
+            cls.logger.info(f'Importing schema: {parsed_schema_file["path"]}')
+            transpilation_start = time.perf_counter()
+            cls.__load_parsed_schema_file(parsed_schema_file)
+            cls._file_states[parsed_schema_file['path']] = parsed_schema_file['state']
+            discovery_report.append(
+                SchemaDiscoveryTiming(
+                    path=parsed_schema_file['path'],
+                    name=parsed_schema_file['schema']['name'],
+                    parse_time=parsed_schema_file['parse_time'],
+                    transpile_time=time.perf_counter() - transpilation_start,
+                    cached=parsed_schema_file['code'] is not None
+                )
+            )
+            cls.logger.info(str(discovery_report[-1]))
+        return discovery_report
+
+    @classmethod
+    def __order_by_dependencies(cls, parsed_schema_files: list[ParsedSchemaFile]) -> list[ParsedSchemaFile]:
+        # The schemas referred to by other schemas have to be transpiled first, so that their models can be reused
+        schemas = {
+            parsed_schema_file['schema']['name']: parsed_schema_file['schema']
+            for parsed_schema_file in parsed_schema_files
+        }
+        positions = {
+            name: position
+            for position, name in enumerate(cls.__sort_schemas_by_references(schemas))
+        }
+        return sorted(
+            parsed_schema_files,
+            key=lambda parsed_schema_file: positions[parsed_schema_file['schema']['name']]
+        )
+
+    @staticmethod
+    def __sort_schemas_by_references(schemas: dict[str, SchemaInputFile]) -> list[str]:
+        sorted_names: dict[str, None] = {}
+        visited_names: list[str] = []
+
+        def visit(name: str) -> None:
+            if name in sorted_names:
+                return
+            if name in visited_names:
+                raise SchemaLoadingException(
+                    f'Circular schema references: {" -> ".join([*visited_names[visited_names.index(name):], name])}'
+                )
+            visited_names.append(name)
+            for referred_name in Transpiler.find_references(schemas[name]):
+                # The schemas outside of the given ones are either already loaded or missing (reported when transpiled)
+                if referred_name in schemas:
+                    visit(referred_name)
+            visited_names.pop()
+            sorted_names[name] = None
+
+        for name in schemas:
+            visit(name)
+        return [*sorted_names]
+
+    @classmethod
+    def __index_schemas(cls, target_path: str) -> dict[str, str]:
+        cls.logger.info(f'Indexing schemas in: {target_path}')
+        schema_paths = cls.__find_schema_files(target_path)
+        with concurrent.futures.ThreadPoolExecutor(thread_name_prefix='phaistos-discovery') as executor:
+            schema_file_states = list(executor.map(cls.__read_schema_file_state, schema_paths))
+        cls._file_states.update(zip(schema_paths, schema_file_states))
+        cls._version_index = {}
+        for schema_path, schema_file_state in zip(schema_paths, schema_file_states):
+            cls._version_index.setdefault(schema_file_state.name, {})[schema_file_state.version] = schema_path
+        return {
+            name: schema_paths_by_version[cls.__latest_version(schema_paths_by_version)]
+            for name, schema_paths_by_version in cls._version_index.items()
+        }
+
+    @classmethod
+    def __index_compiled_package(cls, package_name: str) -> dict[str, str]:
+        cls.logger.info(f'Indexing compiled schemas of: {package_name}')
+        package = importlib.import_module(package_name)
+        if (package.PHAISTOS_VERSION, package.PYDANTIC_VERSION) != (PHAISTOS_VERSION, pydantic.VERSION):
+            raise SchemaLoadingException(
+                f'Schemas of {package_name} were compiled with phaistos {package.PHAISTOS_VERSION} and pydantic {package.PYDANTIC_VERSION}, '
+                f'they have to be compiled again for phaistos {PHAISTOS_VERSION} and pydantic {pydantic.VERSION}'
+            )
+        # Like the schema files, the compiled schemas are indexed by the paths of their modules
+        cls._version_index = {
+            schema_name: {
+                version: os.path.join(package.__path__[0], f'{module_name}.py')
+                for version, module_name in schema_modules.items()
+            }
+            for schema_name, schema_modules in package.VERSIONS.items()
+        }
+        return {
+            schema_name: os.path.join(package.__path__[0], f'{module_name}.py')
+            for schema_name, module_name in package.SCHEMAS.items()
+        }
+
+    @classmethod
+    def __import_compiled_schema(cls, name: str, module_path: str) -> None:
+        cls.logger.info(f'Importing compiled schema: {module_path}')
+        import_start = time.perf_counter()
+        module_name = os.path.splitext(os.path.basename(module_path))[0]
+        schema_module = importlib.import_module(f'{cls._compiled_package}.{module_name}')
+        references: dict[str, SchemaInputFile] = {}
+        for referred_name in schema_module.REFERENCES:
+            cls.__load_indexed_schema(referred_name)
+            referred_factory = cls._schemas[referred_name]
+            references |= referred_factory.references
+            references[referred_name] = referred_factory.source  # type: ignore
+        cls.__register_factory(name, str(schema_module.SOURCE.get('version', '')), SchemaInstancesFactory(
+            name=schema_module.SCHEMA.transpilation_name,
+            _model=schema_module.SCHEMA,
+            source=schema_module.SOURCE,
+            references=references
+        ))
+        cls._discovery_report.append(
+            SchemaDiscoveryTiming(
+                path=module_path,
+                name=name,
+                parse_time=0.0,
+                transpile_time=time.perf_counter() - import_start,
+                cached=True
+            )
+        )
+
+    @classmethod
+    def __read_schema_file_state(cls, schema_path: str) -> SchemaFileState:
+        content, file_status = cls.__read_schema_file(schema_path)
+        text = content.decode('utf-8')
+        if name_match := re.search(SCHEMA_NAME_REGEX, text, flags=re.MULTILINE):
+            name = name_match['name']
+        else:
+            # The name is not a plain top-level scalar (e.g. it is an alias), so the whole manifest has to be parsed
+            name = yaml.load(text, Loader=YAML_LOADER)['name']
+        if version_match := re.search(SCHEMA_VERSION_REGEX, text, flags=re.MULTILINE):
+            version = version_match['version']
+        elif re.search(r'^version:', text, flags=re.MULTILINE):
+            version = str(yaml.load(text, Loader=YAML_LOADER).get('version', ''))
+        else:
+            version = ''
+        return SchemaFileState(
+            name=name,
+            mtime_ns=file_status.st_mtime_ns,
+            size=file_status.st_size,
+            digest=hashlib.sha256(content).hexdigest(),
+            version=version
+        )
 
-            schema_path = f'{target_path}/{schema}'
-            if not os.path.isdir(schema_path):
-                cls.logger.info(f'Importing schema: {schema_path}')
+    @staticmethod
+    def __read_schema_file(schema_path: str) -> tuple[bytes, os.stat_result]:
+        with open(schema_path, 'rb') as schema_file:
+            return schema_file.read(), os.fstat(schema_file.fileno())
 
-                with open(schema_path, 'r', encoding='utf-8') as schema_file:
-                    schema_data = yaml.safe_load(schema_file)
-                    cls.load_schema(schema_data)
+    @classmethod
+    def __load_indexed_schema(cls, name: str) -> None:
+        with cls._loading_lock:
+            if name in cls._schemas:
+                return
+            cls._lazily_loading.add(name)
+            try:
+                # All versions of the schema are loaded at once, so that the latest one is always known
+                for schema_path in cls._version_index.get(name, {}).values() or [cls._schema_index[name]]:
+                    if cls._compiled_package:
+                        cls.__import_compiled_schema(name, schema_path)
+                        continue
+                    cls.logger.info(f'Importing schema on first use: {schema_path}')
+                    parsed_schema_file = cls.__parse_schema_file(schema_path)
+                    transpilation_start = time.perf_counter()
+                    cls.__load_parsed_schema_file(parsed_schema_file)
+                    cls._file_states[parsed_schema_file['path']] = parsed_schema_file['state']
+                    cls._discovery_report.append(
+                        SchemaDiscoveryTiming(
+                            path=parsed_schema_file['path'],
+                            name=parsed_schema_file['schema']['name'],
+                            parse_time=parsed_schema_file['parse_time'],
+                            transpile_time=time.perf_counter() - transpilation_start,
+                            cached=parsed_schema_file['code'] is not None
+                        )
+                    )
+            finally:
+                cls._lazily_loading.discard(name)
+
+    @classmethod
+    def __find_schema_files(cls, target_path: str) -> list[str]:
+        schema_paths: list[str] = []
+        with os.scandir(target_path) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if entry.name.startswith('_'):
+                    continue
+                if entry.is_dir():
+                    schema_paths.extend(cls.__find_schema_files(entry.path))
+                else:
+                    schema_paths.append(entry.path)
+        return schema_paths
+
+    @classmethod
+    def __parse_schema_file(cls, schema_path: str) -> ParsedSchemaFile:
+        parsing_start = time.perf_counter()
+        content, file_status = cls.__read_schema_file(schema_path)
+        return cls.__parse_schema_content(schema_path, content, file_status, parsing_start)
+
+    @classmethod
+    def __parse_schema_content(
+        cls,
+        schema_path: str,
+        content: bytes,
+        file_status: os.stat_result,
+        parsing_start: float
+    ) -> ParsedSchemaFile:
+        cache_key = cls._cache.key(content) if cls._cache else ''
+        code = None
+        if cls._cache and (cached_transpilation := cls._cache.load(cache_key)):
+            schema, code = cached_transpilation['schema'], cached_transpilation['code']
+        else:
+            schema = yaml.load(content, Loader=YAML_LOADER)
+        return ParsedSchemaFile(
+            path=schema_path,
+            schema=schema,
+            code=code,
+            cache_key=cache_key,
+            parse_time=time.perf_counter() - parsing_start,
+            state=SchemaFileState(
+                name=schema['name'],
+                mtime_ns=file_status.st_mtime_ns,
+                size=file_status.st_size,
+                digest=hashlib.sha256(content).hexdigest(),
+                version=str(schema.get('version', ''))
+            )
+        )
+
+    @classmethod
+    def reload(cls) -> SchemaReloadResults:
+        """
+        Re-read the schemas path and re-transpile only the schemas whose files were added or changed
+        (judging by their modification times, sizes and content hashes), removing the schemas of the deleted files.
+
+        Each re-transpiled schema factory replaces the previous one in a single assignment,
+        so the validations already running against the previous version of a schema finish with it.
+        In the lazy mode, only the already loaded schemas are re-transpiled, the rest is just re-indexed.
+
+        Returns:
+            SchemaReloadResults: The names of the reloaded and removed schemas, and the paths of the files that failed to transpile.
+
+        Raises:
+            SchemaLoadingException: If the changed schemas would refer to each other in a cycle (directly or through
+                the unchanged schemas), in which case nothing is reloaded and the previous factories are kept.
+        """
+        if cls._compiled_package:
+            raise RuntimeError(
+                'Schemas imported from a compiled package cannot be reloaded, the package has to be compiled again'
+            )
+        if not cls._current_schemas_path:
+            raise RuntimeError(
+                'Schemas path must be provided or PHAISTOS__SCHEMA_PATH environment variable must be set'
+            )
+        with cls._reload_lock:
+            reload_results = SchemaReloadResults()
+            schema_paths = cls.__find_schema_files(cls._current_schemas_path)
+            changed_schema_files = cls.__parse_changed_schema_files(schema_paths, reload_results)
+            cls.__check_reference_cycles(changed_schema_files, set(schema_paths))
+
+            for removed_path in cls._file_states.keys() - set(schema_paths):
+                removed_state = cls._file_states.pop(removed_path)
+                cls.__remove_schema(removed_state.name, removed_state.version)
+                reload_results.removed.append(removed_state.name)
+
+            for parsed_schema_file in cls.__order_by_dependencies(changed_schema_files):
+                cls.__reload_schema_file(parsed_schema_file, reload_results)
+            if reload_results.reloaded:
+                cls.__reload_dependent_schemas(reload_results)
+        return reload_results
+
+    @classmethod
+    def __parse_changed_schema_files(cls, schema_paths: list[str], reload_results: SchemaReloadResults) -> list[ParsedSchemaFile]:
+        changed_schema_files: list[ParsedSchemaFile] = []
+        with concurrent.futures.ThreadPoolExecutor(thread_name_prefix='phaistos-reload') as executor:
+            parsing_futures = [executor.submit(cls.__parse_changed_schema_file, schema_path) for schema_path in schema_paths]
+            for schema_path, parsing_future in zip(schema_paths, parsing_futures):
+                try:
+                    if (parsed_schema_file := parsing_future.result()) is not None:
+                        changed_schema_files.append(parsed_schema_file)
+                except (OSError, KeyError, TypeError, yaml.YAMLError) as parsing_error:
+                    cls.logger.error(f'Error while reading schema {schema_path}, keeping its previous version: {parsing_error}')
+                    reload_results.failed.append(schema_path)
+        return changed_schema_files
+
+    @classmethod
+    def __check_reference_cycles(cls, changed_schema_files: list[ParsedSchemaFile], schema_paths: set[str]) -> None:
+        # The cycles can go through the unchanged schemas as well, so the references of all the latest versions
+        # (as they will be after the reload) are checked before anything is transpiled
+        sources = {
+            name: {version: factory.source for version, factory in versions.items() if factory.source is not None}
+            for name, versions in cls._versions.items()
+        }
+        changed_paths = {parsed_schema_file['path'] for parsed_schema_file in changed_schema_files}
+        for schema_path, schema_state in cls._file_states.items():
+            if schema_path not in schema_paths or schema_path in changed_paths:
+                sources.get(schema_state.name, {}).pop(schema_state.version, None)
+        for parsed_schema_file in changed_schema_files:
+            schema_state = parsed_schema_file['state']
+            sources.setdefault(schema_state.name, {})[schema_state.version] = parsed_schema_file['schema']
+        cls.__sort_schemas_by_references({
+            name: versions[cls.__latest_version(versions)]
+            for name, versions in sources.items()
+            if versions
+        })
+
+    @classmethod
+    def __reload_schema_file(cls, parsed_schema_file: ParsedSchemaFile, reload_results: SchemaReloadResults) -> None:
+        schema_path, schema_state = parsed_schema_file['path'], parsed_schema_file['state']
+        schema_name = schema_state.name
+        if (previous_state := cls._file_states.get(schema_path)) \
+                and (previous_state.name, previous_state.version) != (schema_name, schema_state.version):
+            cls.__remove_schema(previous_state.name, previous_state.version)
+            reload_results.removed.append(previous_state.name)
+        cls._file_states[schema_path] = schema_state
+        if cls._lazy:
+            schema_paths_by_version = cls._version_index.setdefault(schema_name, {})
+            schema_paths_by_version[schema_state.version] = schema_path
+            cls._schema_index[schema_name] = schema_paths_by_version[cls.__latest_version(schema_paths_by_version)]
+            if schema_name not in cls._schemas:
+                return
+        cls.logger.info(f'Reloading schema: {schema_path}')
+        try:
+            with cls._loading_lock:
+                cls.__load_parsed_schema_file(parsed_schema_file)
+        except Exception as reload_error:  # pylint: disable=broad-except
+            cls.logger.error(f'Error while reloading schema {schema_path}, keeping its previous version: {reload_error}')
+            reload_results.failed.append(schema_path)
+            return
+        reload_results.reloaded.append(schema_name)
+
+    @classmethod
+    def watch(cls, interval: float = 1.0) -> None:
+        """
+        Start watching the schemas path, reloading the changed schemas every given number of seconds
+        in a background thread (see the reload method). The errors of a check are logged, and the watching goes on with the next one.
+
+        Args:
+            interval (float): The number of seconds between the checks of the schemas path.
+        """
+        if cls._watcher_stop is not None:
+            return
+        stop_event = cls._watcher_stop = threading.Event()
+
+        def poll_schemas() -> None:
+            try:
+                while not stop_event.wait(interval):
+                    try:
+                        cls.reload()
+                    except tuple(DISCOVERY_EXCEPTIONS.keys()) as schema_discovery_error:
+                        cls.logger.error(
+                            DISCOVERY_EXCEPTIONS.get(type(schema_discovery_error), f'Error while reloading schemas: {schema_discovery_error}')
+                        )
+                    except Exception as reload_error:  # pylint: disable=broad-except
+                        # A failed poll must never stop the watcher, the next one may succeed
+                        cls.logger.error(f'Error while reloading schemas: {reload_error}')
+            finally:
+                # So that the schemas path can be watched again, unless a new watcher has already been started
+                if cls._watcher_stop is stop_event:
+                    cls._watcher_stop = None
+
+        threading.Thread(target=poll_schemas, name='phaistos-watcher', daemon=True).start()
+
+    @classmethod
+    def stop_watching(cls) -> None:
+        """
+        Stop watching the schemas path, if it is being watched.
+        """
+        if cls._watcher_stop is not None:
+            cls._watcher_stop.set()
+            cls._watcher_stop = None
+
+    @classmethod
+    def __parse_changed_schema_file(cls, schema_path: str) -> ParsedSchemaFile | None:
+        parsing_start = time.perf_counter()
+        previous_state = cls._file_states.get(schema_path)
+        file_status = os.stat(schema_path)
+        if previous_state and (previous_state.mtime_ns, previous_state.size) == (file_status.st_mtime_ns, file_status.st_size):
+            return None
+        content, file_status = cls.__read_schema_file(schema_path)
+        if previous_state and previous_state.digest == hashlib.sha256(content).hexdigest():
+            # Only touched, so there is nothing to transpile
+            cls._file_states[schema_path] = dataclasses.replace(
+                previous_state,
+                mtime_ns=file_status.st_mtime_ns,
+                size=file_status.st_size
+            )
+            return None
+        return cls.__parse_schema_content(schema_path, content, file_status, parsing_start)
+
+    @classmethod
+    def __reload_dependent_schemas(cls, reload_results: SchemaReloadResults) -> None:
+        # The schemas referring to the reloaded schemas still use their previous models, so they are re-transpiled too
+        reloaded_names = set(reload_results.reloaded)
+        dependent_sources: dict[str, list[SchemaInputFile]] = {}
+        for name, versions in cls._versions.items():
+            if name in reloaded_names:
                 continue
+            dependent_sources[name] = [
+                factory.source
+                for factory in versions.values()
+                if factory.source is not None and not reloaded_names.isdisjoint(factory.references)
+            ]
+        # All versions of a schema are reloaded together, in the order of the references of its latest version
+        dependent_schemas = {
+            name: cls._schemas[name].source or sources[-1]
+            for name, sources in dependent_sources.items()
+            if sources
+        }
+        for name in cls.__sort_schemas_by_references(dependent_schemas):
+            cls.logger.info(f'Reloading schema referring to the reloaded schemas: {name}')
+            reloaded = False
+            for source in dependent_sources[name]:
+                try:
+                    with cls._loading_lock:
+                        cls.load_schema(source)
+                except Exception as reload_error:  # pylint: disable=broad-except
+                    version = str(source.get('version', ''))
+                    cls.logger.error(f'Error while reloading schema {name} {version}, keeping its previous version: {reload_error}')
+                    reload_results.failed.append(next(
+                        (path for path, state in cls._file_states.items() if (state.name, state.version) == (name, version)),
+                        name
+                    ))
+                    continue
+                reloaded = True
+            if reloaded:
+                reload_results.reloaded.append(name)
 
-            nested_schemas = cls.__discover_schemas(schema_path)
-            schemas.extend(nested_schemas)
-        return schemas
+    @classmethod
+    def __remove_schema(cls, name: str, version: str) -> None:
+        cls.logger.info(f'Removing schema: {name} {version}'.rstrip())
+        # The latest of the remaining versions (if any) takes the place of the removed one
+        if versions := cls._versions.get(name):
+            versions.pop(version, None)
+        if versions:
+            cls._schemas[name] = versions[cls.__latest_version(versions)]
+        else:
+            cls._schemas.pop(name, None)
+            cls._versions.pop(name, None)
+        if schema_paths_by_version := cls._version_index.get(name):
+            schema_paths_by_version.pop(version, None)
+        if schema_paths_by_version:
+            cls._schema_index[name] = schema_paths_by_version[cls.__latest_version(schema_paths_by_version)]
+        else:
+            cls._schema_index.pop(name, None)
+            cls._version_index.pop(name, None)
+
+    @staticmethod
+    def __latest_version(versions: typing.Iterable[str]) -> str:
+        return max(versions, key=phaistos.utils.version_sort_key)
+
+    @classmethod
+    def __register_factory(cls, name: str, version: str, factory: SchemaInstancesFactory) -> None:
+        # The versions are registered in place, and the latest one replaces the previous factory in a single assignment
+        versions = cls._versions.setdefault(name, {})
+        versions[version] = factory
+        cls._schemas[name] = versions[cls.__latest_version(versions)]
+
+    @classmethod
+    def __load_parsed_schema_file(cls, parsed_schema_file: ParsedSchemaFile) -> None:
+        if parsed_schema_file['code'] is not None:
+            cls.logger.info(f'Using cached transpilation of: {parsed_schema_file["path"]}')
+            ValidationFunctionsCompiler.preload(parsed_schema_file['code'])
+            cls.load_schema(parsed_schema_file['schema'])
+            return
+        if cls._cache is None:
+            cls.load_schema(parsed_schema_file['schema'])
+            return
+        with ValidationFunctionsCompiler.recording() as recorded_code:
+            cls.load_schema(parsed_schema_file['schema'])
+        cls._cache.store(parsed_schema_file['cache_key'], {
+            'schema': parsed_schema_file['schema'],
+            'code': recorded_code
+        })
 
     @classmethod
     def load_schema(cls, schema: SchemaInputFile) -> str:
+        """
+        Transpile a schema and register its factory under the schema name and version. The factory of the latest
+        version of a schema (in the natural order of the versions, e.g. v2 before v10) is the one returned by default.
+        The other schemas the schema refers to are resolved to the models of their latest versions (and loaded first,
+        in the lazy mode). The nested schemas and validators which have not changed between the versions are shared by them.
+
+        Args:
+            schema (SchemaInputFile): A parsed schema.
+
+        Returns:
+            str: The name of the loaded schema.
+
+        Raises:
+            SchemaLoadingException: If a referred schema is not found or the schemas refer to each other in a cycle.
+        """
         cls.logger.info(f'Loading schema: {schema["name"]}')
-        schema_class = Transpiler.make_schema(schema)
-        cls._schemas[schema['name']] = SchemaInstancesFactory(
-            name=schema_class.transpilation_name,
-            _model=schema_class
-        )
+        with cls._loading_lock:
+            cls._loading_schemas.append(schema['name'])
+            try:
+                with Transpiler.resolving_references(cls.__resolve_reference):
+                    schema_class = Transpiler.make_schema(schema)
+            finally:
+                cls._loading_schemas.pop()
+            references: dict[str, SchemaInputFile] = {}
+            for referred_name in Transpiler.find_references(schema):
+                referred_factory = cls._schemas[referred_name]
+                references |= referred_factory.references
+                references[referred_name] = referred_factory.source  # type: ignore
+            factory = SchemaInstancesFactory(
+                name=schema_class.transpilation_name,
+                _model=schema_class,
+                source=schema,
+                references=references
+            )
+            version = str(schema.get('version', ''))
+            previous_factory = cls._versions.get(schema['name'], {}).get(version)
+            if previous_factory is not None and previous_factory.result_cache is not None:
+                # The results cached for the previous transpilation of the schema are dropped, but the caching stays enabled
+                factory.enable_cache(max_size=previous_factory.result_cache.max_size, ttl=previous_factory.result_cache.ttl)
+            cls.__register_factory(schema['name'], version, factory)
         return schema_class.transpilation_name
+
+    @classmethod
+    def __resolve_reference(cls, name: str) -> type[TranspiledSchema]:
+        if name in cls._loading_schemas:
+            raise SchemaLoadingException(
+                f'Circular schema references: {" -> ".join([*cls._loading_schemas[cls._loading_schemas.index(name):], name])}'
+            )
+        if name not in cls._schemas and name in cls._schema_index:
+            cls.__load_indexed_schema(name)
+        if name not in cls._schemas:
+            raise SchemaLoadingException(
+                f'Schema {name} referred to by {cls._loading_schemas[-1]} not found'
+            )
+        return cls._schemas[name]._model  # pylint: disable=protected-access
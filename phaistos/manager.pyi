@@ -1,7 +1,20 @@
+import os
 import logging
+from phaistos.cache import TranspilationCache
 from phaistos.schema import SchemaInstancesFactory, TranspiledSchema
-from phaistos.typings import SchemaInputFile, ValidationResults
-from typing import ClassVar
+from phaistos.typings import (
+    SchemaInputFile,
+    ParsedSchemaFile,
+    SchemaDiscoveryTiming,
+    SchemaFileState,
+    SchemaReloadResults,
+    ValidationResults,
+    BatchValidationResults,
+    RecordValidationResults
+)
+import concurrent.futures
+import threading
+from typing import Any, AsyncGenerator, AsyncIterable, ClassVar, Generator, IO, Iterable
 
 DISCOVERY_EXCEPTIONS: dict
 
@@ -10,25 +23,236 @@ class Manager:
     logger: ClassVar[logging.Logger]
     _current_schemas_path: ClassVar[str]
     _schemas: ClassVar[dict]
+    _versions: ClassVar[dict[str, dict[str, SchemaInstancesFactory]]]
     _started: ClassVar[bool]
+    _cache: ClassVar[TranspilationCache | None]
+    _discovery_report: ClassVar[list[SchemaDiscoveryTiming]]
+    _lazy: ClassVar[bool]
+    _schema_index: ClassVar[dict[str, str]]
+    _version_index: ClassVar[dict[str, dict[str, str]]]
+    _loading_lock: ClassVar[threading.RLock]
+    _file_states: ClassVar[dict[str, SchemaFileState]]
+    _reload_lock: ClassVar[threading.Lock]
+    _watcher_stop: ClassVar[threading.Event | None]
+    _loading_schemas: ClassVar[list[str]]
+    _lazily_loading: ClassVar[set[str]]
+    _compiled_package: ClassVar[str]
     __instance: ClassVar[None]
 
-    def validate(self, data: dict, schema: str) -> ValidationResults: ...
+    def validate(
+        self,
+        data: dict,
+        schema: str,
+        context: dict[str, Any] | None = ...,
+        version: str | None = ...
+    ) -> ValidationResults: ...
+    def validate_json(
+        self,
+        raw: str | bytes | bytearray | memoryview,
+        schema: str,
+        context: dict[str, Any] | None = ...,
+        version: str | None = ...
+    ) -> ValidationResults: ...
+    async def avalidate(
+        self,
+        data: dict,
+        schema: str,
+        context: dict[str, Any] | None = ...,
+        version: str | None = ...
+    ) -> ValidationResults: ...
+    def avalidate_stream(
+        self,
+        payloads: AsyncIterable[dict] | Iterable[dict],
+        schema: str,
+        context: dict[str, Any] | None = ...,
+        version: str | None = ...
+    ) -> AsyncGenerator[ValidationResults, None]: ...
     @classmethod
-    def start(cls, discover: bool = ..., schemas_path: str | None = ...) -> Manager: ...
+    def configure_async(cls, max_concurrency: int = ..., executor: concurrent.futures.Executor | None = ...) -> None:
+        """
+        Configure the executor and the concurrency limit used by the asynchronous validation methods.
+
+        Args:
+            max_concurrency (int): The maximum number of validations running at once (per event loop).
+            executor (concurrent.futures.Executor | None): The executor to run the validations in (the loop default executor if not given).
+        """
+    def validate_many(
+        self,
+        payloads: Iterable[dict],
+        schema: str,
+        chunk_size: int = ...,
+        context: dict[str, Any] | None = ...,
+        version: str | None = ...
+    ) -> BatchValidationResults: ...
+    def validate_stream(
+        self,
+        source: IO | Iterable[str | bytes],
+        schema: str,
+        context: dict[str, Any] | None = ...,
+        version: str | None = ...
+    ) -> Generator[RecordValidationResults, None, None]: ...
+    def validate_concurrently(
+        self,
+        payloads: Iterable[dict],
+        schema: str,
+        max_workers: int | None = ...,
+        chunk_size: int = ...,
+        *,
+        context: dict[str, Any] | None = ...,
+        version: str | None = ...
+    ) -> list[ValidationResults]: ...
+    def validate_parallel(
+        self,
+        payloads: Iterable[dict],
+        schema: str,
+        processes: int | None = ...,
+        chunk_size: int = ...,
+        *,
+        context: dict[str, Any] | None = ...,
+        version: str | None = ...
+    ) -> BatchValidationResults:
+        """
+        Validate data entries in a pool of processes, each transpiling the schema
+        from its manifest once at the pool start. Useful for schemas with CPU-heavy validators.
+
+        Args:
+            payloads (typing.Iterable[dict]): The data entries to validate.
+            schema (str): The name of the schema
+            processes (int | None): The number of worker processes (the number of CPUs if not given).
+            chunk_size (int): The number of entries sent to a worker at once.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for all entries of this call only
+                (sent to the worker processes, so it has to be picklable).
+            version (str | None): The version of the schema (the latest one if not given).
+
+        Returns:
+            BatchValidationResults: The validity mask, errors and counts for the whole batch, in the input order.
+        """
+    @classmethod
+    def start(cls, discover: bool = ..., schemas_path: str | None = ..., *, cache_path: str = ..., lazy: bool = ..., preload: Iterable[str] = ..., compiled_package: str = ...) -> Manager:
+        """
+        Start the manager (or return the already started one) and discover the schemas.
+
+        Args:
+            discover (bool): Whether to discover the schemas found under the schemas path.
+            schemas_path (str): The path to the schemas (PHAISTOS__SCHEMA_PATH environment variable if not given).
+            cache_path (str): The directory of the persistent transpilation cache (PHAISTOS__CACHE_PATH environment variable if not given).
+                If neither is set, the discovered schemas are always parsed and compiled from scratch.
+            lazy (bool): Whether to only index the discovered schemas by name and transpile each of them on its first use.
+            preload (typing.Iterable[str]): The names of the schemas to be transpiled right away in the lazy mode.
+            compiled_package (str): The name of an importable package of schemas generated ahead of time (PHAISTOS__COMPILED_PACKAGE
+                environment variable if not given), whose modules are imported instead of discovering the schemas under the schemas path.
+
+        Returns:
+            Manager: The manager instance.
+        """
     @classmethod
     def _purge(cls) -> None: ...
     def __init__(self, discover: bool) -> None: ...
-    def get_factory(self, name: str) -> SchemaInstancesFactory:
+    def get_factory(self, name: str, version: str | None = ...) -> SchemaInstancesFactory:
         """
-        Get a schema factory by name
+        Get a schema factory by name (and version)
 
         Args:
             name (str): The name of the schema
+            version (str | None): The version of the schema (the latest one if not given)
 
         Returns:
             SchemaInstancesFactory: The schema factory, that can be used to validate data and create instances of the model
+
+        Raises:
+            SchemaLoadingException: If the schema (or the version of it) is not found
+        """
+    def get_versions(self, name: str) -> list[str]:
+        """
+        Get the loaded versions of a schema, from the oldest to the latest one
+
+        Args:
+            name (str): The name of the schema
+
+        Returns:
+            list[str]: The versions of the schema, in their natural order (e.g. v2 before v10)
+
+        Raises:
+            SchemaLoadingException: If the schema is not found
         """
     def get_available_schemas(self) -> dict[str, SchemaInstancesFactory]: ...
-    def __discover_schemas(self, target_path: str) -> list[type[TranspiledSchema]]: ...
-    def load_schema(self, schema: SchemaInputFile) -> str: ...
+    @classmethod
+    def get_discovery_report(cls) -> list[SchemaDiscoveryTiming]:
+        """
+        Get the timings of the last schema discovery, for each of the discovered schema files
+
+        Returns:
+            list[SchemaDiscoveryTiming]: The parse and transpile timings of the schema files, in the order of transpilation
+        """
+    def __discover_schemas(self, target_path: str) -> list[SchemaDiscoveryTiming]: ...
+    def __order_by_dependencies(self, parsed_schema_files: list[ParsedSchemaFile]) -> list[ParsedSchemaFile]: ...
+    @staticmethod
+    def __sort_schemas_by_references(schemas: dict[str, SchemaInputFile]) -> list[str]: ...
+    def __index_schemas(self, target_path: str) -> dict[str, str]: ...
+    def __index_compiled_package(self, package_name: str) -> dict[str, str]: ...
+    def __import_compiled_schema(self, name: str, module_path: str) -> None: ...
+    def __read_schema_file_state(self, schema_path: str) -> SchemaFileState: ...
+    @staticmethod
+    def __read_schema_file(schema_path: str) -> tuple[bytes, os.stat_result]: ...
+    def __load_indexed_schema(self, name: str) -> None: ...
+    def __find_schema_files(self, target_path: str) -> list[str]: ...
+    def __parse_schema_file(self, schema_path: str) -> ParsedSchemaFile: ...
+    def __parse_schema_content(self, schema_path: str, content: bytes, file_status: os.stat_result, parsing_start: float) -> ParsedSchemaFile: ...
+    @classmethod
+    def reload(cls) -> SchemaReloadResults:
+        """
+        Re-read the schemas path and re-transpile only the schemas whose files were added or changed
+        (judging by their modification times, sizes and content hashes), removing the schemas of the deleted files.
+
+        Each re-transpiled schema factory replaces the previous one in a single assignment,
+        so the validations already running against the previous version of a schema finish with it.
+        In the lazy mode, only the already loaded schemas are re-transpiled, the rest is just re-indexed.
+
+        Returns:
+            SchemaReloadResults: The names of the reloaded and removed schemas, and the paths of the files that failed to transpile.
+
+        Raises:
+            SchemaLoadingException: If the changed schemas would refer to each other in a cycle (directly or through
+                the unchanged schemas), in which case nothing is reloaded and the previous factories are kept.
+        """
+    def __parse_changed_schema_files(self, schema_paths: list[str], reload_results: SchemaReloadResults) -> list[ParsedSchemaFile]: ...
+    def __check_reference_cycles(self, changed_schema_files: list[ParsedSchemaFile], schema_paths: set[str]) -> None: ...
+    def __reload_schema_file(self, parsed_schema_file: ParsedSchemaFile, reload_results: SchemaReloadResults) -> None: ...
+    @classmethod
+    def watch(cls, interval: float = ...) -> None:
+        """
+        Start watching the schemas path, reloading the changed schemas every given number of seconds
+        in a background thread (see the reload method). The errors of a check are logged, and the watching goes on with the next one.
+
+        Args:
+            interval (float): The number of seconds between the checks of the schemas path.
+        """
+    @classmethod
+    def stop_watching(cls) -> None:
+        """
+        Stop watching the schemas path, if it is being watched.
+        """
+    def __parse_changed_schema_file(self, schema_path: str) -> ParsedSchemaFile | None: ...
+    def __reload_dependent_schemas(self, reload_results: SchemaReloadResults) -> None: ...
+    def __remove_schema(self, name: str, version: str) -> None: ...
+    @staticmethod
+    def __latest_version(versions: Iterable[str]) -> str: ...
+    def __register_factory(self, name: str, version: str, factory: SchemaInstancesFactory) -> None: ...
+    def __load_parsed_schema_file(self, parsed_schema_file: ParsedSchemaFile) -> None: ...
+    def load_schema(self, schema: SchemaInputFile) -> str:
+        """
+        Transpile a schema and register its factory under the schema name and version. The factory of the latest
+        version of a schema (in the natural order of the versions, e.g. v2 before v10) is the one returned by default.
+        The other schemas the schema refers to are resolved to the models of their latest versions (and loaded first,
+        in the lazy mode). The nested schemas and validators which have not changed between the versions are shared by them.
+
+        Args:
+            schema (SchemaInputFile): A parsed schema.
+
+        Returns:
+            str: The name of the loaded schema.
+
+        Raises:
+            SchemaLoadingException: If a referred schema is not found or the schemas refer to each other in a cycle.
+        """
+    def __resolve_reference(self, name: str) -> type[TranspiledSchema]: ...
@@ -0,0 +1,113 @@
+"""
+    Process pool validation engine.
+
+    Transpiled models are dynamic classes with validators created via exec, so they cannot
+    be pickled and sent to other processes. Instead, every worker process receives the raw
+    schema manifest once (when the pool starts), together with the manifests of the schemas
+    it refers to, and transpiles them locally - afterwards only the data entries and the
+    collected errors travel between the processes. The context of the validation call, if any,
+    is sent along with the manifests, so it has to be picklable.
+"""
+from __future__ import annotations
+import collections
+import concurrent.futures
+import itertools
+import logging
+import os
+import typing
+
+import phaistos.consts
+from phaistos.exceptions import FieldValidationErrorInfo, SchemaLoadingException
+from phaistos.schema import SchemaInstancesFactory, TranspiledSchema
+from phaistos.transpiler import Transpiler
+from phaistos.typings import BatchValidationResults, SchemaInputFile
+
+# The factory transpiled inside the worker process by the pool initializer
+_WORKER_FACTORY: SchemaInstancesFactory | None = None
+# The context of the validation call, merged over the schema context by the worker process
+_WORKER_CONTEXT: dict[str, typing.Any] | None = None
+
+
+def _initialize_worker(
+    schema: SchemaInputFile,
+    references: dict[str, SchemaInputFile],
+    context: dict[str, typing.Any] | None = None
+) -> None:
+    global _WORKER_FACTORY, _WORKER_CONTEXT  # pylint: disable=global-statement
+    phaistos.consts.COMPILATION_LOGGER.setLevel(logging.CRITICAL)
+    Transpiler.supress_logging()
+    # The referred schemas come in the order of their dependencies, so each one can be resolved when needed
+    referred_models: dict[str, type[TranspiledSchema]] = {}
+    with Transpiler.resolving_references(referred_models.__getitem__):
+        for referred_name, referred_schema in references.items():
+            referred_models[referred_name] = Transpiler.make_schema(referred_schema)
+        schema_class = Transpiler.make_schema(schema)
+    _WORKER_FACTORY = SchemaInstancesFactory(
+        name=schema_class.transpilation_name,
+        _model=schema_class,
+        source=schema,
+        references=references
+    )
+    _WORKER_CONTEXT = context
+
+
+def _validate_chunk(chunk: list[dict]) -> list[list[FieldValidationErrorInfo]]:
+    collect_errors = _WORKER_FACTORY._collect_errors  # type: ignore  # pylint: disable=protected-access
+    context = _WORKER_CONTEXT
+    return [
+        collect_errors(data, context)
+        for data in chunk
+    ]
+
+
+def validate_in_processes(
+    factory: SchemaInstancesFactory,
+    payloads: typing.Iterable[dict],
+    processes: int | None = None,
+    chunk_size: int = 1000,
+    context: dict[str, typing.Any] | None = None
+) -> BatchValidationResults:
+    """
+    Validate the given data entries against the schema of the factory in a pool of processes.
+    The chunks of entries are dispatched lazily, with at most two chunks per process in flight,
+    and the results are collected in the input order.
+
+    Args:
+        factory (SchemaInstancesFactory): The factory of the schema, which has to know its source manifest.
+        payloads (typing.Iterable[dict]): The data entries to validate.
+        processes (int | None): The number of worker processes (the number of CPUs if not given).
+        chunk_size (int): The number of entries sent to a worker at once.
+        context (dict[str, typing.Any] | None): The context to merge over the schema context for all entries of this call only,
+            sent to the worker processes when the pool starts.
+
+    Returns:
+        BatchValidationResults: The validity mask, errors and counts for the whole batch.
+    """
+    if factory.source is None:
+        raise SchemaLoadingException(
+            f'Schema {factory.name} has no source manifest to be transpiled in the worker processes'
+        )
+    if chunk_size < 1:
+        raise ValueError('Chunk size must be a positive integer')
+    workers = processes or os.cpu_count() or 1
+    results = BatchValidationResults(schema_source=factory._model.cached_json_schema)  # pylint: disable=protected-access
+    payloads_iterator = iter(payloads)
+    chunks = iter(lambda: list(itertools.islice(payloads_iterator, chunk_size)), [])
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(factory.source, factory.references, context)
+    ) as executor:
+        in_flight: collections.deque[concurrent.futures.Future] = collections.deque(
+            executor.submit(_validate_chunk, chunk)
+            for chunk in itertools.islice(chunks, 2 * workers)
+        )
+        while in_flight:
+            chunk_errors = in_flight.popleft().result()
+            if (next_chunk := next(chunks, None)) is not None:
+                in_flight.append(executor.submit(_validate_chunk, next_chunk))
+            for collected_errors in chunk_errors:
+                if collected_errors:
+                    results.errors[results.total] = collected_errors
+                results.mask.append(not collected_errors)
+    return results
@@ -0,0 +1,38 @@
+from typing import Any, Iterable
+
+from phaistos.exceptions import FieldValidationErrorInfo
+from phaistos.schema import SchemaInstancesFactory
+from phaistos.typings import BatchValidationResults, SchemaInputFile
+
+_WORKER_FACTORY: SchemaInstancesFactory | None
+_WORKER_CONTEXT: dict[str, Any] | None
+
+def _initialize_worker(
+    schema: SchemaInputFile,
+    references: dict[str, SchemaInputFile],
+    context: dict[str, Any] | None = ...
+) -> None: ...
+def _validate_chunk(chunk: list[dict]) -> list[list[FieldValidationErrorInfo]]: ...
+def validate_in_processes(
+    factory: SchemaInstancesFactory,
+    payloads: Iterable[dict],
+    processes: int | None = ...,
+    chunk_size: int = ...,
+    context: dict[str, Any] | None = ...
+) -> BatchValidationResults:
+    """
+    Validate the given data entries against the schema of the factory in a pool of processes.
+    The chunks of entries are dispatched lazily, with at most two chunks per process in flight,
+    and the results are collected in the input order.
+
+    Args:
+        factory (SchemaInstancesFactory): The factory of the schema, which has to know its source manifest.
+        payloads (typing.Iterable[dict]): The data entries to validate.
+        processes (int | None): The number of worker processes (the number of CPUs if not given).
+        chunk_size (int): The number of entries sent to a worker at once.
+        context (dict[str, typing.Any] | None): The context to merge over the schema context for all entries of this call only,
+            sent to the worker processes when the pool starts.
+
+    Returns:
+        BatchValidationResults: The validity mask, errors and counts for the whole batch.
+    """
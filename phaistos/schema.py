@@ -1,14 +1,94 @@
 from __future__ import annotations
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
 import copy
 import dataclasses
+import hashlib
+import inspect
+import itertools
+import json
+import os
 import typing
+import weakref
 
 import pydantic
 import pydantic.decorator
 import pydantic.typing
+import pydantic_core
 
-from phaistos.typings import TranspiledModelData, ValidationResults
-from phaistos.exceptions import FieldValidationErrorInfo
+from phaistos.typings import (
+    SchemaInputFile,
+    TranspiledModelData,
+    ValidationResults,
+    BatchValidationResults,
+    RecordValidationResults
+)
+from phaistos.cache import ValidationResultsCache
+from phaistos.consts import TRANSPILATION_ENVIRONMENT, VALIDATION_LOGGER
+from phaistos.exceptions import FieldValidationErrorInfo, SchemaLoadingException
+
+# Errors reported by the models validated within the current call, local to a thread (or an asyncio task)
+_VALIDATION_ERRORS: contextvars.ContextVar[list[FieldValidationErrorInfo] | None] = contextvars.ContextVar(
+    'phaistos_validation_errors',
+    default=None
+)
+
+
+@contextlib.contextmanager
+def validation_scope() -> typing.Generator[list[FieldValidationErrorInfo], None, None]:
+    """
+    Open a new scope, to which all transpiled models validated within it (including the nested ones)
+    report their errors. Scopes are bound to the current context, so concurrent validations
+    in different threads never see each other's errors.
+
+    Yields:
+        list[FieldValidationErrorInfo]: The list of errors collected within the scope.
+    """
+    collected_errors: list[FieldValidationErrorInfo] = []
+    token = _VALIDATION_ERRORS.set(collected_errors)
+    try:
+        yield collected_errors
+    finally:
+        _VALIDATION_ERRORS.reset(token)
+
+
+# Context merged over the schema context of the models validated within the current call
+_CONTEXT_OVERRIDES: contextvars.ContextVar[dict[str, typing.Any] | None] = contextvars.ContextVar(
+    'phaistos_context_overrides',
+    default=None
+)
+
+
+@contextlib.contextmanager
+def context_scope(context: dict[str, typing.Any] | None) -> typing.Generator[None, None, None]:
+    """
+    Open a new scope, within which the given context is merged over the context of every transpiled model
+    validated (including the nested ones), so that the same schema can be validated with different contexts
+    (e.g. per tenant) without being transpiled again. Nested scopes are merged over the outer ones.
+
+    Args:
+        context (dict[str, typing.Any] | None): The context to merge over the schema context (none if not given).
+    """
+    if not context:
+        yield
+        return
+    token = _CONTEXT_OVERRIDES.set({**(_CONTEXT_OVERRIDES.get() or {}), **context})
+    try:
+        yield
+    finally:
+        _CONTEXT_OVERRIDES.reset(token)
+
+
+async def _as_async_iterable(payloads: typing.AsyncIterable[dict] | typing.Iterable[dict]) -> typing.AsyncGenerator[dict, None]:
+    if isinstance(payloads, typing.AsyncIterable):
+        async for data in payloads:
+            yield data
+    else:
+        for data in payloads:
+            yield data
 
 
 # pylint: disable=unused-private-member
@@ -27,12 +107,101 @@ class TranspiledSchema(pydantic.BaseModel):
         list[FieldValidationErrorInfo]
     ] = []
     parent: typing.ClassVar[type[TranspiledSchema]]
+    _json_schema: typing.ClassVar[dict | None] = None
+    _fields_validator: typing.ClassVar[pydantic_core.SchemaValidator | None] = None
 
     # pylint: disable=protected-access
     @property
     def validation_errors(self) -> list[FieldValidationErrorInfo]:
         return self.parent._validation_errors
 
+    @classmethod
+    def cached_json_schema(cls) -> dict:
+        """
+        Return the JSON schema of the model, generating it only on the first call.
+        Every transpilation produces a new class, so reloading a schema starts with an empty cache.
+
+        Returns:
+            dict: The JSON schema of the model.
+        """
+        if cls.__dict__.get('_json_schema') is None:
+            cls._json_schema = cls.model_json_schema()
+        return cls._json_schema  # type: ignore
+
+    @classmethod
+    def validation_context(cls) -> dict[str, typing.Any]:
+        """
+        Return the context passed to the validators of the model: its schema context, with the context
+        of the current context scope (if any) merged over it.
+
+        Returns:
+            dict[str, typing.Any]: The validation context.
+        """
+        if (context_overrides := _CONTEXT_OVERRIDES.get()) is None:
+            return cls.context
+        return {**cls.context, **context_overrides}
+
+    @classmethod
+    def fields_validator(cls) -> pydantic_core.SchemaValidator | None:
+        """
+        Return a pydantic-core validator of the model fields only, built from the core schema of the model
+        on the first call. It validates the data exactly as the model does, but without allocating its instance.
+
+        Returns:
+            pydantic_core.SchemaValidator | None: The validator, or None if the core schema of the model
+                is not a plain model schema (in which case the model has to be instantiated to be validated).
+        """
+        if '_fields_validator' not in cls.__dict__:
+            if not cls.__pydantic_complete__:
+                # The models generated ahead of time defer building their core schemas until the first use
+                cls.model_rebuild()
+            core_schema: typing.Any = cls.__pydantic_core_schema__
+            model_schema = core_schema['schema'] if core_schema['type'] == 'definitions' else core_schema
+            fields_schema: typing.Any = None
+            if model_schema['type'] == 'model':
+                fields_schema = model_schema['schema'] if core_schema['type'] == 'model' else {
+                    **core_schema,
+                    'schema': model_schema['schema']
+                }
+            cls._fields_validator = pydantic_core.SchemaValidator(
+                fields_schema,
+                {**model_schema.get('config', {}), 'title': cls.__name__}
+            ) if fields_schema is not None else None
+        return cls._fields_validator
+
+    @classmethod
+    def validate_only(cls, data: dict[str, typing.Any] | None, raw: str | bytes | bytearray | None = None) -> None:
+        """
+        Validate the data (or a raw JSON document) against the model without instantiating it. The errors are collected
+        in the same way as in the constructor of the model, including the ones of the global validator.
+
+        Args:
+            data (dict[str, typing.Any] | None): The data to validate, if no raw JSON document is given.
+            raw (str | bytes | bytearray | None): The JSON document to validate, handed directly to the JSON parser of pydantic-core.
+        """
+        if raw is not None and (parsed_data := cls._parse_for_global_validator(raw)) is not None:
+            data, raw = parsed_data, None
+        if (fields_validator := cls.fields_validator()) is None:
+            if raw is None:
+                cls(**data)  # type: ignore
+            else:
+                cls.from_json(raw)
+            return
+        if (collected_errors := _VALIDATION_ERRORS.get()) is None:
+            with validation_scope() as collected_errors:
+                cls.validate_only(data, raw)
+            cls.parent._validation_errors = collected_errors
+            return
+        if data is not None:
+            cls._run_global_validator(data, collected_errors)
+        try:
+            if raw is None:
+                fields_validator.validate_python(data, context=cls.validation_context())
+            else:
+                fields_validator.validate_json(raw, context=cls.validation_context())
+        except pydantic.ValidationError as validation_error:
+            cls._report_validation_error(validation_error, collected_errors)
+
     # pylint: disable=protected-access
     @classmethod
     def compile(cls, model_data: TranspiledModelData) -> type[TranspiledSchema]:
@@ -48,13 +217,33 @@ class TranspiledSchema(pydantic.BaseModel):
             },
             **model_data['properties']
         )
-        schema.parent = model_data.get('parent') or copy.deepcopy(cls)
+        schema.parent = model_data.get('parent') or cls
         cls._rename_schema(schema, model_data['name'])
 
         schema.context = model_data.get('context', {})  # type: ignore
         schema.global_validator = model_data.get('global_validator')
         return schema
 
+    @classmethod
+    def renamed(cls, name: str) -> type[TranspiledSchema]:
+        """
+        Create a subclass of the model under another name, with the same fields, validators and context.
+        The validator functions are not compiled again, so it is cheaper than transpiling the same schema anew.
+
+        Args:
+            name (str): The name of the subclass.
+
+        Returns:
+            type[TranspiledSchema]: The renamed model.
+        """
+        schema: type[TranspiledSchema] = type(name, (cls,), {'__module__': cls.__module__})  # type: ignore
+        cls._rename_schema(schema, name)
+        schema.parent = schema
+        # Set on the subclass itself, as the generated modules read them from the class dictionaries
+        schema.context = cls.context
+        schema.global_validator = inspect.getattr_static(cls, 'global_validator')
+        return schema
+
     @classmethod
     def _rename_schema(cls, schema: type[TranspiledSchema], name: str) -> None:
         for field in ['__name__', '__qualname__', 'transpilation_name']:
@@ -68,34 +257,87 @@ class TranspiledSchema(pydantic.BaseModel):
             passed the context to the validator.
         """
         __tracebackhide__ = True
-        if self.parent.transpilation_name == self.transpilation_name:
-            self.parent._validation_errors = []
-        collected_errors: list[FieldValidationErrorInfo] = []
+        self._run_validators(data)
+
+    @classmethod
+    def from_json(cls, raw: str | bytes | bytearray) -> TranspiledSchema:
+        """
+        Validate a raw JSON document against the model, handing it directly to the JSON parser
+        of pydantic-core. Schemas with a global validator need the document as a dictionary,
+        so for them the document is parsed upfront by pydantic-core instead.
+
+        Args:
+            raw (str | bytes | bytearray): The JSON document to validate.
+
+        Returns:
+            TranspiledSchema: The (possibly invalid) model instance, with errors collected as in the constructor.
+        """
+        __tracebackhide__ = True
+        instance = cls.__new__(cls)
+        if (data := cls._parse_for_global_validator(raw)) is not None:
+            instance._run_validators(data)
+        else:
+            instance._run_validators(None, raw=raw)
+        return instance
+
+    @classmethod
+    def _parse_for_global_validator(cls, raw: str | bytes | bytearray) -> dict[str, typing.Any] | None:
+        # Schemas with a global validator need the document as a dictionary, so it is parsed upfront by pydantic-core
+        data = None
+        if cls.global_validator:
+            with contextlib.suppress(ValueError):
+                data = pydantic_core.from_json(raw)
+        return data if isinstance(data, dict) else None
+
+    def _run_validators(self, data: dict[str, typing.Any] | None, raw: str | bytes | bytearray | None = None) -> None:
+        __tracebackhide__ = True
+        if (collected_errors := _VALIDATION_ERRORS.get()) is None:
+            # A model constructed directly (not by a factory or a parent model) gets its own scope,
+            # and keeps its errors available via the validation_errors property
+            with validation_scope() as collected_errors:
+                self._run_validators(data, raw)
+            self.parent._validation_errors = collected_errors
+            return
+        if data is not None:
+            self._run_global_validator(data, collected_errors)
+        try:
+            if raw is None:
+                self.__pydantic_validator__.validate_python(
+                    data,
+                    self_instance=self,
+                    context=self.validation_context()
+                )
+            else:
+                self.__pydantic_validator__.validate_json(
+                    raw,
+                    self_instance=self,
+                    context=self.validation_context()
+                )
+        except pydantic.ValidationError as validation_error:
+            self._report_validation_error(validation_error, collected_errors)
+
+    @classmethod
+    def _run_global_validator(cls, data: dict[str, typing.Any], collected_errors: list[FieldValidationErrorInfo]) -> None:
         try:
-            if self.global_validator:
-                self.global_validator(data)  # type: ignore
+            if cls.global_validator:
+                cls.global_validator(data)  # type: ignore
         except Exception as validator_exception:  # pylint: disable=broad-except
             collected_errors.append(
                 FieldValidationErrorInfo(
-                    name=self.__class__.__name__,
+                    name=cls.__name__,
                     message=str(validator_exception)
                 )
             )
-        try:
-            self.__pydantic_validator__.validate_python(
-                data,
-                self_instance=self,
-                context=self.context
+
+    @staticmethod
+    def _report_validation_error(validation_error: pydantic.ValidationError, collected_errors: list[FieldValidationErrorInfo]) -> None:
+        collected_errors.extend([
+            FieldValidationErrorInfo(
+                name=str(error['loc'][0]) if error['loc'] else validation_error.title,
+                message=error['msg']
             )
-        except pydantic.ValidationError as validation_error:
-            collected_errors.extend([
-                FieldValidationErrorInfo(
-                    name=str(error['loc'][0]) if error['loc'] else validation_error.title,
-                    message=error['msg']
-                )
-                for error in validation_error.errors()
-            ])
-        self.parent._validation_errors += self._validation_errors + collected_errors
+            for error in validation_error.errors()
+        ])
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -106,32 +348,383 @@ class SchemaInstancesFactory:
     Attributes:
         name (str): The name of the schema.
         _model (type[TranspiledSchema]): The model of the schema, used for validation.
+        source (SchemaInputFile | None): The manifest the model was transpiled from, if known.
+        references (dict[str, SchemaInputFile]): The manifests of the schemas referred to by the schema (directly or not),
+            by their names, with each schema following the schemas it refers to.
+        result_cache (ValidationResultsCache | None): The cache of the validation results, if enabled (see the enable_cache method).
     """
     name: str
     _model: type[TranspiledSchema]
     errors: list[FieldValidationErrorInfo] = dataclasses.field(default_factory=list)
+    source: SchemaInputFile | None = dataclasses.field(default=None, repr=False)
+    references: dict[str, SchemaInputFile] = dataclasses.field(default_factory=dict, repr=False)
+    result_cache: ValidationResultsCache | None = dataclasses.field(default=None, repr=False)
+
+    _async_max_concurrency: typing.ClassVar[int] = 16
+    _async_executor: typing.ClassVar[concurrent.futures.Executor | None] = None
+    _async_limiters: typing.ClassVar[
+        weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]
+    ] = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def configure_async(cls, max_concurrency: int = 16, executor: concurrent.futures.Executor | None = None) -> None:
+        """
+        Configure how the asynchronous validation methods offload the work from the event loop.
+
+        Args:
+            max_concurrency (int): The maximum number of validations running at once (per event loop), shared by all factories.
+            executor (concurrent.futures.Executor | None): The executor to run the validations in (the loop default executor if not given).
+        """
+        if max_concurrency < 1:
+            raise ValueError('Maximum concurrency must be a positive integer')
+        cls._async_max_concurrency = max_concurrency
+        cls._async_executor = executor
+        cls._async_limiters = weakref.WeakKeyDictionary()
+
+    @property
+    def schema(self) -> dict:
+        """
+        The JSON schema of the underlying model, generated once and then cached (a copy of it is returned).
+        """
+        return copy.deepcopy(self._model.cached_json_schema())
 
-    def validate(self, data: dict) -> ValidationResults:
+    @property
+    def fingerprint(self) -> str:
+        """
+        The fingerprint of the schema manifest and the manifests of the schemas it refers to,
+        changing with any change of them (or of the Phaistos, pydantic or Python version).
+        """
+        if self.source is None:
+            raise SchemaLoadingException(f'Schema {self.name} has no source manifest to be fingerprinted')
+        canonical_form = json.dumps([self.source, self.references], sort_keys=True, default=repr)
+        content_hash = hashlib.sha256(canonical_form.encode())
+        content_hash.update(TRANSPILATION_ENVIRONMENT.encode())
+        return content_hash.hexdigest()
+
+    def enable_cache(self, max_size: int = 1024, ttl: float | None = None) -> None:
+        """
+        Enable caching the validation results of the payloads (and raw JSON documents), so that the ones
+        validated again unchanged are answered from the cache. The cache is emptied whenever the schema is reloaded.
+        Caching is not enabled for the schemas with validators declared as impure (`pure: false`), e.g. time-dependent ones.
+
+        Args:
+            max_size (int): The maximum number of cached results, the least recently used of which are evicted first.
+            ttl (float | None): The time to live of the cached results, in seconds (unlimited if not given).
+        """
+        if impure_validators := self._find_impure_validators():
+            VALIDATION_LOGGER.warning(
+                f'{self.name}: results are not cached, as the schema has impure validators: {", ".join(impure_validators)}'
+            )
+            self.result_cache = None
+            return
+        self.result_cache = ValidationResultsCache(
+            fingerprint=self.fingerprint,
+            max_size=max_size,
+            ttl=ttl
+        )
+
+    def disable_cache(self) -> None:
+        """
+        Disable caching the validation results, dropping the cached ones.
+        """
+        self.result_cache = None
+
+    def _find_impure_validators(self) -> list[str]:
+        impure_validators = []
+        schemas: list[typing.Mapping[str, typing.Any]] = [*self.references.values(), self.source or {}]
+        for schema in schemas:
+            # The validators of the schemas, their (nested) properties and definitions, by their paths
+            pending_blocks: list[tuple[str, typing.Any]] = [(schema.get('name', self.name), schema)]
+            while pending_blocks:
+                path, block = pending_blocks.pop()
+                if isinstance(validator := block.get('validator'), dict) and validator.get('pure', True) is False:
+                    impure_validators.append(path)
+                for key in ['properties', 'definitions']:
+                    pending_blocks.extend(
+                        (f'{path}.{name}', child)
+                        for name, child in block.get(key, {}).items()
+                        if isinstance(child, dict)
+                    )
+        return sorted(impure_validators)
+
+    def validator_cache_info(self) -> dict[str, typing.Any]:
+        """
+        Get the statistics of the memoized field validators (declared with `cache: true` or `cache_size`)
+        of the schema and its nested models.
+
+        Returns:
+            dict[str, typing.Any]: The hits, misses, maximum and current sizes of the memo of each memoized validator,
+                keyed by the model and the field name (e.g. `Person.name`).
+        """
+        cache_info = {}
+        pending_models = [self._model]
+        seen_models = set()
+        while pending_models:
+            if (model := pending_models.pop()) in seen_models:
+                continue
+            seen_models.add(model)
+            for decorator in model.__pydantic_decorators__.field_validators.values():
+                if (validator_cache_info := getattr(decorator.func, 'cache_info', None)) is not None:
+                    for field in decorator.info.fields:
+                        cache_info[f'{model.__name__}.{field}'] = validator_cache_info()
+            pending_annotations = [field_info.annotation for field_info in model.model_fields.values()]
+            while pending_annotations:
+                annotation = pending_annotations.pop()
+                if isinstance(annotation, type) and issubclass(annotation, TranspiledSchema):
+                    pending_models.append(annotation)
+                pending_annotations.extend(typing.get_args(annotation))
+        return cache_info
+
+    def validate(self, data: dict, context: dict[str, typing.Any] | None = None) -> ValidationResults:
         """
         Validate the given data against the schema. Do not return
         the validated data, only the validation results.
 
         Args:
             data (dict): The data to validate.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for this call only.
 
         Returns:
             ValidationResults: The validation results, including the schema, errors, and data.
         """
-        self._model(**data)
-        collected_errors = [
-            *set(self._model.parent._validation_errors)  # pylint: disable=protected-access
-        ]
+        collected_errors = self._collect_errors(data, context)
         self.errors = collected_errors
         return ValidationResults(
-            schema=self._model.model_json_schema(),
             errors=collected_errors,
-            data=data
+            data=data,
+            schema_source=self._model.cached_json_schema
         )
 
+    def validate_json(self, raw: str | bytes | bytearray | memoryview, context: dict[str, typing.Any] | None = None) -> ValidationResults:
+        """
+        Validate a raw JSON document against the schema, handing it directly to the JSON parser
+        of pydantic-core, without building its Python objects first. The field and model validators
+        of the schema are run as in the validate method.
+
+        Args:
+            raw (str | bytes | bytearray | memoryview): The JSON document to validate.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for this call only.
+
+        Returns:
+            ValidationResults: The validation results, with the errors and the schema (the data is not parsed, so it is left empty).
+        """
+        collected_errors = self._collect_json_errors(raw, context)
+        self.errors = collected_errors
+        return ValidationResults(
+            errors=collected_errors,
+            schema_source=self._model.cached_json_schema
+        )
+
+    def validate_many(
+        self,
+        payloads: typing.Iterable[dict],
+        chunk_size: int = 1000,
+        context: dict[str, typing.Any] | None = None
+    ) -> BatchValidationResults:
+        """
+        Validate an iterable of payloads against the schema. The per-record overhead of
+        the validate method (results and schema construction) is skipped and only the
+        errors of the invalid records are kept.
+
+        Args:
+            payloads (typing.Iterable[dict]): The data entries to validate.
+            chunk_size (int): The number of entries pulled from the iterable at once.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for all entries of this call only.
+
+        Returns:
+            BatchValidationResults: The validity mask, errors and counts for the whole batch.
+        """
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be a positive integer')
+        results = BatchValidationResults(schema_source=self._model.cached_json_schema)
+        collect_errors = self._collect_errors
+        mark_record = results.mask.append
+        payloads_iterator = iter(payloads)
+        index = 0
+        while chunk := list(itertools.islice(payloads_iterator, chunk_size)):
+            for data in chunk:
+                if collected_errors := collect_errors(data, context):
+                    results.errors[index] = collected_errors
+                mark_record(not collected_errors)
+                index += 1
+            VALIDATION_LOGGER.debug(f'{self.name}: validated {index} entries')
+        return results
+
+    def validate_stream(
+        self,
+        source: typing.IO | typing.Iterable[str | bytes | bytearray],
+        context: dict[str, typing.Any] | None = None
+    ) -> typing.Generator[RecordValidationResults, None, None]:
+        """
+        Lazily validate newline-delimited JSON (JSONL/NDJSON) records against the schema.
+        Each line is handed as-is to the pydantic-core JSON validator, so only one record
+        is kept in memory at a time. Blank lines are skipped.
+
+        Args:
+            source (typing.IO | typing.Iterable[str | bytes | bytearray]): An open (preferably binary) file or any iterable of lines.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for all records of this call only.
+
+        Yields:
+            RecordValidationResults: The validation results of each record, with its line number and byte offset.
+        """
+        collect_json_errors = self._collect_json_errors
+        offset = 0
+        for line_number, line in enumerate(source, start=1):
+            if line.strip():
+                yield RecordValidationResults(
+                    line=line_number,
+                    offset=offset,
+                    errors=collect_json_errors(line, context)
+                )
+            # The offsets are in bytes for the text streams too, so they can be used to seek in the file
+            offset += len(line.encode()) if isinstance(line, str) else len(line)
+
+    def validate_concurrently(
+        self,
+        payloads: typing.Iterable[dict],
+        max_workers: int | None = None,
+        chunk_size: int = 100,
+        context: dict[str, typing.Any] | None = None
+    ) -> list[ValidationResults]:
+        """
+        Validate the given data entries in a thread pool. Errors (and the context of the call) are scoped
+        to each validation, so a single factory can be shared by any number of threads.
+        The chunks of entries are taken from the payloads lazily, with at most two chunks per thread in flight.
+
+        Args:
+            payloads (typing.Iterable[dict]): The data entries to validate.
+            max_workers (int | None): The number of threads to use (the ThreadPoolExecutor default if not given).
+            chunk_size (int): The number of entries handed to a thread at once.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for all entries of this call only.
+
+        Returns:
+            list[ValidationResults]: The validation results, in the order of the given entries.
+        """
+        # The default number of threads of the ThreadPoolExecutor
+        workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        payloads_iterator = iter(payloads)
+        chunks = iter(lambda: list(itertools.islice(payloads_iterator, chunk_size)), [])
+        results: list[ValidationResults] = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix=f'phaistos-{self.name}'
+        ) as executor:
+            def submit(chunk: list[dict]) -> concurrent.futures.Future[list[ValidationResults]]:
+                return executor.submit(lambda: [self.validate(data, context) for data in chunk])
+
+            in_flight = collections.deque(submit(chunk) for chunk in itertools.islice(chunks, 2 * workers))
+            while in_flight:
+                chunk_results = in_flight.popleft().result()
+                if (next_chunk := next(chunks, None)) is not None:
+                    in_flight.append(submit(next_chunk))
+                results.extend(chunk_results)
+        return results
+
+    async def avalidate(self, data: dict, context: dict[str, typing.Any] | None = None) -> ValidationResults:
+        """
+        Validate the given data against the schema without blocking the event loop.
+        The validation runs in the configured executor, and waits for a free slot
+        if the configured number of validations is already running.
+
+        Args:
+            data (dict): The data to validate.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for this call only.
+
+        Returns:
+            ValidationResults: The validation results, including the schema, errors, and data.
+        """
+        loop = asyncio.get_running_loop()
+        if (limiter := self._async_limiters.get(loop)) is None:
+            limiter = self._async_limiters[loop] = asyncio.Semaphore(self._async_max_concurrency)
+        async with limiter:
+            return await loop.run_in_executor(self._async_executor, self.validate, data, context)
+
+    async def avalidate_stream(
+        self,
+        payloads: typing.AsyncIterable[dict] | typing.Iterable[dict],
+        context: dict[str, typing.Any] | None = None
+    ) -> typing.AsyncGenerator[ValidationResults, None]:
+        """
+        Validate the data entries of a (possibly asynchronous) iterable without blocking the event loop,
+        yielding the results in the input order. The next entry is pulled only when fewer
+        than the configured maximum concurrency of validations are in flight.
+
+        Args:
+            payloads (typing.AsyncIterable[dict] | typing.Iterable[dict]): The data entries to validate.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for all entries of this call only.
+
+        Yields:
+            ValidationResults: The validation results of each entry.
+        """
+        in_flight: collections.deque[asyncio.Task[ValidationResults]] = collections.deque()
+        try:
+            async for data in _as_async_iterable(payloads):
+                in_flight.append(asyncio.ensure_future(self.avalidate(data, context)))
+                if len(in_flight) >= self._async_max_concurrency:
+                    yield await in_flight.popleft()
+            while in_flight:
+                yield await in_flight.popleft()
+        finally:
+            for pending_validation in in_flight:
+                pending_validation.cancel()
+
+    def _collect_errors(self, data: dict, context: dict[str, typing.Any] | None = None) -> list[FieldValidationErrorInfo]:
+        if (result_cache := self.result_cache) is not None:
+            if (cached_errors := result_cache.get(cache_key := result_cache.key(data, context=context))) is not None:
+                return cached_errors
+        with validation_scope() as collected_errors, context_scope(context):
+            self._model.validate_only(data)
+        unique_errors = [*set(collected_errors)]
+        if result_cache is not None:
+            result_cache.put(cache_key, [*unique_errors])
+        return unique_errors
+
+    def _collect_json_errors(self, raw: str | bytes | bytearray | memoryview, context: dict[str, typing.Any] | None = None) -> list[FieldValidationErrorInfo]:
+        if (result_cache := self.result_cache) is not None:
+            if (cached_errors := result_cache.get(cache_key := result_cache.key(raw=raw, context=context))) is not None:
+                return cached_errors
+        with validation_scope() as collected_errors, context_scope(context):
+            # pydantic-core does not accept memoryviews, so they are copied only here, when the document is parsed
+            self._model.validate_only(None, bytes(raw) if isinstance(raw, memoryview) else raw)
+        unique_errors = [*set(collected_errors)]
+        if result_cache is not None:
+            result_cache.put(cache_key, [*unique_errors])
+        return unique_errors
+
+    def validate_and_build(
+        self,
+        data: dict[str, typing.Any],
+        context: dict[str, typing.Any] | None = None
+    ) -> tuple[TranspiledSchema | None, ValidationResults]:
+        """
+        Validate the given data against the schema and build the model instance in a single pass.
+
+        Args:
+            data (dict[str, typing.Any]): The data to validate.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for this call only.
+
+        Returns:
+            tuple[TranspiledSchema | None, ValidationResults]: The model instance (None if the data is invalid)
+                and the validation results.
+        """
+        with validation_scope() as collected_errors, context_scope(context):
+            instance = self._model(**data)
+        self.errors = [*set(collected_errors)]
+        results = ValidationResults(
+            errors=self.errors,
+            data=data,
+            schema_source=self._model.cached_json_schema
+        )
+        return (instance if results.valid else None), results
+
     def build(self, data: dict[str, typing.Any]) -> TranspiledSchema | None:
-        return self._model(**data) if self.validate(data).valid else None
+        """
+        Build the model instance from the given data, if it is valid against the schema.
+
+        Args:
+            data (dict[str, typing.Any]): The data to build the instance from.
+
+        Returns:
+            TranspiledSchema | None: The model instance, or None if the data is invalid.
+        """
+        return self.validate_and_build(data)[0]
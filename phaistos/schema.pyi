@@ -1,10 +1,36 @@
-from typing import Any, ClassVar
+import asyncio
+import concurrent.futures
+import weakref
+from typing import Any, AsyncGenerator, AsyncIterable, ClassVar, ContextManager, Generator, IO, Iterable
 
+import pydantic
 import pydantic._internal._decorators
 import pydantic.main
+import pydantic_core
 
+from phaistos.cache import ValidationResultsCache
 from phaistos.exceptions import FieldValidationErrorInfo
-from phaistos.typings import TranspiledModelData, ValidationResults
+from phaistos.typings import SchemaInputFile, TranspiledModelData, ValidationResults, BatchValidationResults, RecordValidationResults
+
+
+def validation_scope() -> ContextManager[list[FieldValidationErrorInfo]]:
+    """
+    Open a new scope, to which all transpiled models validated within it (including the nested ones)
+    report their errors. Scopes are bound to the current context, so concurrent validations
+    in different threads never see each other's errors.
+
+    Yields:
+        list[FieldValidationErrorInfo]: The list of errors collected within the scope.
+    """
+def context_scope(context: dict[str, Any] | None) -> ContextManager[None]:
+    """
+    Open a new scope, within which the given context is merged over the context of every transpiled model
+    validated (including the nested ones), so that the same schema can be validated with different contexts
+    (e.g. per tenant) without being transpiled again. Nested scopes are merged over the outer ones.
+
+    Args:
+        context (dict[str, typing.Any] | None): The context to merge over the schema context (none if not given).
+    """
 
 
 class TranspiledSchema(pydantic.main.BaseModel):
@@ -13,16 +39,88 @@ class TranspiledSchema(pydantic.main.BaseModel):
     context: ClassVar[dict]
     model_config: ClassVar[dict]
     model_computed_fields: ClassVar[dict]
+    _json_schema: ClassVar[dict | None]
+    _fields_validator: ClassVar[pydantic_core.SchemaValidator | None]
 
+    @classmethod
+    def cached_json_schema(cls) -> dict:
+        """
+        Return the JSON schema of the model, generating it only on the first call.
+        Every transpilation produces a new class, so reloading a schema starts with an empty cache.
+
+        Returns:
+            dict: The JSON schema of the model.
+        """
+    @classmethod
+    def validation_context(cls) -> dict[str, Any]:
+        """
+        Return the context passed to the validators of the model: its schema context, with the context
+        of the current context scope (if any) merged over it.
+
+        Returns:
+            dict[str, typing.Any]: The validation context.
+        """
+    @classmethod
+    def fields_validator(cls) -> pydantic_core.SchemaValidator | None:
+        """
+        Return a pydantic-core validator of the model fields only, built from the core schema of the model
+        on the first call. It validates the data exactly as the model does, but without allocating its instance.
+
+        Returns:
+            pydantic_core.SchemaValidator | None: The validator, or None if the core schema of the model
+                is not a plain model schema (in which case the model has to be instantiated to be validated).
+        """
+    @classmethod
+    def validate_only(cls, data: dict[str, Any] | None, raw: str | bytes | bytearray | None = ...) -> None:
+        """
+        Validate the data (or a raw JSON document) against the model without instantiating it. The errors are collected
+        in the same way as in the constructor of the model, including the ones of the global validator.
+
+        Args:
+            data (dict[str, typing.Any] | None): The data to validate, if no raw JSON document is given.
+            raw (str | bytes | bytearray | None): The JSON document to validate, handed directly to the JSON parser of pydantic-core.
+        """
     @classmethod
     def compile(cls, model_data: TranspiledModelData) -> type[TranspiledSchema]: ...
     @classmethod
+    def renamed(cls, name: str) -> type[TranspiledSchema]:
+        """
+        Create a subclass of the model under another name, with the same fields, validators and context.
+        The validator functions are not compiled again, so it is cheaper than transpiling the same schema anew.
+
+        Args:
+            name (str): The name of the subclass.
+
+        Returns:
+            type[TranspiledSchema]: The renamed model.
+        """
+    @classmethod
     def _rename_schema(cls, schema: type[TranspiledSchema], name: str) -> None: ...
     def __init__(self, **data) -> None:
         """
             A modified version of the Pydantic BaseModel __init__ method that
             passed the context to the validator.
         """
+    @classmethod
+    def from_json(cls, raw: str | bytes | bytearray) -> TranspiledSchema:
+        """
+        Validate a raw JSON document against the model, handing it directly to the JSON parser
+        of pydantic-core. Schemas with a global validator need the document as a dictionary,
+        so for them the document is parsed upfront by pydantic-core instead.
+
+        Args:
+            raw (str | bytes | bytearray): The JSON document to validate.
+
+        Returns:
+            TranspiledSchema: The (possibly invalid) model instance, with errors collected as in the constructor.
+        """
+    @classmethod
+    def _parse_for_global_validator(cls, raw: str | bytes | bytearray) -> dict[str, Any] | None: ...
+    def _run_validators(self, data: dict[str, Any] | None, raw: str | bytes | bytearray | None = ...) -> None: ...
+    @classmethod
+    def _run_global_validator(cls, data: dict[str, Any], collected_errors: list[FieldValidationErrorInfo]) -> None: ...
+    @staticmethod
+    def _report_validation_error(validation_error: pydantic.ValidationError, collected_errors: list[FieldValidationErrorInfo]) -> None: ...
     def model_post_init(self: pydantic.main.BaseModel, __context) -> None:
         """This function is meant to behave like a BaseModel method to initialise private attributes.
 
@@ -40,16 +138,195 @@ class SchemaInstancesFactory:
     name: str
     _model: type[TranspiledSchema]
     errors: list[FieldValidationErrorInfo]
+    source: SchemaInputFile | None
+    references: dict[str, SchemaInputFile]
+    result_cache: ValidationResultsCache | None
+    _async_max_concurrency: ClassVar[int]
+    _async_executor: ClassVar[concurrent.futures.Executor | None]
+    _async_limiters: ClassVar[weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]]
+
+    @classmethod
+    def configure_async(cls, max_concurrency: int = ..., executor: concurrent.futures.Executor | None = ...) -> None:
+        """
+        Configure how the asynchronous validation methods offload the work from the event loop.
+
+        Args:
+            max_concurrency (int): The maximum number of validations running at once (per event loop), shared by all factories.
+            executor (concurrent.futures.Executor | None): The executor to run the validations in (the loop default executor if not given).
+        """
+
+    @property
+    def schema(self) -> dict:
+        """
+        The JSON schema of the underlying model, generated once and then cached (a copy of it is returned).
+        """
+    @property
+    def fingerprint(self) -> str:
+        """
+        The fingerprint of the schema manifest and the manifests of the schemas it refers to,
+        changing with any change of them (or of the Phaistos, pydantic or Python version).
+        """
+    def enable_cache(self, max_size: int = ..., ttl: float | None = ...) -> None:
+        """
+        Enable caching the validation results of the payloads (and raw JSON documents), so that the ones
+        validated again unchanged are answered from the cache. The cache is emptied whenever the schema is reloaded.
+        Caching is not enabled for the schemas with validators declared as impure (`pure: false`), e.g. time-dependent ones.
+
+        Args:
+            max_size (int): The maximum number of cached results, the least recently used of which are evicted first.
+            ttl (float | None): The time to live of the cached results, in seconds (unlimited if not given).
+        """
+    def disable_cache(self) -> None:
+        """
+        Disable caching the validation results, dropping the cached ones.
+        """
+    def _find_impure_validators(self) -> list[str]: ...
+    def validator_cache_info(self) -> dict[str, Any]:
+        """
+        Get the statistics of the memoized field validators (declared with `cache: true` or `cache_size`)
+        of the schema and its nested models.
 
-    def validate(self, data: dict) -> ValidationResults:
+        Returns:
+            dict[str, typing.Any]: The hits, misses, maximum and current sizes of the memo of each memoized validator,
+                keyed by the model and the field name (e.g. `Person.name`).
+        """
+    def validate(self, data: dict, context: dict[str, Any] | None = ...) -> ValidationResults:
         """
         Validate the given data against the schema. Do not return
         the validated data, only the validation results.
 
         Args:
             data (dict): The data to validate.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for this call only.
 
         Returns:
             ValidationResults: The validation results, including the schema, errors, and data.
         """
-    def build(self, data: dict[str, Any]) -> TranspiledSchema | None: ...
+    def validate_json(self, raw: str | bytes | bytearray | memoryview, context: dict[str, Any] | None = ...) -> ValidationResults:
+        """
+        Validate a raw JSON document against the schema, handing it directly to the JSON parser
+        of pydantic-core, without building its Python objects first. The field and model validators
+        of the schema are run as in the validate method.
+
+        Args:
+            raw (str | bytes | bytearray | memoryview): The JSON document to validate.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for this call only.
+
+        Returns:
+            ValidationResults: The validation results, with the errors and the schema (the data is not parsed, so it is left empty).
+        """
+    def validate_many(
+        self,
+        payloads: Iterable[dict],
+        chunk_size: int = ...,
+        context: dict[str, Any] | None = ...
+    ) -> BatchValidationResults:
+        """
+        Validate an iterable of payloads against the schema. The per-record overhead of
+        the validate method (results and schema construction) is skipped and only the
+        errors of the invalid records are kept.
+
+        Args:
+            payloads (typing.Iterable[dict]): The data entries to validate.
+            chunk_size (int): The number of entries pulled from the iterable at once.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for all entries of this call only.
+
+        Returns:
+            BatchValidationResults: The validity mask, errors and counts for the whole batch.
+        """
+    def validate_stream(
+        self,
+        source: IO | Iterable[str | bytes | bytearray],
+        context: dict[str, Any] | None = ...
+    ) -> Generator[RecordValidationResults, None, None]:
+        """
+        Lazily validate newline-delimited JSON (JSONL/NDJSON) records against the schema.
+        Each line is handed as-is to the pydantic-core JSON validator, so only one record
+        is kept in memory at a time. Blank lines are skipped.
+
+        Args:
+            source (typing.IO | typing.Iterable[str | bytes | bytearray]): An open (preferably binary) file or any iterable of lines.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for all records of this call only.
+
+        Yields:
+            RecordValidationResults: The validation results of each record, with its line number and byte offset.
+        """
+    def validate_concurrently(
+        self,
+        payloads: Iterable[dict],
+        max_workers: int | None = ...,
+        chunk_size: int = ...,
+        context: dict[str, Any] | None = ...
+    ) -> list[ValidationResults]:
+        """
+        Validate the given data entries in a thread pool. Errors (and the context of the call) are scoped
+        to each validation, so a single factory can be shared by any number of threads.
+        The chunks of entries are taken from the payloads lazily, with at most two chunks per thread in flight.
+
+        Args:
+            payloads (typing.Iterable[dict]): The data entries to validate.
+            max_workers (int | None): The number of threads to use (the ThreadPoolExecutor default if not given).
+            chunk_size (int): The number of entries handed to a thread at once.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for all entries of this call only.
+
+        Returns:
+            list[ValidationResults]: The validation results, in the order of the given entries.
+        """
+    async def avalidate(self, data: dict, context: dict[str, Any] | None = ...) -> ValidationResults:
+        """
+        Validate the given data against the schema without blocking the event loop.
+        The validation runs in the configured executor, and waits for a free slot
+        if the configured number of validations is already running.
+
+        Args:
+            data (dict): The data to validate.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for this call only.
+
+        Returns:
+            ValidationResults: The validation results, including the schema, errors, and data.
+        """
+    def avalidate_stream(
+        self,
+        payloads: AsyncIterable[dict] | Iterable[dict],
+        context: dict[str, Any] | None = ...
+    ) -> AsyncGenerator[ValidationResults, None]:
+        """
+        Validate the data entries of a (possibly asynchronous) iterable without blocking the event loop,
+        yielding the results in the input order. The next entry is pulled only when fewer
+        than the configured maximum concurrency of validations are in flight.
+
+        Args:
+            payloads (typing.AsyncIterable[dict] | typing.Iterable[dict]): The data entries to validate.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for all entries of this call only.
+
+        Yields:
+            ValidationResults: The validation results of each entry.
+        """
+    def _collect_errors(self, data: dict, context: dict[str, Any] | None = ...) -> list[FieldValidationErrorInfo]: ...
+    def _collect_json_errors(self, raw: str | bytes | bytearray | memoryview, context: dict[str, Any] | None = ...) -> list[FieldValidationErrorInfo]: ...
+    def validate_and_build(
+        self,
+        data: dict[str, Any],
+        context: dict[str, Any] | None = ...
+    ) -> tuple[TranspiledSchema | None, ValidationResults]:
+        """
+        Validate the given data against the schema and build the model instance in a single pass.
+
+        Args:
+            data (dict[str, typing.Any]): The data to validate.
+            context (dict[str, typing.Any] | None): The context to merge over the schema context for this call only.
+
+        Returns:
+            tuple[TranspiledSchema | None, ValidationResults]: The model instance (None if the data is invalid)
+                and the validation results.
+        """
+    def build(self, data: dict[str, Any]) -> TranspiledSchema | None:
+        """
+        Build the model instance from the given data, if it is valid against the schema.
+
+        Args:
+            data (dict[str, typing.Any]): The data to build the instance from.
+
+        Returns:
+            TranspiledSchema | None: The model instance, or None if the data is invalid.
+        """
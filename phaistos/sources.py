@@ -9,12 +9,22 @@
     - FIELD_VALIDATOR_FUNCTION_SOURCE_TEMPLATE: A template to create a field validator function.
     - MODEL_VALIDATOR_FUNCTION_NAME: The name of the model validator function.
     - MODEL_VALIDATOR_FUNCTION_SOURCE_TEMPLATE: A template to create a model validator function.
-    - COLLECTION_VALIDATOR_TEMPLATE: A template to validate a collection type.
+    - BOUND_FIELD_VALIDATOR_FUNCTION_SOURCE_TEMPLATE: A field validator function template of the bound calling convention.
+    - BOUND_MODEL_VALIDATOR_FUNCTION_SOURCE_TEMPLATE: A model validator function template of the bound calling convention.
+    - FIELD_VALUE_BINDING_TEMPLATE: A template to expose the value of a field validator as a local named after the field.
+    - MODEL_VALUE_BINDING_TEMPLATE: A template to expose a value of the validated data as a local named after its field.
+    - OPTIONAL_VALUE_CHECK_TEMPLATE: A field validator check accepting None as it is, for the fields of optional types.
+    - NON_EMPTY_VALUE_CHECK_TEMPLATE: A field validator check rejecting empty values.
+    - NON_EMPTY_ITEMS_CHECK_TEMPLATE: A field validator check rejecting empty items, for the fields of collection types.
 
     The templates are used in the compiler to create the source code of the validator functions. The arguments passed to the validators are:
     - first_argument: The name of the first argument of the function (self or cls, depending which mode is used).
     - extra_arguments: Extra arguments that are passed to the function.
     - info: The info object that contains the field name and other information about the field (pydantic.ValidationInfo object with optional extra context)
+
+    The legacy templates copy the validated values and the logger into the globals of the validator module on each call,
+    while the bound ones get the logger bound to the module once, when the function is created, and the values exposed
+    as the function locals (the names of the fields are known at the compilation time, so the bindings are rendered into the source).
 """
 
 FIELD_VALIDATOR_VALUE_COPY_TEMPLATE = """
@@ -27,14 +37,28 @@ LOGGER_TEMPLATE = """
   globals()['logger'] = logging.getLogger('PHAISTOS (V)')
 """
 
+OPTIONAL_VALUE_CHECK_TEMPLATE = """
+  if value is None:
+    return value
+"""
+
+NON_EMPTY_VALUE_CHECK_TEMPLATE = """
+  if not value or value is None:
+    raise ValueError('Value cannot be empty')
+"""
+
+NON_EMPTY_ITEMS_CHECK_TEMPLATE = """
+  if not all(value):
+    raise ValueError('Items cannot be empty')
+"""
+
 FIELD_VALIDATOR_FUNCTION_NAME_TEMPLATE = '%s_validator'
 FIELD_VALIDATOR_FUNCTION_SOURCE_TEMPLATE = f"""
 %(decorator)s
 def %(name)s(%(first_argument)s, value, %(extra_arguments)s info):
 {LOGGER_TEMPLATE}
 {FIELD_VALIDATOR_VALUE_COPY_TEMPLATE}
-  if not value or value is None:
-    raise ValueError('Value cannot be empty')
+%(checks)s
   %(source)s
   return value
 """
@@ -51,10 +75,29 @@ def %(name)s(%(first_argument)s, %(extra_arguments)s info):
   return %(first_argument)s
 """
 
-COLLECTION_VALIDATOR_TEMPLATE = """
-for item in value:
-  if not item:
-    raise ValueError('Items in list cannot be empty')
-  if not isinstance(item, %s):
-    raise ValueError(f"Items in %s must be of type %s")
+FIELD_VALUE_BINDING_TEMPLATE = """
+  %(field)s = value
+"""
+
+MODEL_VALUE_BINDING_TEMPLATE = """
+  if '%(field)s' in info:
+    %(field)s = info['%(field)s']
+"""
+
+BOUND_FIELD_VALIDATOR_FUNCTION_SOURCE_TEMPLATE = """
+%(decorator)s
+def %(name)s(%(first_argument)s, value, %(extra_arguments)s info):
+%(bindings)s
+%(checks)s
+  %(source)s
+  return value
+"""
+
+BOUND_MODEL_VALIDATOR_FUNCTION_SOURCE_TEMPLATE = """
+import typing
+%(decorator)s
+def %(name)s(%(first_argument)s, %(extra_arguments)s info):
+%(bindings)s
+  %(source)s
+  return %(first_argument)s
 """
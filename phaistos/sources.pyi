@@ -1,7 +1,13 @@
 FIELD_VALIDATOR_VALUE_COPY_TEMPLATE: str
 LOGGER_TEMPLATE: str
+OPTIONAL_VALUE_CHECK_TEMPLATE: str
+NON_EMPTY_VALUE_CHECK_TEMPLATE: str
+NON_EMPTY_ITEMS_CHECK_TEMPLATE: str
 FIELD_VALIDATOR_FUNCTION_NAME_TEMPLATE: str
 FIELD_VALIDATOR_FUNCTION_SOURCE_TEMPLATE: str
 MODEL_VALIDATOR_FUNCTION_NAME: str
 MODEL_VALIDATOR_FUNCTION_SOURCE_TEMPLATE: str
-COLLECTION_VALIDATOR_TEMPLATE: str
+FIELD_VALUE_BINDING_TEMPLATE: str
+MODEL_VALUE_BINDING_TEMPLATE: str
+BOUND_FIELD_VALIDATOR_FUNCTION_SOURCE_TEMPLATE: str
+BOUND_MODEL_VALIDATOR_FUNCTION_SOURCE_TEMPLATE: str
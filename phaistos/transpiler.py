@@ -1,16 +1,21 @@
 # pylint: disable=protected-access, too-few-public-methods
 from __future__ import annotations
-import copy
+import contextlib
+import contextvars
 import dataclasses
+import hashlib
+import json
 import logging
-import pydoc
+import re
 import typing
+import weakref
 
 import phaistos.consts
 import phaistos.schema
 import phaistos.sources
 from phaistos.typings import (
     SchemaInputFile,
+    RawSchemaProperty,
     ParsedProperty,
     TranspiledProperty,
     TranspiledModelData,
@@ -19,12 +24,28 @@ from phaistos.typings import (
 )
 from phaistos.schema import TranspiledSchema
 from phaistos.compiler import ValidationFunctionsCompiler
+from phaistos.exceptions import SchemaLoadingException
+from phaistos.type_expressions import TypeExpressionParser, TypeRegistry
 import phaistos.utils
 
 
 @dataclasses.dataclass
 class Transpiler:
     _logger: typing.ClassVar[logging.Logger] = phaistos.consts.TRANSPILATION_LOGGER
+    # Nested schemas by their fingerprints, for as long as any of the transpiled schemas uses them
+    _interned_schemas: typing.ClassVar[
+        weakref.WeakValueDictionary[str, type[TranspiledSchema]]
+    ] = weakref.WeakValueDictionary()
+    # The resolver of the references to other schemas, and the definitions of the schema being transpiled
+    _reference_resolver: typing.ClassVar[
+        contextvars.ContextVar[typing.Callable[[str], type[TranspiledSchema]] | None]
+    ] = contextvars.ContextVar('phaistos_reference_resolver', default=None)
+    _definitions: typing.ClassVar[
+        contextvars.ContextVar[dict[str, RawSchemaProperty]]
+    ] = contextvars.ContextVar('phaistos_definitions', default={})
+    _expanded_definitions: typing.ClassVar[
+        contextvars.ContextVar[tuple[str, ...]]
+    ] = contextvars.ContextVar('phaistos_expanded_definitions', default=())
 
     def __post_init__(self) -> None:
         self._logger.info(f'{self.__class__.__name__} is a stateless interface, and instantiation is not necessary.')
@@ -56,20 +77,19 @@ class Transpiler:
         Returns:
             TranspiledProperty: A Pydantic model field.
         """
+        if phaistos.consts.REFERENCE_KEY in prop['data']:
+            return cls.make_reference(prop, owner)
         if 'properties' not in prop['data']:
-            adjusted_data = phaistos.utils.adjust_collection_type_property_entry(prop)
             return TranspiledProperty(
-                type=pydoc.locate(  # type: ignore
-                    path=str(
-                        adjusted_data['data'].get('type')
-                    )
+                type=TypeExpressionParser.parse(
+                    str(prop['data'].get('type'))
                 ),
-                default=adjusted_data['data'].get('default', ...),
-                validator=cls.make_validator(adjusted_data),
-                constraints=adjusted_data['data'].get('constraints', {})
+                default=prop['data'].get('default', ...),
+                validator=cls.make_validator(prop),
+                constraints=prop['data'].get('constraints', {})
             )
         return TranspiledProperty(
-            type=cls.make_schema(
+            type=cls.make_nested_schema(
                 schema={
                     'name': prop['name'],
                     'version': prop['data'].get('version', '...'),  # type: ignore
@@ -88,6 +108,177 @@ class Transpiler:
             constraints={}
         )
 
+    @classmethod
+    @contextlib.contextmanager
+    def resolving_references(
+        cls,
+        resolver: typing.Callable[[str], type[TranspiledSchema]]
+    ) -> typing.Generator[None, None, None]:
+        """
+        Resolve the references to other schemas (e.g. `$ref: Customer`) made by the schemas transpiled within the block.
+
+        Args:
+            resolver (typing.Callable[[str], type[TranspiledSchema]]): A function returning the already transpiled model
+                of a schema by its name, raising SchemaLoadingException if the schema cannot be resolved.
+        """
+        token = cls._reference_resolver.set(resolver)
+        try:
+            yield
+        finally:
+            cls._reference_resolver.reset(token)
+
+    @classmethod
+    def make_reference(cls, prop: ParsedProperty, owner: type[TranspiledSchema] | None = None) -> TranspiledProperty:
+        """
+        Transpile a property referring to a definition of the schema (`$ref: '#/definitions/Address'`)
+        or to another schema, by its name (`$ref: Customer`), into a Pydantic model field.
+
+        The definitions with properties are transpiled into models named after the definitions, shared
+        by all properties referring to them, while the other keys of the properties referring to definitions
+        of scalar fields (e.g. `default`) override the keys of the definitions. The other schemas are resolved
+        to their already transpiled models (see the resolving_references method).
+
+        Args:
+            prop (ParsedProperty): A property with the reference.
+            owner (type[TranspiledSchema] | None): The schema that owns the property.
+
+        Returns:
+            TranspiledProperty: A Pydantic model field.
+
+        Raises:
+            SchemaLoadingException: If the reference cannot be resolved or the definitions refer to each other in a cycle.
+        """
+        reference = str(prop['data'][phaistos.consts.REFERENCE_KEY])  # type: ignore
+        if reference.startswith(phaistos.consts.LOCAL_REFERENCE_PREFIX):
+            definition_name = reference.removeprefix(phaistos.consts.LOCAL_REFERENCE_PREFIX)
+            if (definition := cls._definitions.get().get(definition_name)) is None:
+                raise SchemaLoadingException(
+                    f'Definition {definition_name} referred to by {prop["name"]} not found'
+                )
+            expanded_definitions = cls._expanded_definitions.get()
+            if definition_name in expanded_definitions:
+                raise SchemaLoadingException(
+                    f'Circular definition references: {" -> ".join([*expanded_definitions, definition_name])}'
+                )
+            token = cls._expanded_definitions.set((*expanded_definitions, definition_name))
+            try:
+                if 'properties' in definition:
+                    return cls.make_property(ParsedProperty(name=definition_name, data=definition), owner)
+                return cls.make_property(
+                    ParsedProperty(
+                        name=prop['name'],
+                        data=definition | {  # type: ignore
+                            key: value
+                            for key, value in prop['data'].items()
+                            if key != phaistos.consts.REFERENCE_KEY
+                        }
+                    ),
+                    owner
+                )
+            finally:
+                cls._expanded_definitions.reset(token)
+        if (resolver := cls._reference_resolver.get()) is None:
+            raise SchemaLoadingException(
+                f'Schema {reference} referred to by {prop["name"]} can only be resolved when loaded by the manager'
+            )
+        return TranspiledProperty(
+            type=resolver(reference),
+            default=...,
+            validator=None,
+            constraints={}
+        )
+
+    @staticmethod
+    def find_references(schema: SchemaInputFile | RawSchemaProperty) -> list[str]:
+        """
+        Find the names of the other schemas referred to by a schema, in its properties (of any depth) and definitions.
+
+        Args:
+            schema (SchemaInputFile | RawSchemaProperty): A parsed schema.
+
+        Returns:
+            list[str]: The names of the referred schemas, in the order of their first appearance (in the properties, then the definitions).
+        """
+        references: dict[str, None] = {}
+        pending: list[typing.Any] = [schema]
+        while pending:
+            node = pending.pop()
+            reference = node.get(phaistos.consts.REFERENCE_KEY)
+            if isinstance(reference, str) and not reference.startswith(phaistos.consts.LOCAL_REFERENCE_PREFIX):
+                references[reference] = None
+            for section in ['definitions', 'properties']:
+                if isinstance(children := node.get(section), dict):
+                    pending.extend(
+                        child
+                        for child in reversed(children.values())
+                        if isinstance(child, dict)
+                    )
+        return [*references]
+
+    @classmethod
+    def make_nested_schema(cls, schema: SchemaInputFile, parent: type[TranspiledSchema] | None = None) -> type[TranspiledSchema]:
+        """
+        Transpile a nested schema into a Pydantic model, reusing the model of a structurally identical
+        nested schema (of any schema) that has been transpiled before, if it is still in use. A model transpiled
+        under another name is reused as a renamed subclass, so that each nested schema keeps its own name.
+        The nested schemas referring to other schemas are always transpiled anew, as the referred schemas can be reloaded.
+
+        Args:
+            schema (SchemaInputFile): A nested schema, with the name of the property it is defined under.
+            parent (type[TranspiledSchema] | None): The schema that owns the property.
+
+        Returns:
+            type[TranspiledSchema]: A Pydantic model class with the nested schema's properties.
+        """
+        if re.search(phaistos.consts.EXTERNAL_REFERENCE_REGEX, json.dumps([schema, cls._definitions.get()], default=repr)):
+            return cls.make_schema(schema, parent)
+        fingerprint = cls.fingerprint(schema)
+        named_fingerprint = f'{fingerprint}:{schema["name"]}'
+        if (interned_schema := cls._interned_schemas.get(named_fingerprint)) is not None:
+            cls._logger.info(f'Reusing transpiled nested schema: {schema["name"]}')
+            return interned_schema
+        if (structure_schema := cls._interned_schemas.get(fingerprint)) is not None:
+            cls._logger.info(f'Reusing transpiled nested schema {structure_schema.transpilation_name} as: {schema["name"]}')
+            nested_schema = structure_schema.renamed(schema['name'])
+        else:
+            # Transpiled as its own parent, so that sharing it never keeps the schema it was first transpiled for alive
+            nested_schema = cls._interned_schemas[fingerprint] = cls.make_schema(schema)
+        cls._interned_schemas[named_fingerprint] = nested_schema
+        return nested_schema
+
+    @classmethod
+    def fingerprint(cls, schema: SchemaInputFile) -> str:
+        """
+        Compute the fingerprint of the structure of a schema, equal for all schemas with the same properties,
+        validators and context (and the same definitions to refer to) transpiled in the same way,
+        regardless of their names and descriptions.
+
+        Args:
+            schema (SchemaInputFile): A parsed schema.
+
+        Returns:
+            str: The fingerprint of the schema.
+        """
+        canonical_form = json.dumps(
+            [
+                cls._structure(schema),
+                {name: cls._structure(definition) for name, definition in cls._definitions.get().items()},
+                ValidationFunctionsCompiler.calling_convention,
+                TypeRegistry.revision
+            ],
+            default=repr
+        )
+        return hashlib.sha256(canonical_form.encode()).hexdigest()
+
+    @classmethod
+    def _structure(cls, block: typing.Mapping[str, typing.Any]) -> dict[str, typing.Any]:
+        # The names, versions and descriptions of the schemas and their properties do not change how the data is validated
+        return {
+            key: {name: cls._structure(prop) for name, prop in value.items()} if key == 'properties' else value
+            for key, value in block.items()
+            if key not in {'name', 'version', 'description'}
+        }
+
     @classmethod
     def make_properties(cls, properties: list[ParsedProperty], properties_parent: type[TranspiledSchema]) -> TranspiledModelData:
         """
@@ -146,19 +337,28 @@ class Transpiler:
         _Schema.__name__ = schema['name']
         _Schema.__qualname__ = schema['name']
         _Schema.transpilation_name = schema['name']
+        # Nested schemas of any depth report their errors to the top-level schema
+        root = getattr(parent, 'parent', parent)
+        _Schema.parent = root or _Schema
 
-        transpilation = cls.make_properties(
-            properties=[
-                ParsedProperty(
-                    name=property_name,
-                    data=property_data
-                )
-                for property_name, property_data in schema['properties'].items()
-            ],
-            properties_parent=_Schema
-        )
+        # Only the top-level schema has the definitions, which are then visible to its nested schemas
+        definitions_token = cls._definitions.set(schema['definitions']) if 'definitions' in schema else None
+        try:
+            transpilation = cls.make_properties(
+                properties=[
+                    ParsedProperty(
+                        name=property_name,
+                        data=property_data
+                    )
+                    for property_name, property_data in schema['properties'].items()
+                ],
+                properties_parent=_Schema
+            )
+        finally:
+            if definitions_token is not None:
+                cls._definitions.reset(definitions_token)
 
-        transpilation['parent'] = parent
+        transpilation['parent'] = root
         transpilation['context'] = schema.get('context', {})  # type: ignore
 
         if 'validator' in schema:
@@ -168,7 +368,8 @@ class Transpiler:
                 'name': f'validate_{schema["name"].lower()}',
                 'decorator': '@classmethod',
                 'source': validator_source,
-                'kind': 'model'
+                'kind': 'model',
+                'fields': list(schema['properties'])
             })
             transpilation['global_validator'] = global_model_validator_function
 
@@ -1,11 +1,18 @@
+import contextvars
 import logging
-from typing import ClassVar
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, ClassVar, Generator, Mapping
 
 from phaistos.schema import TranspiledSchema
-from phaistos.typings import CompiledValidator, ParsedProperty, SchemaInputFile, TranspiledModelData, TranspiledProperty
+from phaistos.typings import CompiledValidator, ParsedProperty, RawSchemaProperty, SchemaInputFile, TranspiledModelData, TranspiledProperty
 
 class Transpiler:
     _logger: ClassVar[logging.Logger]
+    _interned_schemas: ClassVar[weakref.WeakValueDictionary[str, type[TranspiledSchema]]]
+    _reference_resolver: ClassVar[contextvars.ContextVar[Callable[[str], type[TranspiledSchema]] | None]]
+    _definitions: ClassVar[contextvars.ContextVar[dict[str, RawSchemaProperty]]]
+    _expanded_definitions: ClassVar[contextvars.ContextVar[tuple[str, ...]]]
 
     def __post_init__(self) -> None: ...
     @classmethod
@@ -31,6 +38,78 @@ class Transpiler:
             TranspiledProperty: A Pydantic model field.
         """
     @classmethod
+    @contextmanager
+    def resolving_references(cls, resolver: Callable[[str], type[TranspiledSchema]]) -> Generator[None, None, None]:
+        """
+        Resolve the references to other schemas (e.g. `$ref: Customer`) made by the schemas transpiled within the block.
+
+        Args:
+            resolver (typing.Callable[[str], type[TranspiledSchema]]): A function returning the already transpiled model
+                of a schema by its name, raising SchemaLoadingException if the schema cannot be resolved.
+        """
+    @classmethod
+    def make_reference(cls, prop: ParsedProperty, owner: type[TranspiledSchema] | None = ...) -> TranspiledProperty:
+        """
+        Transpile a property referring to a definition of the schema (`$ref: '#/definitions/Address'`)
+        or to another schema, by its name (`$ref: Customer`), into a Pydantic model field.
+
+        The definitions with properties are transpiled into models named after the definitions, shared
+        by all properties referring to them, while the other keys of the properties referring to definitions
+        of scalar fields (e.g. `default`) override the keys of the definitions. The other schemas are resolved
+        to their already transpiled models (see the resolving_references method).
+
+        Args:
+            prop (ParsedProperty): A property with the reference.
+            owner (type[TranspiledSchema] | None): The schema that owns the property.
+
+        Returns:
+            TranspiledProperty: A Pydantic model field.
+
+        Raises:
+            SchemaLoadingException: If the reference cannot be resolved or the definitions refer to each other in a cycle.
+        """
+    @staticmethod
+    def find_references(schema: SchemaInputFile | RawSchemaProperty) -> list[str]:
+        """
+        Find the names of the other schemas referred to by a schema, in its properties (of any depth) and definitions.
+
+        Args:
+            schema (SchemaInputFile | RawSchemaProperty): A parsed schema.
+
+        Returns:
+            list[str]: The names of the referred schemas, in the order of their first appearance (in the properties, then the definitions).
+        """
+    @classmethod
+    def make_nested_schema(cls, schema: SchemaInputFile, parent: type[TranspiledSchema] | None = ...) -> type[TranspiledSchema]:
+        """
+        Transpile a nested schema into a Pydantic model, reusing the model of a structurally identical
+        nested schema (of any schema) that has been transpiled before, if it is still in use. A model transpiled
+        under another name is reused as a renamed subclass, so that each nested schema keeps its own name.
+        The nested schemas referring to other schemas are always transpiled anew, as the referred schemas can be reloaded.
+
+        Args:
+            schema (SchemaInputFile): A nested schema, with the name of the property it is defined under.
+            parent (type[TranspiledSchema] | None): The schema that owns the property.
+
+        Returns:
+            type[TranspiledSchema]: A Pydantic model class with the nested schema's properties.
+        """
+    @classmethod
+    def fingerprint(cls, schema: SchemaInputFile) -> str:
+        """
+        Compute the fingerprint of the structure of a schema, equal for all schemas with the same properties,
+        validators and context (and the same definitions to refer to) transpiled in the same way,
+        regardless of their names and descriptions.
+
+        Args:
+            schema (SchemaInputFile): A parsed schema.
+
+        Returns:
+            str: The fingerprint of the schema.
+        """
+    @classmethod
+    def _structure(cls, block: Mapping[str, Any]) -> dict[str, Any]: ...
+    @classmethod
     def make_properties(cls, properties: list[ParsedProperty], properties_parent: type[TranspiledSchema]) -> TranspiledModelData:
         """
         Method to read a list of properties and transpile them into a Pydantic model fields.
@@ -0,0 +1,367 @@
+from __future__ import annotations
+import builtins
+import datetime
+import decimal
+import ipaddress
+import pathlib
+import pydoc
+import re
+import types
+import typing
+import uuid
+
+import annotated_types
+import pydantic
+import pydantic_core
+
+import phaistos.consts
+from phaistos.exceptions import IncorrectFieldTypeError
+
+
+class TypeRegistry:
+    """
+    Registry of the types that can be used in the field type expressions, resolving their names with a single lookup.
+
+    It is populated at the import with the builtin types, the date and time types, `Decimal`, `UUID`, `Path`,
+    the IP address, network and interface types and the URL types of Pydantic, available both under their bare
+    names (e.g. `datetime`, `IPv4Address`, `HttpUrl`) and their qualified names (e.g. `datetime.datetime`).
+    Other types can be registered with the `register` method.
+    """
+    _types: typing.ClassVar[dict[str, typing.Any]] = {}
+    _locate_fallback: typing.ClassVar[bool] = False
+    # Incremented on each registration, so that the schemas transpiled before can be told apart
+    revision: typing.ClassVar[int] = 0
+
+    @classmethod
+    def register(cls, name: str, registered_type: typing.Any) -> None:
+        """
+        Register a type under a name, that can be then used in the field type expressions.
+
+        Args:
+            name (str): The name of the type in the type expressions (e.g. `Money` or `my_module.Money`).
+            registered_type (typing.Any): The type (or an annotation, e.g. `typing.Annotated[...]`) that pydantic can validate.
+        """
+        cls._types[name] = registered_type
+        cls.revision += 1
+        # The already parsed expressions could refer to the previously registered type of the same name
+        TypeExpressionParser._parsed.clear()  # pylint: disable=protected-access
+
+    @classmethod
+    def allow_locate_fallback(cls, allowed: bool = True) -> None:
+        """
+        Allow resolving the types, that are not registered, by importing them by their dotted paths with `pydoc.locate`.
+        This is disabled by default, as it is slow and can import arbitrary modules named in the schema manifests.
+
+        Args:
+            allowed (bool): Whether the fallback is allowed.
+        """
+        cls._locate_fallback = allowed
+
+    @classmethod
+    def resolve(cls, name: str) -> typing.Any:
+        """
+        Resolve a type by its name.
+
+        Args:
+            name (str): The name of the type.
+
+        Returns:
+            typing.Any: The registered type.
+
+        Raises:
+            IncorrectFieldTypeError: If the type is not registered (and could not be located, if the fallback is allowed).
+        """
+        if (resolved_type := cls._types.get(name)) is not None:
+            return resolved_type
+        if cls._locate_fallback and isinstance(located_type := pydoc.locate(name), type):
+            cls._types[name] = located_type
+            return located_type
+        raise IncorrectFieldTypeError(name)
+
+    @classmethod
+    def registered_names(cls) -> list[str]:
+        """
+        Get the names of all registered types.
+
+        Returns:
+            list[str]: The names of the registered types.
+        """
+        return [*cls._types]
+
+
+class TypeExpressionParser:
+    """
+    Parser of the field type expressions used in the schema manifests (e.g. `list[int]`, `dict[str, float]`,
+    `tuple[int, ...]`, `list[list[int]]` or `int | None`), turning them into type annotations
+    that are validated natively by pydantic-core.
+
+    Every value in a field (the field value itself and each item, key or value of its collections)
+    has to be non-empty, i.e. truthy, unless it is an explicitly allowed None. This is expressed with
+    the native length constraint for sized types and with a truthiness check for the other types,
+    that can be falsy at all (failing with the same `Value cannot be empty` error as the field validators).
+    The items of collections of the basic scalar types (but not the keys of dictionaries, which are strings in JSON)
+    are validated strictly, without type coercion.
+    """
+    _parsed: typing.ClassVar[dict[str, typing.Any]] = {}
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self.tokens = [
+            token.group().strip()
+            for token in re.finditer(phaistos.consts.TYPE_EXPRESSION_TOKEN_REGEX, expression)
+        ]
+        if ''.join(self.tokens) != re.sub(r'\s', '', expression):
+            raise IncorrectFieldTypeError(expression)
+        self.position = 0
+
+    @classmethod
+    def parse(cls, expression: str) -> typing.Any:
+        """
+        Parse a type expression into a type annotation (the parsed annotations are reused for the same expressions).
+
+        Args:
+            expression (str): The type expression from the schema manifest.
+
+        Returns:
+            typing.Any: The type annotation with the non-empty constraints applied.
+
+        Raises:
+            IncorrectFieldTypeError: If the expression is malformed or refers to a type that is not known or allowed.
+        """
+        if (annotation := cls._parsed.get(expression)) is None:
+            parser = cls(expression)
+            annotation = parser._finalize(parser._parse_union(strict=False))
+            if parser.position != len(parser.tokens):
+                raise IncorrectFieldTypeError(expression)
+            cls._parsed[expression] = annotation
+        return annotation
+
+    @staticmethod
+    def allows_none(annotation: typing.Any) -> bool:
+        """
+        Check whether a parsed type annotation allows None (e.g. `Optional[int]` or `list[int] | None`).
+
+        Args:
+            annotation (typing.Any): The type annotation.
+
+        Returns:
+            bool: Whether None is a valid value of the annotation.
+        """
+        return annotation is types.NoneType \
+            or typing.get_origin(annotation) is typing.Union and types.NoneType in typing.get_args(annotation)
+
+    @staticmethod
+    def has_non_empty_items(annotation: typing.Any) -> bool:
+        """
+        Check whether all values of a parsed type annotation, other than None, are collections whose items
+        (or keys, for dictionaries) cannot be empty, None included (e.g. `list[int]` or `dict[str, int] | None`, but not `list[int | None]`).
+
+        Args:
+            annotation (typing.Any): The type annotation.
+
+        Returns:
+            bool: Whether all items of the values of the annotation have to be truthy.
+        """
+        members = TypeExpressionParser._members(annotation)
+        for member in members:
+            collection = member.__origin__ if typing.get_origin(member) is typing.Annotated else None
+            if (collection_type := typing.get_origin(collection)) not in {list, set, frozenset, tuple, dict}:
+                return False
+            items = typing.get_args(collection)[:1] if collection_type is dict else typing.get_args(collection)
+            if any(TypeExpressionParser.allows_none(item) for item in items):
+                return False
+        return bool(members)
+
+    @staticmethod
+    def checks_non_empty(annotation: typing.Any) -> bool:
+        """
+        Check whether the constraints of a parsed type annotation already reject the empty values
+        of all its members, other than None (e.g. `str`, `int` or `list[int] | None`).
+
+        Args:
+            annotation (typing.Any): The type annotation.
+
+        Returns:
+            bool: Whether the empty values are rejected by the annotation itself.
+        """
+        members = TypeExpressionParser._members(annotation)
+        return bool(members) and all(TypeExpressionParser._is_checked_non_empty(member) for member in members)
+
+    @staticmethod
+    def checks_non_empty_items(annotation: typing.Any) -> bool:
+        """
+        Check whether the constraints of a parsed type annotation already reject the empty items (or keys, for dictionaries)
+        of all its members, other than None, which have to be collections (e.g. `list[int]` or `dict[str, int] | None`).
+
+        Args:
+            annotation (typing.Any): The type annotation.
+
+        Returns:
+            bool: Whether the empty items are rejected by the annotation itself.
+        """
+        members = TypeExpressionParser._members(annotation)
+        for member in members:
+            if typing.get_origin(member) is not typing.Annotated:
+                return False
+            if any(getattr(constraint, 'func', None) is non_empty_items for constraint in member.__metadata__):
+                continue
+            collection = member.__origin__
+            if (collection_type := typing.get_origin(collection)) not in {list, set, frozenset, tuple, dict}:
+                return False
+            items = typing.get_args(collection)[:1] if collection_type is dict else typing.get_args(collection)
+            if not all(item is Ellipsis or TypeExpressionParser._is_checked_non_empty(item) for item in items):
+                return False
+        return bool(members)
+
+    @staticmethod
+    def _members(annotation: typing.Any) -> list[typing.Any]:
+        return [
+            member
+            for member in (typing.get_args(annotation) if typing.get_origin(annotation) is typing.Union else [annotation])
+            if member is not types.NoneType
+        ]
+
+    @staticmethod
+    def _is_checked_non_empty(annotation: typing.Any) -> bool:
+        if typing.get_origin(annotation) is not typing.Annotated:
+            return False
+        for constraint in annotation.__metadata__:
+            if isinstance(constraint, annotated_types.MinLen) and constraint.min_length > 0:
+                return True
+            if getattr(constraint, 'func', None) is non_empty:
+                return True
+        return False
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _expect(self, token: str) -> None:
+        if self._peek() != token:
+            raise IncorrectFieldTypeError(self.expression)
+        self.position += 1
+
+    def _parse_union(self, strict: bool) -> typing.Any:
+        members = [self._parse_type(strict)]
+        while self._peek() == '|':
+            self.position += 1
+            members.append(self._parse_type(strict))
+        if len(members) == 1:
+            return members[0]
+        return typing.Union[tuple(self._finalize(member) for member in members)]  # type: ignore
+
+    def _parse_type(self, strict: bool) -> typing.Any:
+        name = self._peek()
+        if name is None or name in phaistos.consts.TYPE_EXPRESSION_SYMBOLS:
+            raise IncorrectFieldTypeError(self.expression)
+        self.position += 1
+        if name == 'None':
+            return types.NoneType
+        if self._peek() != '[':
+            resolved_type = TypeRegistry.resolve(name)
+            return _ScalarType(resolved_type, strict and resolved_type in phaistos.consts.STRICT_ITEM_TYPES)
+        self.position += 1
+        if name not in phaistos.consts.TYPE_EXPRESSION_GENERICS:
+            raise IncorrectFieldTypeError(name)
+        # The members of unions are as strict as the union itself, the items of collections are always strict
+        items_strict = strict if name in {'Optional', 'Union'} else True
+        arguments = [self._parse_union(strict=items_strict and name != 'dict')]
+        while self._peek() == ',':
+            self.position += 1
+            if self._peek() == '...':
+                self.position += 1
+                arguments.append(Ellipsis)
+            else:
+                arguments.append(self._parse_union(strict=items_strict))
+        self._expect(']')
+        return self._make_generic(name, arguments)
+
+    def _make_generic(self, name: str, arguments: list[typing.Any]) -> typing.Any:
+        arity = phaistos.consts.TYPE_EXPRESSION_GENERICS[name]
+        if Ellipsis in arguments and (name != 'tuple' or len(arguments) != 2 or arguments[0] is Ellipsis):
+            raise IncorrectFieldTypeError(self.expression)
+        if arity is not None and len(arguments) != arity:
+            raise IncorrectFieldTypeError(self.expression)
+        if name in {'Optional', 'Union'}:
+            members = [*arguments, types.NoneType] if name == 'Optional' else arguments
+            return typing.Union[tuple(self._finalize(member) for member in members)]  # type: ignore
+
+        # Checking the truthiness of each scalar item would mean a Python call per item, so it is done
+        # for the whole collection at once, with a single call of a builtin iterating over it in C
+        metadata: list[typing.Any] = [annotated_types.MinLen(1)]
+        if name == 'dict':
+            if self._is_falsy_scalar(arguments[0]):
+                metadata.append(pydantic.AfterValidator(non_empty_items))
+            if self._is_falsy_scalar(arguments[1]):
+                metadata.append(pydantic.AfterValidator(non_empty_values))
+        elif any(self._is_falsy_scalar(argument) for argument in arguments):
+            metadata.append(pydantic.AfterValidator(non_empty_items))
+        items = tuple(
+            argument if argument is Ellipsis else self._finalize(argument, checked_by_owner=True)
+            for argument in arguments
+        )
+        generics: dict[str, typing.Any] = {
+            'list': list,
+            'set': set,
+            'frozenset': frozenset,
+            'tuple': tuple,
+            'dict': dict,
+        }
+        generic = generics[name][items if len(items) > 1 else items[0]]
+        return typing.Annotated[generic, *metadata]
+
+    @staticmethod
+    def _is_falsy_scalar(argument: typing.Any) -> bool:
+        return isinstance(argument, _ScalarType) \
+            and not hasattr(argument.type, '__len__') \
+            and hasattr(argument.type, '__bool__')
+
+    @classmethod
+    def _finalize(cls, argument: typing.Any, checked_by_owner: bool = False) -> typing.Any:
+        if not isinstance(argument, _ScalarType):
+            return argument
+        metadata: list[typing.Any] = [pydantic.Strict()] if argument.strict else []
+        if hasattr(argument.type, '__len__'):
+            metadata.append(annotated_types.MinLen(1))
+        elif cls._is_falsy_scalar(argument) and not checked_by_owner:
+            metadata.append(pydantic.AfterValidator(non_empty))
+        return typing.Annotated[argument.type, *metadata] if metadata else argument.type
+
+
+class _ScalarType(typing.NamedTuple):
+    type: typing.Any
+    strict: bool
+
+
+def non_empty(value: typing.Any) -> typing.Any:
+    if not value:
+        raise pydantic_core.PydanticCustomError('non_empty', 'Value cannot be empty')
+    return value
+
+
+def non_empty_items(collection: typing.Iterable) -> typing.Any:
+    if not all(collection):
+        raise pydantic_core.PydanticCustomError('non_empty_items', 'Items cannot be empty')
+    return collection
+
+
+def non_empty_values(mapping: typing.Mapping) -> typing.Any:
+    if not all(mapping.values()):
+        raise pydantic_core.PydanticCustomError('non_empty_values', 'Values cannot be empty')
+    return mapping
+
+
+# The registry is populated once, at the import, so resolving a type is a single dictionary lookup
+TypeRegistry._types.update({  # pylint: disable=protected-access
+    registered_name: getattr(module, type_name)
+    for module, type_names in {
+        builtins: ['str', 'int', 'float', 'bool', 'bytes', 'bytearray', 'complex', 'list', 'set', 'frozenset', 'tuple', 'dict'],
+        datetime: ['datetime', 'date', 'time', 'timedelta'],
+        decimal: ['Decimal'],
+        uuid: ['UUID'],
+        pathlib: ['Path'],
+        ipaddress: ['IPv4Address', 'IPv6Address', 'IPv4Network', 'IPv6Network', 'IPv4Interface', 'IPv6Interface'],
+        pydantic: ['AnyUrl', 'AnyHttpUrl', 'HttpUrl', 'FileUrl', 'IPvAnyAddress', 'IPvAnyNetwork', 'IPvAnyInterface'],
+    }.items()
+    for type_name in type_names
+    for registered_name in [type_name, f'{module.__name__}.{type_name}']
+})
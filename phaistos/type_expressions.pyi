@@ -0,0 +1,161 @@
+import typing
+
+
+class TypeRegistry:
+    """
+    Registry of the types that can be used in the field type expressions, resolving their names with a single lookup.
+
+    It is populated at the import with the builtin types, the date and time types, `Decimal`, `UUID`, `Path`,
+    the IP address, network and interface types and the URL types of Pydantic, available both under their bare
+    names (e.g. `datetime`, `IPv4Address`, `HttpUrl`) and their qualified names (e.g. `datetime.datetime`).
+    Other types can be registered with the `register` method.
+    """
+    _types: typing.ClassVar[dict[str, typing.Any]]
+    _locate_fallback: typing.ClassVar[bool]
+    revision: typing.ClassVar[int]
+
+    @classmethod
+    def register(cls, name: str, registered_type: typing.Any) -> None:
+        """
+        Register a type under a name, that can be then used in the field type expressions.
+
+        Args:
+            name (str): The name of the type in the type expressions (e.g. `Money` or `my_module.Money`).
+            registered_type (typing.Any): The type (or an annotation, e.g. `typing.Annotated[...]`) that pydantic can validate.
+        """
+    @classmethod
+    def allow_locate_fallback(cls, allowed: bool = ...) -> None:
+        """
+        Allow resolving the types, that are not registered, by importing them by their dotted paths with `pydoc.locate`.
+        This is disabled by default, as it is slow and can import arbitrary modules named in the schema manifests.
+
+        Args:
+            allowed (bool): Whether the fallback is allowed.
+        """
+    @classmethod
+    def resolve(cls, name: str) -> typing.Any:
+        """
+        Resolve a type by its name.
+
+        Args:
+            name (str): The name of the type.
+
+        Returns:
+            typing.Any: The registered type.
+
+        Raises:
+            IncorrectFieldTypeError: If the type is not registered (and could not be located, if the fallback is allowed).
+        """
+    @classmethod
+    def registered_names(cls) -> list[str]:
+        """
+        Get the names of all registered types.
+
+        Returns:
+            list[str]: The names of the registered types.
+        """
+
+
+class TypeExpressionParser:
+    """
+    Parser of the field type expressions used in the schema manifests (e.g. `list[int]`, `dict[str, float]`,
+    `tuple[int, ...]`, `list[list[int]]` or `int | None`), turning them into type annotations
+    that are validated natively by pydantic-core.
+
+    Every value in a field (the field value itself and each item, key or value of its collections)
+    has to be non-empty, i.e. truthy, unless it is an explicitly allowed None. This is expressed with
+    the native length constraint for sized types and with a truthiness check for the other types,
+    that can be falsy at all (failing with the same `Value cannot be empty` error as the field validators).
+    The items of collections of the basic scalar types (but not the keys of dictionaries, which are strings in JSON)
+    are validated strictly, without type coercion.
+    """
+    _parsed: typing.ClassVar[dict[str, typing.Any]]
+    expression: str
+    tokens: list[str]
+    position: int
+
+    def __init__(self, expression: str) -> None: ...
+    @classmethod
+    def parse(cls, expression: str) -> typing.Any:
+        """
+        Parse a type expression into a type annotation (the parsed annotations are reused for the same expressions).
+
+        Args:
+            expression (str): The type expression from the schema manifest.
+
+        Returns:
+            typing.Any: The type annotation with the non-empty constraints applied.
+
+        Raises:
+            IncorrectFieldTypeError: If the expression is malformed or refers to a type that is not known or allowed.
+        """
+    @staticmethod
+    def allows_none(annotation: typing.Any) -> bool:
+        """
+        Check whether a parsed type annotation allows None (e.g. `Optional[int]` or `list[int] | None`).
+
+        Args:
+            annotation (typing.Any): The type annotation.
+
+        Returns:
+            bool: Whether None is a valid value of the annotation.
+        """
+    @staticmethod
+    def has_non_empty_items(annotation: typing.Any) -> bool:
+        """
+        Check whether all values of a parsed type annotation, other than None, are collections whose items
+        (or keys, for dictionaries) cannot be empty, None included (e.g. `list[int]` or `dict[str, int] | None`, but not `list[int | None]`).
+
+        Args:
+            annotation (typing.Any): The type annotation.
+
+        Returns:
+            bool: Whether all items of the values of the annotation have to be truthy.
+        """
+    @staticmethod
+    def checks_non_empty(annotation: typing.Any) -> bool:
+        """
+        Check whether the constraints of a parsed type annotation already reject the empty values
+        of all its members, other than None (e.g. `str`, `int` or `list[int] | None`).
+
+        Args:
+            annotation (typing.Any): The type annotation.
+
+        Returns:
+            bool: Whether the empty values are rejected by the annotation itself.
+        """
+    @staticmethod
+    def checks_non_empty_items(annotation: typing.Any) -> bool:
+        """
+        Check whether the constraints of a parsed type annotation already reject the empty items (or keys, for dictionaries)
+        of all its members, other than None, which have to be collections (e.g. `list[int]` or `dict[str, int] | None`).
+
+        Args:
+            annotation (typing.Any): The type annotation.
+
+        Returns:
+            bool: Whether the empty items are rejected by the annotation itself.
+        """
+    @staticmethod
+    def _members(annotation: typing.Any) -> list[typing.Any]: ...
+    @staticmethod
+    def _is_checked_non_empty(annotation: typing.Any) -> bool: ...
+    def _peek(self) -> str | None: ...
+    def _expect(self, token: str) -> None: ...
+    def _parse_union(self, strict: bool) -> typing.Any: ...
+    def _parse_type(self, strict: bool) -> typing.Any: ...
+    def _make_generic(self, name: str, arguments: list[typing.Any]) -> typing.Any: ...
+    @staticmethod
+    def _is_falsy_scalar(argument: typing.Any) -> bool: ...
+    @classmethod
+    def _finalize(cls, argument: typing.Any, checked_by_owner: bool = ...) -> typing.Any: ...
+
+
+class _ScalarType(typing.NamedTuple):
+    type: typing.Any
+    strict: bool
+
+
+def non_empty(value: typing.Any) -> typing.Any: ...
+def non_empty_items(collection: typing.Iterable) -> typing.Any: ...
+def non_empty_values(mapping: typing.Mapping) -> typing.Any: ...
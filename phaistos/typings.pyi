@@ -10,19 +10,24 @@ class RawSchemaProperty(typing.TypedDict):
         description (str): A description of the property.
         type (str): The type of the property.
         default (typing.Any): The default value of the property.
-        validator (str): The validator of the property.
+        validator (str | RawValidator): The validator of the property, either its source code or its source code along with its options.
         properties (dict[str, RawSchemaProperty]): The properties of the property. Can include recursive properties of RawSchemaProperty type.
+        context (dict[str, typing.Any]): The context of the nested schema of the property, used during validation.
     """
     description: str
     type: typing.NotRequired[str]
     default: typing.NotRequired[typing.Any]
-    validator: typing.NotRequired[RawValidator]
+    validator: typing.NotRequired[str | RawValidator]
     properties: typing.NotRequired[dict[str, RawSchemaProperty]]
     constraints: typing.NotRequired[dict[str, typing.Any]]
+    context: typing.NotRequired[dict[str, typing.Any]]
 
 class RawValidator(typing.TypedDict):
     mode: typing.Literal['before', 'after', 'wrap']
     source: str
+    pure: typing.NotRequired[bool]
+    cache: typing.NotRequired[bool]
+    cache_size: typing.NotRequired[int]
 
 class SchemaInputFile(typing.TypedDict):
     """
@@ -34,13 +39,15 @@ class SchemaInputFile(typing.TypedDict):
         description (str): The description of the schema.
         properties (dict[str, RawSchemaProperty]): The properties of the schema.
         context (dict[str, typing.Any]): The context of the schema, used during validation. (See: https://docs.pydantic.dev/2.0/usage/validators/#validation-context)
+        definitions (dict[str, RawSchemaProperty]): The properties that can be referred to by the properties of the schema (e.g. `$ref: '#/definitions/Address'`).
     """
     version: str
     name: str
     description: str
     properties: dict[str, RawSchemaProperty]
     context: typing.NotRequired[dict[str, typing.Any]]
-    validator: typing.NotRequired[RawValidator]
+    definitions: typing.NotRequired[dict[str, RawSchemaProperty]]
+    validator: typing.NotRequired[str | RawValidator]
 
 class ParsedProperty(typing.TypedDict):
     """
@@ -103,11 +110,169 @@ class ValidationResults:
 
     Attributes:
         valid (bool): A boolean that represents if the data is valid.
-        schema (dict): The schema of the data.
+        schema (dict): The schema of the data. If not given, it is resolved from the schema source on the first access.
         errors (list[FieldValidationErrorInfo]): A list of field validation errors.
         data (dict): The data that was validated.
+        schema_source (typing.Callable[[], dict] | None): A callable returning the schema of the data, if it is not given.
     """
     valid: bool = dataclasses.field(init=False)
-    schema: dict
+    schema: dict = ...
     errors: list[FieldValidationErrorInfo]
-    data: dict
+    data: dict = ...
+    schema_source: typing.Callable[[], dict] | None = ...
+
+@dataclasses.dataclass(kw_only=True)
+class BatchValidationResults:
+    """
+    A dataclass that represents the results of a validation of multiple data entries.
+
+    Attributes:
+        mask (bytearray): A validity flag (1 - valid, 0 - invalid) for each entry, in input order.
+        errors (dict[int, list[FieldValidationErrorInfo]]): Field validation errors, keyed by the index of the invalid entry.
+        schema (dict): The schema of the data. If not given, it is resolved from the schema source on the first access.
+        schema_source (typing.Callable[[], dict] | None): A callable returning the schema of the data, if it is not given.
+    """
+    mask: bytearray = ...
+    errors: dict[int, list[FieldValidationErrorInfo]] = ...
+    schema: dict = ...
+    schema_source: typing.Callable[[], dict] | None = ...
+    @property
+    def total(self) -> int: ...
+    @property
+    def invalid_count(self) -> int: ...
+    @property
+    def valid_count(self) -> int: ...
+    @property
+    def valid(self) -> bool: ...
+    @property
+    def error_counts(self) -> dict[str, int]:
+        """
+        The number of errors reported for each field (or model) name across the batch.
+        """
+
+@dataclasses.dataclass(kw_only=True)
+class RecordValidationResults:
+    """
+    A dataclass that represents the results of a validation of a single record read from a stream.
+
+    Attributes:
+        line (int): The line number of the record (starting from 1).
+        offset (int): The byte offset of the record start (text lines are counted as UTF-8 encoded).
+        errors (list[FieldValidationErrorInfo]): A list of field validation errors.
+        valid (bool): A boolean that represents if the record is valid.
+    """
+    line: int
+    offset: int
+    errors: list[FieldValidationErrorInfo]
+    valid: bool = dataclasses.field(init=False)
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SchemaFileState:
+    """
+    A dataclass that represents the state of a schema file at the moment it was last read,
+    used to find out which of the files have changed since then.
+
+    Attributes:
+        name (str): The name of the schema defined in the file.
+        mtime_ns (int): The modification time of the file, in nanoseconds.
+        size (int): The size of the file, in bytes.
+        digest (str): The SHA-256 hash of the file content.
+        version (str): The version of the schema defined in the file (empty if it has none).
+    """
+    name: str
+    mtime_ns: int
+    size: int
+    digest: str
+    version: str = ...
+
+
+class ParsedSchemaFile(typing.TypedDict):
+    """
+    A dictionary that represents a schema file read during the discovery, ready to be transpiled.
+
+    Attributes:
+        path (str): The path of the schema file.
+        schema (SchemaInputFile): The parsed schema manifest.
+        code (dict[str, typing.Any] | None): The cached code objects of the schema validators, if the schema was found in the transpilation cache.
+        cache_key (str): The transpilation cache key of the file content (empty if the cache is disabled).
+        parse_time (float): The time spent on reading and parsing the file, in seconds.
+        state (SchemaFileState): The state of the file when it was read.
+    """
+    path: str
+    schema: SchemaInputFile
+    code: dict[str, typing.Any] | None
+    cache_key: str
+    parse_time: float
+    state: SchemaFileState
+
+@dataclasses.dataclass(kw_only=True)
+class SchemaDiscoveryTiming:
+    """
+    A dataclass that represents the timings of a schema file discovery.
+
+    Attributes:
+        path (str): The path of the schema file.
+        name (str): The name of the schema.
+        parse_time (float): The time spent on reading and parsing the file (or reading the transpilation cache), in seconds.
+        transpile_time (float): The time spent on transpiling the schema, in seconds.
+        cached (bool): Whether the schema was found in the transpilation cache.
+    """
+    path: str
+    name: str
+    parse_time: float
+    transpile_time: float
+    cached: bool = ...
+
+@dataclasses.dataclass(kw_only=True)
+class SchemaReloadResults:
+    """
+    A dataclass that represents the outcome of reloading the schemas from the schemas path.
+
+    Attributes:
+        reloaded (list[str]): The names of the schemas that were (re)transpiled from new or changed files.
+        removed (list[str]): The names of the schemas that were removed along with their files.
+        failed (list[str]): The paths of the changed files that could not be transpiled (the previous versions of their schemas are kept).
+    """
+    reloaded: list[str] = ...
+    removed: list[str] = ...
+    failed: list[str] = ...
+    @property
+    def changed(self) -> bool: ...
+
+
+class CheckpointedFailure(typing.TypedDict):
+    """
+    A dictionary that represents an invalid entry recorded in a validation checkpoint.
+
+    Attributes:
+        position (int): The position of the entry in the input (its index, or its byte offset in a JSONL file).
+        errors (list[str]): The validation errors of the entry.
+    """
+    position: int
+    errors: list[str]
+
+@dataclasses.dataclass(kw_only=True)
+class ValidationCheckpoint:
+    """
+    A dataclass that represents the progress of a checkpointed validation run.
+
+    Attributes:
+        schema (str): The name of the schema the input is validated against.
+        fingerprint (str): The fingerprint of the schema, which a resumed run has to match.
+        position (int): The position in the input to resume from (the number of consumed entries, or the byte offset in a JSONL file).
+        total (int): The number of entries validated so far.
+        invalid_count (int): The number of invalid entries found so far.
+        error_counts (dict[str, int]): The numbers of errors found so far, by the names of the fields.
+        failures (list[CheckpointedFailure]): The first of the invalid entries found, with their errors.
+        completed (bool): Whether the whole input has been validated.
+    """
+    schema: str
+    fingerprint: str
+    position: int = ...
+    total: int = ...
+    invalid_count: int = ...
+    error_counts: dict[str, int] = ...
+    failures: list[CheckpointedFailure] = ...
+    completed: bool = ...
+    @property
+    def valid_count(self) -> int: ...
@@ -1,4 +1,3 @@
-import copy
 import logging
 import re
 
@@ -7,12 +6,7 @@ import pydantic_core
 
 import phaistos.exceptions
 import phaistos.consts
-from phaistos.typings import (
-    TranspiledProperty,
-    ParsedProperty,
-    RawValidator
-)
-from phaistos.sources import COLLECTION_VALIDATOR_TEMPLATE
+from phaistos.typings import TranspiledProperty
 
 
 def setup_logger(logger_name: str) -> logging.Logger:
@@ -35,11 +29,6 @@ def block(*args, **kwargs):
     raise phaistos.exceptions.ForbiddenModuleUseInValidator()
 
 
-def check_if_collection_is_allowed(collection_type: str) -> None:
-    if collection_type not in phaistos.consts.ALLOWED_COLLECTION_TYPES:
-        raise phaistos.exceptions.IncorrectFieldTypeError(collection_type)
-
-
 def construct_field_annotation(property_data: TranspiledProperty) -> tuple[type, pydantic.fields.FieldInfo]:
     return (
         property_data['type'],
@@ -53,31 +42,6 @@ def construct_field_annotation(property_data: TranspiledProperty) -> tuple[type,
     )
 
 
-def adjust_collection_type_property_entry(prop: ParsedProperty) -> ParsedProperty:
-    adjusted = copy.deepcopy(prop)
-    validator_data = adjusted['data'].get('validator', RawValidator({
-        'source': '',
-        'mode': 'after'
-    }))
-    if match := re.match(
-        phaistos.consts.COLLECTION_TYPE_REGEX,
-        adjusted['data']['type']
-    ):
-        check_if_collection_is_allowed(match['collection'])
-        adjusted['data']['validator'] = RawValidator(
-            source=validator_data['source'] + COLLECTION_VALIDATOR_TEMPLATE % (
-                match['item'],
-                adjusted['name'],
-                match['item']
-            ),
-            mode=validator_data['mode']
-        )
-        adjusted['data']['type'] = match['collection']
-    else:
-        adjusted['data']['validator'] = validator_data
-    return adjusted
-
-
 def check_for_forbidden_imports(source: str) -> None:
     if any(
         any(
@@ -87,3 +51,11 @@ def check_for_forbidden_imports(source: str) -> None:
         for module in phaistos.consts.BLOCKED_MODULES
     ):
         raise phaistos.exceptions.ForbiddenModuleUseInValidator()
+
+
+def version_sort_key(version: str) -> tuple[tuple[int, int, str], ...]:
+    # Numeric parts are compared as numbers and sort before the textual ones, so v2 < v10 and 1.2 < 1.2.1
+    return tuple(
+        (0, int(part), '') if part.isdigit() else (1, 0, part)
+        for part in re.findall(phaistos.consts.VERSION_PART_REGEX, version)
+    )
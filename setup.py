@@ -16,6 +16,9 @@ if version := os.environ.get("RELEASE_VERSION"):
         url="https://phaistos.readthedocs.io/en/latest",
         packages=setuptools.find_packages(),
         package_data={"phaistos": ["py.typed"]},
+        entry_points={
+            "console_scripts": ["phaistos=phaistos.cli:main"],
+        },
         install_requires=[
             "PyYAML==6.0.1",
             "pydantic==2.7.0",
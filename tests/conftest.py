@@ -8,6 +8,7 @@ import pytest
 import yaml
 
 import consts  # type: ignore
+import phaistos
 import phaistos.consts
 import phaistos.sources
 import phaistos.typings
@@ -121,6 +122,15 @@ def toggle_schema_discovery(state: bool) -> None:
         os.environ['PHAISTOS__DISABLE_SCHEMA_DISCOVERY'] = '1'
 
 
+def restart_manager(**start_arguments: typing.Any) -> phaistos.Manager:
+    """
+    Start a brand new manager instance (Manager.reset keeps the singleton instance around).
+    """
+    phaistos.Manager.reset()
+    phaistos.Manager._Manager__instance = None  # type: ignore
+    return phaistos.Manager.start(**start_arguments)
+
+
 @contextlib.contextmanager
 def schema_discovery(state: bool = True) -> typing.Generator[None, None, None]:
     toggle_schema_discovery(state)
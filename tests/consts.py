@@ -50,9 +50,10 @@ MOCK_SCHEMA_PATCHES: list[
             },
             'invalid': ([
                 999.99,
-                0.0,
-                None
-            ], [])
+                0.0
+            ], [
+                None  # The empty values are rejected by the annotation, so the validator function does not check them again
+            ])
         },
         'label': {
             'description': 'Name of the test',
@@ -62,10 +63,11 @@ MOCK_SCHEMA_PATCHES: list[
                 "source": "import string\nif set(value).difference(string.ascii_letters+string.digits): raise ValueError('Name contains special characters')"
             },
             'invalid': ([
-                'na$!',
+                'na$!'
+            ], [
                 '',
                 None
-            ], [])
+            ])
         },
         'tags': {
             'description': 'Tags for the test',
@@ -75,9 +77,11 @@ MOCK_SCHEMA_PATCHES: list[
                 "source": "if len(value) < 2: raise ValueError('Tags must have at least 2 items')"
             },
             'invalid': ([
-                ['t1'],
+                ['t1']
+            ], [
+                ['t1', ''],  # The items are checked by pydantic-core, for the fields without a validator as well
                 [None, None, None]
-            ], [])
+            ])
         }
     },
     {
@@ -119,10 +123,10 @@ MOCK_SCHEMA_PATCHES: list[
                 "source": "if value < 1:  raise ValueError('Rank must be between 1 and 10')"
             },
             'invalid': ([
-                0,
-                None
+                0
             ], [
-                11
+                11,
+                None
             ])
         },
     },
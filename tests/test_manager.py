@@ -1,4 +1,23 @@
+import asyncio
+import collections
+import concurrent.futures
+import json
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+import conftest  # type: ignore
+import consts  # type: ignore
+
+import phaistos.cli
+import phaistos.compiler
+import phaistos.consts
+import phaistos.manager
 from phaistos import Manager
+from phaistos.compiler import ValidationFunctionsCompiler
 
 
 def test_manager_as_singleton():
@@ -12,3 +31,375 @@ def test_manager_as_singleton():
     ) == id(
         Manager()
     )
+
+
+def test_transpilation_cache(tmp_path, monkeypatch):
+    schemas_path = tmp_path / 'schemas'
+    cache_path = tmp_path / 'cache'
+    schemas_path.mkdir()
+    shutil.copy(os.path.join(consts.TESTS_ASSETS_PATH, 'faulty_flat.yaml'), schemas_path)
+    monkeypatch.delenv('PHAISTOS__DISABLE_SCHEMA_DISCOVERY', raising=False)
+
+    manager = conftest.restart_manager(schemas_path=str(schemas_path), cache_path=str(cache_path))
+    first_errors = set(manager.validate({'database': '_db'}, 'FaultyFlat').errors)
+    assert len(os.listdir(cache_path)) == 1
+
+    monkeypatch.setattr(ValidationFunctionsCompiler, '_code_cache', collections.OrderedDict())
+    monkeypatch.setattr(phaistos.manager.yaml, 'load', lambda *_, **__: pytest.fail('Cached schema was parsed again'))
+    monkeypatch.setattr(phaistos.compiler, 'compile', lambda *_: pytest.fail('Cached validator was compiled again'), raising=False)
+
+    manager = conftest.restart_manager(schemas_path=str(schemas_path), cache_path=str(cache_path))
+    assert set(manager.validate({'database': '_db'}, 'FaultyFlat').errors) == first_errors
+    monkeypatch.undo()
+
+    # The code objects kept in memory are bounded, the least recently used ones are dropped first
+    monkeypatch.setattr(phaistos.consts, 'VALIDATOR_CODE_CACHE_SIZE', 2)
+    monkeypatch.setattr(ValidationFunctionsCompiler, '_code_cache', collections.OrderedDict())
+    first_code, second_code, third_code = [
+        ValidationFunctionsCompiler._compile_source(f'value = {number}')  # pylint: disable=protected-access
+        for number in range(3)
+    ]
+    assert list(ValidationFunctionsCompiler._code_cache.values()) == [second_code, third_code]  # pylint: disable=protected-access
+    assert ValidationFunctionsCompiler._compile_source('value = 1') is second_code  # pylint: disable=protected-access
+    assert ValidationFunctionsCompiler._compile_source('value = 0') is not first_code  # pylint: disable=protected-access
+    assert len(ValidationFunctionsCompiler._code_cache) == 2  # pylint: disable=protected-access
+
+
+def test_discovery_report(tmp_path, monkeypatch):
+    nested_path = tmp_path / 'nested'
+    nested_path.mkdir()
+    shutil.copy(os.path.join(consts.TESTS_ASSETS_PATH, 'faulty_flat.yaml'), tmp_path)
+    shutil.copy(os.path.join(consts.TESTS_ASSETS_PATH, 'valid.yaml'), nested_path)
+    shutil.copy(os.path.join(consts.TESTS_ASSETS_PATH, 'mock.yaml'), tmp_path / '_ignored.yaml')
+    monkeypatch.delenv('PHAISTOS__DISABLE_SCHEMA_DISCOVERY', raising=False)
+
+    manager = conftest.restart_manager(schemas_path=str(tmp_path))
+
+    assert set(manager._schemas) == {'FaultyFlat', 'ValidConfig'}  # pylint: disable=protected-access
+    discovery_report = Manager.get_discovery_report()
+    assert [timing.name for timing in discovery_report] == ['FaultyFlat', 'ValidConfig']
+    assert all(
+        timing.parse_time >= 0 and timing.transpile_time > 0 and not timing.cached
+        for timing in discovery_report
+    )
+
+
+def test_lazy_schema_loading(tmp_path, monkeypatch):
+    shutil.copy(os.path.join(consts.TESTS_ASSETS_PATH, 'faulty_flat.yaml'), tmp_path)
+    shutil.copy(os.path.join(consts.TESTS_ASSETS_PATH, 'valid.yaml'), tmp_path)
+    monkeypatch.delenv('PHAISTOS__DISABLE_SCHEMA_DISCOVERY', raising=False)
+    transpiled_schemas = []
+    make_schema = phaistos.manager.Transpiler.make_schema.__func__
+    monkeypatch.setattr(
+        phaistos.manager.Transpiler,
+        'make_schema',
+        classmethod(lambda cls, schema, *args, **kwargs: transpiled_schemas.append(schema['name']) or make_schema(cls, schema, *args, **kwargs))
+    )
+
+    manager = conftest.restart_manager(schemas_path=str(tmp_path), lazy=True, preload=['ValidConfig'])
+    assert set(manager._schema_index) == {'FaultyFlat', 'ValidConfig'}  # pylint: disable=protected-access
+    assert transpiled_schemas == ['ValidConfig']
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        factories = list(executor.map(manager.get_factory, ['FaultyFlat'] * 32))
+    assert transpiled_schemas == ['ValidConfig', 'FaultyFlat']
+    assert all(factory is factories[0] for factory in factories)
+    assert not manager.validate({'database': '_db'}, 'FaultyFlat').valid
+    assert [timing.name for timing in Manager.get_discovery_report()] == ['ValidConfig', 'FaultyFlat']
+
+
+def test_schema_reload(tmp_path, monkeypatch):
+    shutil.copy(os.path.join(consts.TESTS_ASSETS_PATH, 'faulty_flat.yaml'), tmp_path)
+    shutil.copy(os.path.join(consts.TESTS_ASSETS_PATH, 'valid.yaml'), tmp_path)
+    monkeypatch.delenv('PHAISTOS__DISABLE_SCHEMA_DISCOVERY', raising=False)
+    manager = conftest.restart_manager(schemas_path=str(tmp_path))
+    previous_factory = manager.get_factory('FaultyFlat')
+    valid_factory = manager.get_factory('ValidConfig')
+
+    os.utime(tmp_path / 'valid.yaml')  # Touched only, the content is the same
+    assert not Manager.reload().changed
+
+    schema_file = tmp_path / 'faulty_flat.yaml'
+    schema_file.write_text(schema_file.read_text().replace('cannot start with underscore', 'must not start with underscore'))
+    reload_results = Manager.reload()
+    assert reload_results.reloaded == ['FaultyFlat'] and not reload_results.removed
+    assert manager.get_factory('FaultyFlat') is not previous_factory
+    assert manager.get_factory('ValidConfig') is valid_factory
+    assert any('must not start' in error.message for error in manager.validate({'database': '_db'}, 'FaultyFlat').errors)
+    assert any('cannot start' in error.message for error in previous_factory.validate({'database': '_db'}).errors)
+
+    schema_file.write_text('name: FaultyFlat\nproperties: [')
+    assert Manager.reload().failed == [str(schema_file)]
+    assert manager.get_factory('FaultyFlat') is not previous_factory
+
+    os.remove(tmp_path / 'valid.yaml')
+    assert Manager.reload().removed == ['ValidConfig']
+    with pytest.raises(phaistos.manager.SchemaLoadingException):
+        manager.get_factory('ValidConfig')
+
+
+def test_schema_watching(tmp_path, monkeypatch):
+    monkeypatch.delenv('PHAISTOS__DISABLE_SCHEMA_DISCOVERY', raising=False)
+    conftest.restart_manager(schemas_path=str(tmp_path))
+    polls = []
+
+    def failing_reload():
+        polls.append(threading.current_thread().name)
+        if len(polls) == 3:
+            # Ends the watcher thread without going through stop_watching
+            Manager._watcher_stop.set()  # pylint: disable=protected-access
+        raise RuntimeError('Unexpected reload error')
+
+    monkeypatch.setattr(Manager, 'reload', failing_reload)
+    Manager.watch(interval=0.01)
+    # The unexpected errors did not stop the watcher, and its exit allows watching again
+    for _ in range(500):
+        if Manager._watcher_stop is None:  # pylint: disable=protected-access
+            break
+        time.sleep(0.01)
+    assert polls == ['phaistos-watcher'] * 3
+    assert Manager._watcher_stop is None  # pylint: disable=protected-access
+    Manager.watch(interval=60)
+    assert Manager._watcher_stop is not None  # pylint: disable=protected-access
+    Manager.stop_watching()
+
+
+CUSTOMER_SCHEMA = '''
+name: Customer
+definitions:
+  Address:
+    description: Postal address
+    properties:
+      city:
+        type: str
+      zip_code:
+        type: str
+        validator: |
+          if not zip_code.isdigit():
+            raise ValueError('must be numeric')
+  Name:
+    type: str
+properties:
+  name:
+    $ref: '#/definitions/Name'
+  billing:
+    $ref: '#/definitions/Address'
+  shipping:
+    $ref: '#/definitions/Address'
+'''
+
+ORDER_SCHEMA = '''
+name: Order
+properties:
+  customer:
+    $ref: Customer
+  quantity:
+    type: int
+'''
+
+
+def test_schema_references(tmp_path, monkeypatch):
+    # The referring schema file comes first, so it has to be transpiled after the schema it refers to
+    (tmp_path / 'a_order.yaml').write_text(ORDER_SCHEMA)
+    (tmp_path / 'customer.yaml').write_text(CUSTOMER_SCHEMA)
+    monkeypatch.delenv('PHAISTOS__DISABLE_SCHEMA_DISCOVERY', raising=False)
+    address = {'city': 'Knossos', 'zip_code': '70013'}
+    order = {'customer': {'name': 'Minos', 'billing': address, 'shipping': address}, 'quantity': 1}
+
+    for lazy in [False, True]:
+        manager = conftest.restart_manager(schemas_path=str(tmp_path), lazy=lazy)
+        order_factory = manager.get_factory('Order')
+        customer_factory = manager.get_factory('Customer')
+        customer_model = customer_factory._model  # pylint: disable=protected-access
+        assert order_factory._model.model_fields['customer'].annotation is customer_model  # pylint: disable=protected-access
+        assert customer_model.model_fields['billing'].annotation is customer_model.model_fields['shipping'].annotation
+        assert order_factory.references == {'Customer': customer_factory.source}
+        assert manager.validate(order, 'Order').valid
+        invalid_order = order | {'customer': order['customer'] | {'shipping': {'city': 'Knossos', 'zip_code': 'K-1'}}}
+        assert [error.name for error in manager.validate(invalid_order, 'Order').errors] == ['zip_code']
+
+    parallel_results = manager.validate_parallel([order, invalid_order], 'Order', processes=1)
+    assert parallel_results.mask == bytearray([1, 0]) and [*parallel_results.errors] == [1]
+
+    manager = conftest.restart_manager(schemas_path=str(tmp_path))
+    (tmp_path / 'customer.yaml').write_text(CUSTOMER_SCHEMA.replace('must be numeric', 'must be digits'))
+    assert Manager.reload().reloaded == ['Customer', 'Order']
+    order_customer = manager.get_factory('Order')._model.model_fields['customer'].annotation  # pylint: disable=protected-access
+    assert order_customer is manager.get_factory('Customer')._model  # pylint: disable=protected-access
+    assert 'must be digits' in manager.validate(invalid_order, 'Order').errors[0].message
+
+    # A cycle going through an unchanged schema rejects the whole reload, keeping the previous factories
+    customer_factory = manager.get_factory('Customer')
+    (tmp_path / 'customer.yaml').write_text(CUSTOMER_SCHEMA + '''
+  last_order:
+    $ref: Order
+''')
+    with pytest.raises(phaistos.manager.SchemaLoadingException, match='Circular schema references'):
+        Manager.reload()
+    assert manager.get_factory('Customer') is customer_factory
+    assert manager.get_factory('Order')._model.model_fields['customer'].annotation is customer_factory._model  # pylint: disable=protected-access
+    assert 'last_order' not in customer_factory._model.model_fields  # pylint: disable=protected-access
+
+    for lazy in [False, True]:
+        with pytest.raises(phaistos.manager.SchemaLoadingException, match='Circular schema references'):
+            conftest.restart_manager(schemas_path=str(tmp_path), lazy=lazy, preload=['Order'])
+
+
+def test_compiled_package(tmp_path, monkeypatch):
+    schemas_path = tmp_path / 'schemas'
+    schemas_path.mkdir()
+    for asset in ['faulty_flat.yaml', 'faulty_double_nested.yaml', 'valid.yaml']:
+        shutil.copy(os.path.join(consts.TESTS_ASSETS_PATH, asset), schemas_path)
+    (schemas_path / 'customer.yaml').write_text(CUSTOMER_SCHEMA)
+    (schemas_path / 'order.yaml').write_text(ORDER_SCHEMA)
+    monkeypatch.delenv('PHAISTOS__DISABLE_SCHEMA_DISCOVERY', raising=False)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    payloads = [
+        {},
+        {'name': '_mock', 'someStrings': ['a', '']},
+        {'host': '_host', 'port': 0, 'database': 'db', 'table': '_table'},
+        {'NestedSchema': {'DoubleNestedSchema': {'uuid': '_uuid'}, 'host': 'host', 'port': -1}, 'table': 'table'},
+        {'customer': {'name': 'Minos', 'billing': {'city': 'Knossos', 'zip_code': 'K-1'}}, 'quantity': 0},
+    ]
+
+    Manager.reset()
+    Manager._Manager__instance = None  # type: ignore  # pylint: disable=protected-access
+    assert phaistos.cli.main(['compile', str(schemas_path), str(tmp_path / 'compiled_schemas')]) == 0
+    manager = conftest.restart_manager(schemas_path=str(schemas_path))
+    transpiled_factories = dict(manager._schemas)  # pylint: disable=protected-access
+
+    def fail_transpilation(*_):
+        raise AssertionError('Compiled schemas are not transpiled')
+
+    monkeypatch.setattr(phaistos.manager.Transpiler, 'make_schema', fail_transpilation)
+    manager = conftest.restart_manager(compiled_package='compiled_schemas')
+    assert set(manager._schemas) == set(transpiled_factories) == {  # pylint: disable=protected-access
+        'FaultyFlat', 'FaultyNested', 'ValidConfig', 'Customer', 'Order'
+    }
+    assert all(timing.cached and os.path.isfile(timing.path) for timing in Manager.get_discovery_report())
+    for schema_name, transpiled_factory in transpiled_factories.items():
+        compiled_factory = manager.get_factory(schema_name)
+        assert compiled_factory.source == transpiled_factory.source
+        assert compiled_factory.references == transpiled_factory.references
+        assert compiled_factory._model.model_json_schema() == transpiled_factory._model.model_json_schema()  # pylint: disable=protected-access
+        for payload in payloads:
+            assert [(error.name, error.message) for error in compiled_factory.validate(payload).errors] \
+                == [(error.name, error.message) for error in transpiled_factory.validate(payload).errors]
+    with pytest.raises(RuntimeError):
+        Manager.reload()
+
+    manager = conftest.restart_manager(compiled_package='compiled_schemas', lazy=True)
+    assert not manager._schemas  # pylint: disable=protected-access
+    order_factory = manager.get_factory('Order')
+    assert order_factory._model.model_fields['customer'].annotation is manager.get_factory('Customer')._model  # pylint: disable=protected-access
+
+
+PERSON_SCHEMA = '''
+name: Person
+version: %(version)s
+properties:
+  name:
+    type: str
+    validator: |
+      if not name[0].isupper():
+        raise ValueError('must be capitalized')
+  address:
+    properties:
+      city:
+        type: str
+%(extra_properties)s
+'''
+
+
+def test_schema_versions(tmp_path, monkeypatch):
+    (tmp_path / 'person_v2.yaml').write_text(PERSON_SCHEMA % {'version': 'v2', 'extra_properties': ''})
+    (tmp_path / 'person_v10.yaml').write_text(PERSON_SCHEMA % {
+        'version': 'v10',
+        'extra_properties': '  age:\n    type: int'
+    })
+    monkeypatch.delenv('PHAISTOS__DISABLE_SCHEMA_DISCOVERY', raising=False)
+    payload = {'name': 'Minos', 'address': {'city': 'Knossos'}}
+
+    for lazy in [False, True]:
+        manager = conftest.restart_manager(schemas_path=str(tmp_path), lazy=lazy)
+        assert manager.get_versions('Person') == ['v2', 'v10']
+        assert manager.get_factory('Person') is manager.get_factory('Person', version='v10')
+        assert not manager.validate(payload, 'Person').valid
+        assert manager.validate(payload, 'Person', version='v2').valid
+        assert manager.validate_json('{"name": "minos", "address": {"city": "Knossos"}}', 'Person', version='v2').errors[0].name == 'name'
+        with pytest.raises(phaistos.manager.SchemaLoadingException, match='Version v3 of schema Person not found'):
+            manager.get_factory('Person', version='v3')
+
+        # All the validation entry points resolve the asked version
+        assert not manager.validate_many([payload], 'Person').valid
+        assert manager.validate_many([payload], 'Person', version='v2').valid
+        assert [record.valid for record in manager.validate_stream([json.dumps(payload)], 'Person', version='v2')] == [True]
+        assert manager.validate_concurrently([payload], 'Person', version='v2')[0].valid
+
+        async def validate_asynchronously(versioned_manager):
+            single_result = await versioned_manager.avalidate(payload, 'Person', version='v2')
+            return [single_result, *[result async for result in versioned_manager.avalidate_stream([payload], 'Person', version='v2')]]
+
+        assert all(result.valid for result in asyncio.run(validate_asynchronously(manager)))
+        if not lazy:
+            assert manager.validate_parallel([payload], 'Person', processes=1, version='v2').valid
+
+        # The unchanged nested schemas and validators are shared by the versions
+        previous_model = manager.get_factory('Person', version='v2')._model  # pylint: disable=protected-access
+        latest_model = manager.get_factory('Person')._model  # pylint: disable=protected-access
+        assert previous_model is not latest_model
+        assert previous_model.model_fields['address'].annotation is latest_model.model_fields['address'].annotation
+        assert previous_model.__pydantic_decorators__.field_validators['name_validator'].func.__func__ \
+            is latest_model.__pydantic_decorators__.field_validators['name_validator'].func.__func__
+
+    # The versions loaded on first use are seen together by the other threads, never one by one
+    manager = conftest.restart_manager(schemas_path=str(tmp_path), lazy=True)
+    load_parsed_schema_file = Manager._Manager__load_parsed_schema_file  # type: ignore  # pylint: disable=no-member,protected-access
+    concurrent_versions = []
+
+    def load_and_read(parsed_schema_file):
+        load_parsed_schema_file(parsed_schema_file)
+        if not concurrent_versions:
+            concurrent_versions.append([])
+            reader = threading.Thread(target=lambda: concurrent_versions.append(manager.get_versions('Person')))
+            reader.start()
+            reader.join(timeout=0.1)
+
+    with monkeypatch.context() as loading_patch:
+        loading_patch.setattr(Manager, '_Manager__load_parsed_schema_file', load_and_read)
+        assert manager.get_versions('Person') == ['v2', 'v10']
+    while len(concurrent_versions) < 2:
+        time.sleep(0.01)
+    assert concurrent_versions[-1] == ['v2', 'v10']
+
+    manager = conftest.restart_manager(schemas_path=str(tmp_path), lazy=True)
+    os.remove(tmp_path / 'person_v10.yaml')
+    assert Manager.reload().removed == ['Person']
+    assert manager.get_versions('Person') == ['v2']
+    assert manager.validate(payload, 'Person').valid
+
+
+def test_compiled_schema_versions(tmp_path, monkeypatch):
+    (tmp_path / 'person_v2.yaml').write_text(PERSON_SCHEMA % {'version': 'v2', 'extra_properties': ''})
+    (tmp_path / 'person_v10.yaml').write_text(PERSON_SCHEMA % {
+        'version': 'v10',
+        'extra_properties': '  age:\n    type: int'
+    })
+    monkeypatch.delenv('PHAISTOS__DISABLE_SCHEMA_DISCOVERY', raising=False)
+    payload = {'name': 'Minos', 'address': {'city': 'Knossos'}}
+
+    # All versions are compiled, so the compiled package serves them as well
+    manager = conftest.restart_manager(schemas_path=str(tmp_path))
+    transpiled_source = manager.get_factory('Person', version='v2').source
+    Manager.reset()
+    Manager._Manager__instance = None  # type: ignore  # pylint: disable=protected-access
+    assert phaistos.cli.compile_schemas(str(tmp_path), str(tmp_path / 'compiled_versions')) == {
+        'Person': {'v2': 'person_v2', 'v10': 'person'}
+    }
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for lazy in [False, True]:
+        manager = conftest.restart_manager(compiled_package='compiled_versions', lazy=lazy)
+        assert manager.get_versions('Person') == ['v2', 'v10']
+        assert not manager.validate(payload, 'Person').valid
+        assert manager.validate(payload, 'Person', version='v2').valid
+        assert manager.get_factory('Person', version='v2').source == transpiled_source
@@ -1,15 +1,26 @@
 from collections import ChainMap
+import copy
+import datetime
+import fractions
+import gc
+import ipaddress
+import types
 import typing
+import weakref
 
+import annotated_types
 import pytest
 
 import conftest  # type: ignore
 import consts  # type: ignore
 
+from phaistos.codegen import CodeGenerator
+from phaistos.compiler import CallingConvention, ValidationFunctionsCompiler
 from phaistos.transpiler import Transpiler
-from phaistos.schema import TranspiledSchema
-from phaistos.consts import BLOCKED_MODULES
-from phaistos.exceptions import ForbiddenModuleUseInValidator
+from phaistos.schema import SchemaInstancesFactory, TranspiledSchema
+from phaistos.consts import BLOCKED_MODULES, VALIDATION_LOGGER
+from phaistos.exceptions import ForbiddenModuleUseInValidator, IncorrectFieldTypeError, SchemaLoadingException
+from phaistos.type_expressions import TypeExpressionParser, TypeRegistry
 
 
 def _check_transpiled_validator(
@@ -192,3 +203,246 @@ def test_possible_exploits(exploit: dict[str, str], mock_config_file_base) -> No
     except ForbiddenModuleUseInValidator:
         return
     pytest.fail(f'Exploit "{exploit["name"]}" wasn\'t prevented!')
+
+
+@pytest.mark.order(5)
+@pytest.mark.parametrize(
+    'calling_convention',
+    typing.get_args(CallingConvention)
+)
+def test_calling_conventions(calling_convention, mock_config_file_base, monkeypatch) -> None:
+    monkeypatch.setattr(ValidationFunctionsCompiler, 'calling_convention', calling_convention)
+    schema = Transpiler.make_schema(
+        schema=mock_config_file_base | {
+            'validator': "if low > high: raise ValueError('Low must not be greater than high')",
+            'properties': {
+                'low': {
+                    'description': 'Lower bound',
+                    'type': 'int',
+                    'validator': "logger.debug(f'Checking {low}')\nif low < 0: raise ValueError('Low must not be negative')"
+                },
+                'high': {
+                    'description': 'Upper bound',
+                    'type': 'int'
+                }
+            }
+        }
+    )
+    factory = SchemaInstancesFactory(name=schema.transpilation_name, _model=schema)
+
+    assert factory.validate({'low': 1, 'high': 2}).valid
+    assert [error.message for error in factory.validate({'low': 3, 'high': 2}).errors] == ['Low must not be greater than high']
+    assert 'Low must not be negative' in factory.validate({'low': -3, 'high': 2}).errors[0].message
+
+    field_validator = getattr(schema, 'low_validator')
+    assert ('low' in field_validator.__globals__) == (calling_convention == 'legacy')
+    if calling_convention == 'bound':
+        assert field_validator.__globals__['logger'] is VALIDATION_LOGGER
+
+
+@pytest.mark.order(6)
+@pytest.mark.parametrize(
+    'expression, valid, invalid',
+    [
+        ('list[int]', [[1, 2]], [[], [1, 0], [1, '2'], 'a']),
+        ('set[str]', [['a', 'b']], [[''], [1]]),
+        ('dict[str, float]', [{'a': 1.5}], [{}, {'a': 0.0}, {'a': 'x'}]),
+        ('tuple[int, ...]', [[1, 2, 3]], [[], [1, 0]]),
+        ('tuple[int, str]', [[1, 'a']], [[1], [1, '']]),
+        ('list[list[int]]', [[[1], [2, 3]]], [[[]], [[1], [0]]]),
+        ('Optional[list[int]]', [None, [1]], [[None], []]),
+        ('list[int | None]', [[1, None]], [[0]]),
+        ('int | None', [None, 1], [0]),
+    ],
+    ids=lambda parameter: parameter if isinstance(parameter, str) else ''
+)
+@pytest.mark.parametrize('validator', [None, 'assert value != 13'], ids=['native', 'validator'])
+def test_type_expressions(expression, valid, invalid, validator, mock_config_file_base) -> None:
+    field = {
+        'description': 'Field of the tested type',
+        'type': expression
+    }
+    schema = Transpiler.make_schema(
+        schema=mock_config_file_base | {
+            'properties': {
+                'field': field if validator is None else field | {'validator': validator}
+            }
+        }
+    )
+    factory = SchemaInstancesFactory(name=schema.transpilation_name, _model=schema)
+    assert all(factory.validate({'field': value}).valid for value in valid)
+    assert not any(factory.validate({'field': value}).valid for value in invalid)
+
+
+@pytest.mark.order(6)
+def test_empty_value_errors(mock_config_file_base) -> None:
+    schema = Transpiler.make_schema(
+        schema=mock_config_file_base | {
+            'properties': {
+                'count': {'description': 'Count', 'type': 'int'},
+                'numbers': {'description': 'Numbers', 'type': 'list[int]'},
+                'weights': {'description': 'Weights', 'type': 'dict[str, float]'},
+                'checked_count': {'description': 'Checked count', 'type': 'int', 'validator': 'pass'},
+                'raw_count': {'description': 'Raw count', 'type': 'int', 'validator': {'mode': 'before', 'source': 'pass'}},
+            }
+        }
+    )
+    factory = SchemaInstancesFactory(name=schema.transpilation_name, _model=schema)
+    results = factory.validate({'count': 0, 'numbers': [1, 0], 'weights': {'a': 0.0}, 'checked_count': 0, 'raw_count': 0})
+    assert {error.name: error.message for error in results.errors} == {
+        'count': 'Value cannot be empty',
+        'numbers': 'Items cannot be empty',
+        'weights': 'Values cannot be empty',
+        'checked_count': 'Value cannot be empty',
+        'raw_count': 'Value error, Value cannot be empty'
+    }
+    # The validators run after the annotation leave the checks it already carries to pydantic-core
+    assert schema.checked_count_validator(0, info=None) == 0  # type: ignore
+    with pytest.raises(ValueError, match='Value cannot be empty'):
+        schema.raw_count_validator(0, info=None)  # type: ignore
+
+
+@pytest.mark.order(7)
+@pytest.mark.parametrize(
+    'expression',
+    ['list[', 'list[int]]', 'list[int, str]', 'dict[str]', 'tuple[..., int]', 'unknown_type', 'mapping[str]', 'int,']
+)
+def test_invalid_type_expressions(expression) -> None:
+    with pytest.raises(IncorrectFieldTypeError):
+        TypeExpressionParser.parse(expression)
+
+
+@pytest.mark.order(8)
+def test_type_registry(mock_config_file_base, monkeypatch) -> None:
+    monkeypatch.setattr(TypeRegistry, '_types', dict(TypeRegistry._types))  # pylint: disable=protected-access
+    monkeypatch.setattr(TypeExpressionParser, '_parsed', {})
+    assert TypeRegistry.resolve('datetime') is TypeRegistry.resolve('datetime.datetime') is datetime.datetime
+    assert TypeRegistry.resolve('IPv4Address') is ipaddress.IPv4Address
+
+    with pytest.raises(IncorrectFieldTypeError):
+        TypeRegistry.resolve('fractions.Fraction')
+    monkeypatch.setattr(TypeRegistry, '_locate_fallback', True)
+    assert TypeRegistry.resolve('fractions.Fraction') is fractions.Fraction
+    monkeypatch.setattr(TypeRegistry, '_locate_fallback', False)
+
+    TypeRegistry.register('Percentage', typing.Annotated[float, annotated_types.Interval(ge=0, le=100)])
+    schema = Transpiler.make_schema(
+        schema=mock_config_file_base | {
+            'properties': {
+                'shares': {
+                    'description': 'Shares of the owners',
+                    'type': 'dict[str, Percentage]'
+                }
+            }
+        }
+    )
+    factory = SchemaInstancesFactory(name=schema.transpilation_name, _model=schema)
+    assert factory.validate({'shares': {'a': 40.0, 'b': 60.0}}).valid
+    assert not factory.validate({'shares': {'a': 140.0}}).valid
+
+
+@pytest.mark.order(9)
+def test_manifest_is_not_modified(faulty_double_nested_config_file) -> None:
+    manifest = copy.deepcopy(faulty_double_nested_config_file)
+    Transpiler.make_schema(schema=manifest)
+    assert manifest == faulty_double_nested_config_file
+
+
+@pytest.mark.order(10)
+def test_nested_schema_interning(mock_config_file_base) -> None:  # pylint: disable=too-many-locals
+    address: dict[str, typing.Any] = {
+        'description': 'Address',
+        'properties': {
+            'city': {'description': 'City', 'type': 'str'},
+            'zip_code': {'description': 'ZIP code', 'type': 'int'}
+        }
+    }
+    first_schema = Transpiler.make_schema(
+        schema=mock_config_file_base | {
+            'name': 'First',
+            'properties': {
+                'billing': {'description': 'Billing', 'properties': {'address': address}},
+                'shipping': {'description': 'Shipping', 'properties': {'address': address}}
+            }
+        }
+    )
+    second_source = mock_config_file_base | {
+        'name': 'Second',
+        'properties': {
+            'address': address,
+            'other_address': address | {'description': 'Other address'}
+        }
+    }
+    second_schema = Transpiler.make_schema(schema=second_source)
+    third_schema = Transpiler.make_schema(
+        schema=mock_config_file_base | {
+            'name': 'Third',
+            'properties': {'address': address | {'description': 'Home address', 'properties': address['properties'] | {'city': {'description': 'Town', 'type': 'str'}}}}
+        }
+    )
+    first_fields, second_fields = first_schema.model_fields, second_schema.model_fields
+    billing_address = first_fields['billing'].annotation.model_fields['address'].annotation  # type: ignore
+    assert billing_address is first_fields['shipping'].annotation.model_fields['address'].annotation  # type: ignore
+    assert billing_address is second_fields['address'].annotation
+    assert billing_address is third_schema.model_fields['address'].annotation
+    other_address = second_fields['other_address'].annotation
+    assert other_address is not billing_address and issubclass(other_address, billing_address)  # type: ignore
+    assert other_address.__name__ == other_address.transpilation_name == 'other_address'  # type: ignore
+    assert billing_address.parent.transpilation_name == 'address' and other_address.parent is other_address  # type: ignore
+
+    factory = SchemaInstancesFactory(name=second_schema.transpilation_name, _model=second_schema, source=second_source)
+    results = factory.validate({'address': {'city': 'Heraklion', 'zip_code': 0}, 'other_address': {'city': 'Chania', 'zip_code': 73100}})
+    assert [error.name for error in results.errors] == ['zip_code']
+
+    # The renamed models are generated ahead of time as subclasses of the shared ones too
+    generated_source = CodeGenerator.generate_module(factory, {}, {})
+    assert 'class other_address(_address):' in generated_source
+    generated_module = types.ModuleType('second_schema')
+    exec(compile(generated_source, 'second_schema', 'exec'), generated_module.__dict__)  # pylint: disable=exec-used
+    generated_factory = SchemaInstancesFactory(name='Second', _model=generated_module.SCHEMA)  # pylint: disable=no-member
+    assert generated_factory.schema == factory.schema
+
+    first_schema_reference = weakref.ref(first_schema)
+    del first_schema, first_fields
+    gc.collect()
+    assert first_schema_reference() is None
+
+
+@pytest.mark.order(11)
+def test_schema_references(mock_config_file_base) -> None:
+    definitions = {
+        'Code': {'description': 'Code', 'type': 'str', 'default': 'A'},
+        'Point': {'description': 'Point', 'properties': {'x': {'description': 'X', 'type': 'int'}}}
+    }
+    schema = Transpiler.make_schema(
+        schema=mock_config_file_base | {
+            'name': 'Referring',
+            'definitions': definitions,
+            'properties': {
+                'start': {'$ref': '#/definitions/Point'},
+                'end': {'$ref': '#/definitions/Point'},
+                'code': {'$ref': '#/definitions/Code', 'default': 'B'}
+            }
+        }
+    )
+    fields = schema.model_fields
+    assert fields['start'].annotation is fields['end'].annotation
+    assert fields['start'].annotation.__name__ == 'Point'  # type: ignore
+    assert fields['code'].default == 'B'
+
+    with pytest.raises(SchemaLoadingException, match='only be resolved when loaded by the manager'):
+        Transpiler.make_schema(schema=mock_config_file_base | {'name': 'External', 'properties': {'other': {'$ref': 'Other'}}})
+    with pytest.raises(SchemaLoadingException, match='Definition Missing'):
+        Transpiler.make_schema(schema=mock_config_file_base | {'name': 'Missing', 'properties': {'other': {'$ref': '#/definitions/Missing'}}})
+    with pytest.raises(SchemaLoadingException, match='Circular definition references: Loop -> Loop'):
+        Transpiler.make_schema(
+            schema=mock_config_file_base | {
+                'name': 'Looping',
+                'definitions': {'Loop': {'description': 'Loop', 'properties': {'next': {'$ref': '#/definitions/Loop'}}}},
+                'properties': {'loop': {'$ref': '#/definitions/Loop'}}
+            }
+        )
+    assert Transpiler.find_references({  # type: ignore
+        'definitions': {'Item': {'properties': {'product': {'$ref': 'Product'}}}},
+        'properties': {'customer': {'$ref': 'Customer'}, 'item': {'$ref': '#/definitions/Item'}}
+    }) == ['Customer', 'Product']
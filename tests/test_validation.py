@@ -1,9 +1,16 @@
 # pylint: disable=wrong-import-position
+import asyncio
+import concurrent.futures
 import copy
+import io
+import itertools
+import json
 import os
 import shutil
 import textwrap
+import time
 import types
+import typing
 import yaml
 
 import pytest
@@ -12,8 +19,12 @@ import consts  # type: ignore
 import conftest  # type: ignore
 
 import phaistos
+import phaistos.cache
+import phaistos.codegen
+import phaistos.compiler
 import phaistos.consts
 import phaistos.schema
+import phaistos.typings
 from phaistos.typings import SchemaInputFile
 
 
@@ -235,3 +246,624 @@ def test_constructor_call_for_model(faulty_flat_config_file) -> None:
         model = manager.get_factory(schema_name)
         assert model.build(mock_data) is None
         assert model._model.validation_errors != []  # pylint: disable=protected-access
+
+
+@pytest.mark.order(9)
+def test_json_schema_is_generated_once(faulty_flat_config_file, monkeypatch) -> None:
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        schema_name = manager.load_schema(faulty_flat_config_file)
+        factory = manager.get_factory(schema_name)
+        mock_data = conftest.create_mock_schema_data(faulty_flat_config_file['properties'])
+
+        generated_schemas = []
+        original_model_json_schema = factory._model.model_json_schema  # pylint: disable=protected-access
+
+        def counting_model_json_schema(*args, **kwargs):
+            generated_schemas.append(True)
+            return original_model_json_schema(*args, **kwargs)
+
+        monkeypatch.setattr(factory._model, 'model_json_schema', counting_model_json_schema)  # pylint: disable=protected-access
+
+        first_validation = manager.validate(data=mock_data, schema=schema_name)
+        assert not generated_schemas
+
+        assert first_validation.schema == manager.validate(data=mock_data, schema=schema_name).schema
+        assert len(generated_schemas) == 1
+
+        # The results get their own copies of the cached schema, which can still be given upfront
+        first_validation.schema['title'] = 'Changed'
+        assert manager.validate(data=mock_data, schema=schema_name).schema['title'] != 'Changed'
+        assert factory.schema['title'] != 'Changed'
+        given_schema = {'title': 'Given'}
+        assert phaistos.typings.ValidationResults(schema=given_schema, errors=[], data={}).schema is given_schema
+        assert phaistos.typings.BatchValidationResults(schema=given_schema).schema is given_schema
+        assert len(generated_schemas) == 1
+
+        reloaded_factory = manager.get_factory(manager.load_schema(faulty_flat_config_file))
+        assert reloaded_factory._model.__dict__.get('_json_schema') is None  # pylint: disable=protected-access
+
+
+@pytest.mark.order(10)
+def test_batch_validation(faulty_flat_config_file) -> None:
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        schema_name = manager.load_schema(faulty_flat_config_file)
+        faulty_data = conftest.create_mock_schema_data(faulty_flat_config_file['properties'])
+        payloads = [faulty_data, {**faulty_data, 'database': 'db', 'table': 'table'}, faulty_data]
+
+        factory = manager.get_factory(schema_name)
+        expected_results = [factory.validate(payload) for payload in payloads]
+        batch_results = manager.validate_many(iter(payloads), schema=schema_name, chunk_size=2)
+
+        assert batch_results.total == 3
+        assert list(batch_results.mask) == [int(result.valid) for result in expected_results]
+        assert batch_results.invalid_count == len(batch_results.errors) == 3 - batch_results.valid_count
+        for index, result in enumerate(expected_results):
+            assert set(batch_results.errors.get(index, [])) == set(result.errors)
+        assert batch_results.error_counts['table'] == 2
+
+
+@pytest.mark.order(11)
+def test_stream_validation(faulty_flat_config_file) -> None:
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        schema_name = manager.load_schema(faulty_flat_config_file)
+        factory = manager.get_factory(schema_name)
+        faulty_data = conftest.create_mock_schema_data(faulty_flat_config_file['properties'])
+        valid_data = {**faulty_data, 'database': 'db', 'table': 'table'}
+
+        lines = [
+            json.dumps(valid_data).encode(),
+            b'',
+            json.dumps(faulty_data).encode(),
+            b'{"host": ',
+        ]
+        stream = io.BytesIO(b'\n'.join(lines) + b'\n')
+        results = list(manager.validate_stream(stream, schema=schema_name))
+
+        assert [result.line for result in results] == [1, 3, 4]
+        assert results[0].valid and results[0].offset == 0
+        assert results[1].offset == len(lines[0]) + 2
+        assert set(results[1].errors) == set(factory.validate(faulty_data).errors)
+        assert not results[2].valid
+
+        manager.load_schema({
+            'version': 'v1',
+            'description': 'A schema without a global validator',
+            'name': 'Adult',
+            'properties': {
+                'age': {
+                    'type': 'int',
+                    'description': 'The age of the person',
+                    'validator': "if value < 18: raise ValueError('The age must be at least 18')"
+                }
+            }
+        })
+        adult_results = list(manager.validate_stream(['{"age": 30}\n', '{"age": 3}\n', '[]\n'], schema='Adult'))
+        assert [result.valid for result in adult_results] == [True, False, False]
+        assert adult_results[1].errors[0].name == 'age'
+
+        # The offsets of the text streams are in bytes as well
+        text_lines = ['{"age": 30, "name": "Ζήνων"}\n', '\n', '{"age": 3, "name": "Ἀρχιμήδης"}\n', '{"age": 40}\n']
+        text_results = list(manager.validate_stream(io.StringIO(''.join(text_lines)), schema='Adult'))
+        encoded_text = ''.join(text_lines).encode()
+        assert [result.offset for result in text_results] == [0, len(text_lines[0].encode()) + 1, encoded_text.index(b'{"age": 40}')]
+        assert [result.valid for result in text_results] == [True, False, True]
+
+
+@pytest.mark.order(12)
+def test_concurrent_validation(faulty_flat_config_file, faulty_double_nested_config_file) -> None:
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        flat_schema = manager.load_schema(faulty_flat_config_file)
+        nested_schema = manager.load_schema(faulty_double_nested_config_file)
+        faulty_data = conftest.create_mock_schema_data(faulty_flat_config_file['properties'])
+        payloads = [
+            faulty_data if index % 2 else {**faulty_data, 'database': 'db', 'table': 'table'}
+            for index in range(200)
+        ]
+
+        expected_errors = [set(manager.validate(data=payload, schema=flat_schema).errors) for payload in payloads]
+        nested_data = conftest.create_mock_schema_data(faulty_double_nested_config_file['properties'])
+        expected_nested_errors = set(manager.validate(data=nested_data, schema=nested_schema).errors)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            nested_results = executor.submit(manager.validate_concurrently, [nested_data] * 50, nested_schema, 2, 5)
+            flat_results = manager.validate_concurrently(payloads, schema=flat_schema, max_workers=8, chunk_size=7)
+
+        assert [set(result.errors) for result in flat_results] == expected_errors
+        assert all(set(result.errors) == expected_nested_errors for result in nested_results.result())
+
+
+@pytest.mark.order(12)
+def test_lazy_concurrent_validation(faulty_flat_config_file, monkeypatch) -> None:
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        factory = manager.get_factory(manager.load_schema(faulty_flat_config_file))
+        faulty_data = conftest.create_mock_schema_data(faulty_flat_config_file['properties'])
+        payloads = [
+            faulty_data if index % 2 else {**faulty_data, 'database': 'db', 'table': 'table'}
+            for index in range(200)
+        ]
+        expected_errors = [set(factory.validate(payload).errors) for payload in payloads]
+
+        # The entries are only read a bounded window ahead of the validated ones
+        validated_entries: list[dict] = []
+        entries_ahead: list[int] = []
+        original_validate = factory.validate
+
+        def tracked_validate(data, context=None):
+            results = original_validate(data, context)
+            validated_entries.append(data)
+            return results
+
+        def payloads_source():
+            for index, payload in enumerate(payloads):
+                entries_ahead.append(index - len(validated_entries))
+                yield payload
+
+        monkeypatch.setattr(factory, 'validate', tracked_validate)
+        lazy_results = factory.validate_concurrently(payloads_source(), max_workers=2, chunk_size=5)
+        assert [set(result.errors) for result in lazy_results] == expected_errors
+        assert max(entries_ahead) < 2 * 2 * 5
+
+
+@pytest.mark.order(13)
+def test_process_pool_validation(faulty_flat_config_file) -> None:
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        schema_name = manager.load_schema(faulty_flat_config_file)
+        faulty_data = conftest.create_mock_schema_data(faulty_flat_config_file['properties'])
+        payloads = [
+            faulty_data if index % 3 else {**faulty_data, 'database': 'db', 'table': 'table'}
+            for index in range(50)
+        ]
+
+        expected_results = manager.validate_many(payloads, schema=schema_name)
+        parallel_results = manager.validate_parallel(iter(payloads), schema=schema_name, processes=2, chunk_size=4)
+
+        assert parallel_results.mask == expected_results.mask
+        assert {
+            index: set(errors)
+            for index, errors in parallel_results.errors.items()
+        } == {
+            index: set(errors)
+            for index, errors in expected_results.errors.items()
+        }
+
+
+@pytest.mark.order(14)
+def test_async_validation(faulty_flat_config_file, monkeypatch) -> None:  # pylint: disable=too-many-locals
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        schema_name = manager.load_schema(faulty_flat_config_file)
+        factory = manager.get_factory(schema_name)
+        faulty_data = conftest.create_mock_schema_data(faulty_flat_config_file['properties'])
+        payloads = [
+            faulty_data if index % 2 else {**faulty_data, 'database': 'db', 'table': 'table'}
+            for index in range(12)
+        ]
+        expected_validity = [factory.validate(payload).valid for payload in payloads]
+
+        running_validations = [0]
+        peak_validations = [0]
+        original_validate = factory.validate
+
+        def tracked_validate(data, context=None):
+            running_validations[0] += 1
+            peak_validations[0] = max(peak_validations[0], running_validations[0])
+            time.sleep(0.01)
+            running_validations[0] -= 1
+            return original_validate(data, context)
+
+        monkeypatch.setattr(factory, 'validate', tracked_validate)
+
+        async def payloads_source():
+            for payload in payloads:
+                yield payload
+
+        async def run_validations():
+            single_result = await manager.avalidate(payloads[1], schema=schema_name)
+            streamed_results = [
+                result
+                async for result in manager.avalidate_stream(payloads_source(), schema=schema_name)
+            ]
+            return single_result, streamed_results
+
+        phaistos.Manager.configure_async(max_concurrency=3)
+        try:
+            single_result, streamed_results = asyncio.run(run_validations())
+        finally:
+            phaistos.Manager.configure_async()
+
+        assert not single_result.valid
+        assert [result.valid for result in streamed_results] == expected_validity
+        assert [result.data for result in streamed_results] == payloads
+        assert 1 < peak_validations[0] <= 3
+
+
+@pytest.mark.order(15)
+def test_validation_without_instantiation(faulty_flat_config_file, faulty_double_nested_config_file, monkeypatch) -> None:
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        for config_file in [faulty_flat_config_file, faulty_double_nested_config_file]:
+            factory = manager.get_factory(manager.load_schema(config_file))
+            faulty_data = conftest.create_mock_schema_data(config_file['properties'])
+            payloads = [faulty_data, {**faulty_data, 'database': 'db', 'table': 'table'}, {}]
+
+            expected_errors = []
+            for payload in payloads:
+                with phaistos.schema.validation_scope() as collected_errors:
+                    factory._model(**payload)  # pylint: disable=protected-access
+                expected_errors.append(set(collected_errors))
+
+            instantiated_models: list[dict] = []
+            monkeypatch.setattr(factory._model, '__init__', instantiated_models.append)  # pylint: disable=protected-access
+            assert [set(factory.validate(payload).errors) for payload in payloads] == expected_errors
+            assert not instantiated_models
+            monkeypatch.undo()
+
+            for payload, errors in zip(payloads, expected_errors):
+                instance, results = factory.validate_and_build(payload)
+                assert set(results.errors) == errors
+                assert (instance is None) == bool(errors)
+
+
+@pytest.mark.order(16)
+def test_json_validation(faulty_flat_config_file, faulty_double_nested_config_file) -> None:
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        for config_file in [faulty_flat_config_file, faulty_double_nested_config_file]:
+            schema_name = manager.load_schema(config_file)
+            faulty_data = conftest.create_mock_schema_data(config_file['properties'])
+            for data in [faulty_data, {**faulty_data, 'database': 'db', 'table': 'table'}]:
+                expected_errors = set(manager.validate(data=data, schema=schema_name).errors)
+                document = json.dumps(data)
+                raw_documents: list[str | bytes | memoryview] = [document, document.encode(), memoryview(document.encode())]
+                for raw in raw_documents:
+                    result = manager.validate_json(raw, schema=schema_name)
+                    assert set(result.errors) == expected_errors
+                    assert result.valid == (not expected_errors)
+                    assert result.schema == manager.get_factory(schema_name).schema
+
+        manager.load_schema({
+            'version': 'v1',
+            'description': 'A schema without a global validator',
+            'name': 'Adult',
+            'properties': {
+                'age': {
+                    'type': 'int',
+                    'description': 'The age of the person',
+                    'validator': "if value < 18: raise ValueError('The age must be at least 18')"
+                }
+            }
+        })
+        assert manager.validate_json(b'{"age": 30}', schema='Adult').valid
+        assert [error.name for error in manager.validate_json(b'{"age": 3}', schema='Adult').errors] == ['age']
+        assert not manager.validate_json(b'{"age": ', schema='Adult').valid
+
+
+@pytest.mark.order(17)
+def test_mapped_file_validation(faulty_flat_config_file, tmp_path, monkeypatch) -> None:  # pylint: disable=too-many-locals
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        schema_name = manager.load_schema(faulty_flat_config_file)
+        factory = manager.get_factory(schema_name)
+        faulty_data = conftest.create_mock_schema_data(faulty_flat_config_file['properties'])
+        valid_data = {**faulty_data, 'database': 'db', 'table': 'table'}
+
+        lines = [
+            json.dumps(valid_data).encode(),
+            b'  ',
+            json.dumps(faulty_data).encode(),
+            json.dumps(valid_data).encode() + b'\r',
+            b'{"host": ',
+        ]
+        records_path = tmp_path / 'records.jsonl'
+        records_path.write_bytes(b'\n'.join(lines))
+        (tmp_path / 'empty.jsonl').write_bytes(b'')
+
+        with phaistos.MappedRecordsFile(records_path) as records:
+            assert list(records.lines) == [1, 3, 4, 5]
+            assert list(records.offsets) == [0, len(lines[0]) + 4, len(lines[0]) + len(lines[2]) + 5, records_path.stat().st_size - len(lines[4])]
+            record = records.record(1)
+            assert record.tobytes() == lines[2]
+            record.release()
+
+            results = records.validate(factory)
+            assert results.mask == bytearray([1, 0, 1, 0])
+            failures = list(records.failures(results))
+            assert [(failure.line, failure.offset) for failure in failures] == [(3, records.offsets[1]), (5, records.offsets[3])]
+            assert set(failures[0].errors) == set(factory.validate(faulty_data).errors)
+
+            validated_records = []
+            original_collect_json_errors = factory._collect_json_errors  # pylint: disable=protected-access
+
+            def tracked_collect_json_errors(raw):
+                validated_records.append((type(raw), raw.tobytes()))
+                return original_collect_json_errors(raw)
+
+            monkeypatch.setattr(factory, '_collect_json_errors', tracked_collect_json_errors)
+            revalidated_results = records.revalidate(factory, results)
+            assert validated_records == [(memoryview, lines[2]), (memoryview, lines[4])]
+            assert revalidated_results.mask == results.mask
+            assert revalidated_results.errors.keys() == results.errors.keys()
+
+        with phaistos.MappedRecordsFile(tmp_path / 'empty.jsonl') as empty_records:
+            assert len(empty_records) == 0
+            assert empty_records.validate(factory).total == 0
+
+
+@pytest.mark.order(18)
+def test_checkpointed_validation(faulty_flat_config_file, tmp_path, monkeypatch) -> None:  # pylint: disable=too-many-locals
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        schema_name = manager.load_schema(faulty_flat_config_file)
+        factory = manager.get_factory(schema_name)
+        faulty_data = conftest.create_mock_schema_data(faulty_flat_config_file['properties'])
+        valid_data = {**faulty_data, 'database': 'db', 'table': 'table'}
+        payloads = [faulty_data if index % 3 == 0 else valid_data for index in range(10)]
+        records_path = tmp_path / 'records.jsonl'
+        records_path.write_bytes(b''.join(json.dumps(payload).encode() + b'\n\n' for payload in payloads))
+
+        expected_results = factory.validate_many(payloads)
+        for run_name, method_name, collector_name, source in [
+            ('entries', 'run', '_collect_errors', payloads),
+            ('file', 'run_file', '_collect_json_errors', records_path),
+        ]:
+            runner = phaistos.CheckpointedValidation(
+                factory=factory,
+                checkpoint_path=tmp_path / f'{run_name}.checkpoint.json',
+                checkpoint_every=3,
+                max_failures=2
+            )
+            original_collector = getattr(factory, collector_name)
+            validated_entries: list[typing.Any] = []
+
+            def crashing_collector(entry, original_collector=original_collector, validated_entries=validated_entries):  # pylint: disable=dangerous-default-value
+                if len(validated_entries) == 7:
+                    raise KeyboardInterrupt
+                validated_entries.append(entry)
+                return original_collector(entry)
+
+            monkeypatch.setattr(factory, collector_name, crashing_collector)
+            with pytest.raises(KeyboardInterrupt):
+                getattr(runner, method_name)(source)
+            monkeypatch.undo()
+
+            interrupted_checkpoint = runner.load_checkpoint()
+            assert interrupted_checkpoint.total == 7 and not interrupted_checkpoint.completed  # type: ignore
+
+            resumed_checkpoint = getattr(runner, method_name)(source)
+            assert resumed_checkpoint.completed
+            assert resumed_checkpoint.total == expected_results.total
+            assert resumed_checkpoint.invalid_count == expected_results.invalid_count
+            assert sum(resumed_checkpoint.error_counts.values()) == sum(len(errors) for errors in expected_results.errors.values())
+            assert len(resumed_checkpoint.failures) == 2
+            assert runner.load_checkpoint() == resumed_checkpoint
+
+        records_offsets = [0, *itertools.accumulate(len(json.dumps(payload)) + 2 for payload in payloads)]
+        assert [failure['position'] for failure in resumed_checkpoint.failures] == records_offsets[0:4:3]
+
+        manager.load_schema(faulty_flat_config_file | {'description': 'A changed schema'})
+        changed_runner = phaistos.CheckpointedValidation(
+            factory=manager.get_factory(schema_name),
+            checkpoint_path=tmp_path / 'file.checkpoint.json'
+        )
+        with pytest.raises(phaistos.exceptions.CheckpointMismatchException):
+            changed_runner.run_file(records_path)
+        assert changed_runner.run_file(records_path, resume=False).total == len(payloads)
+
+
+@pytest.mark.order(19)
+def test_validation_results_cache(faulty_flat_config_file, monkeypatch) -> None:  # pylint: disable=too-many-locals
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        schema_name = manager.load_schema(faulty_flat_config_file)
+        factory = manager.get_factory(schema_name)
+        faulty_data = conftest.create_mock_schema_data(faulty_flat_config_file['properties'])
+        valid_data = {**faulty_data, 'database': 'db', 'table': 'table'}
+        expected_errors = set(factory.validate(faulty_data).errors)
+
+        factory.enable_cache(max_size=2, ttl=60.0)
+        validated_payloads: list[typing.Any] = []
+        original_validate_only = factory._model.validate_only  # pylint: disable=protected-access
+        monkeypatch.setattr(
+            factory._model,  # pylint: disable=protected-access
+            'validate_only',
+            lambda data, raw=None: validated_payloads.append(data or raw) or original_validate_only(data, raw)  # type: ignore
+        )
+
+        first_errors = factory.validate(faulty_data).errors
+        assert set(first_errors) == expected_errors
+        cached_errors = factory.validate(copy.deepcopy(faulty_data)).errors
+        assert set(cached_errors) == expected_errors
+        # The cached errors are timestamped with the validation they are returned for
+        assert min(error.timestamp for error in cached_errors) >= max(error.timestamp for error in first_errors)
+        assert not {id(error) for error in cached_errors} & {id(error) for error in first_errors}
+        assert set(factory.validate(dict(reversed(faulty_data.items()))).errors) == expected_errors
+        assert factory.validate(valid_data).valid
+        assert len(validated_payloads) == 2
+        assert (factory.result_cache.hits, factory.result_cache.misses) == (2, 2)  # type: ignore
+
+        # Payloads that cannot be marshalled are always validated, the least recently used results are evicted
+        factory.validate({**faulty_data, 'port': types.SimpleNamespace()})
+        factory.validate_json(json.dumps(faulty_data))
+        factory.validate_json(json.dumps(faulty_data).encode())
+        assert len(validated_payloads) == 4
+        factory.validate(faulty_data)
+        assert len(validated_payloads) == 5
+
+        # The expired results are validated again
+        current_time = time.monotonic()
+        monkeypatch.setattr(phaistos.cache.time, 'monotonic', lambda: current_time + 120.0)
+        factory.validate_json(json.dumps(faulty_data))
+        assert len(validated_payloads) == 6
+        monkeypatch.undo()
+
+        manager.load_schema(faulty_flat_config_file)
+        reloaded_factory = manager.get_factory(schema_name)
+        assert reloaded_factory is not factory
+        assert len(reloaded_factory.result_cache) == 0  # type: ignore
+        assert reloaded_factory.result_cache.max_size == 2  # type: ignore
+
+        impure_schema = copy.deepcopy(faulty_flat_config_file)
+        impure_schema['name'] = 'ImpureSchema'
+        impure_property = next(iter(impure_schema['properties'].values()))
+        impure_property['validator'] = {'source': 'pass', 'mode': 'after', 'pure': False}
+        impure_factory = manager.get_factory(manager.load_schema(impure_schema))
+        impure_factory.enable_cache()
+        assert impure_factory.result_cache is None
+
+
+@pytest.mark.order(20)
+def test_memoized_validators(faulty_flat_config_file) -> None:  # pylint: disable=too-many-locals
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        memoized_schema = copy.deepcopy(faulty_flat_config_file)
+        memoized_schema['name'] = 'MemoizedSchema'
+        memoized_schema['properties']['database']['validator'] = {
+            **memoized_schema['properties']['database']['validator'],
+            'cache_size': 2
+        }
+        memoized_schema['properties']['table']['validator'] = {
+            **memoized_schema['properties']['table']['validator'],
+            'cache': True,
+            'pure': False
+        }
+        factory = manager.get_factory(manager.load_schema(memoized_schema))
+        faulty_data = conftest.create_mock_schema_data(faulty_flat_config_file['properties'])
+        expected_errors = [(error.name, error.message) for error in factory.validate(faulty_data).errors]
+
+        # The errors are memoized as well, the impure validators are not memoized at all
+        for _ in range(3):
+            assert [(error.name, error.message) for error in factory.validate(faulty_data).errors] == expected_errors
+        assert list(factory.validator_cache_info()) == ['MemoizedSchema.database']
+        assert factory.validator_cache_info()['MemoizedSchema.database'][:2] == (3, 1)
+        for database in ['db1', 'db2', 'db1', '_db']:
+            factory.validate({**faulty_data, 'database': database})
+        assert factory.validator_cache_info()['MemoizedSchema.database'] == (4, 4, 2, 2)
+
+        # The unhashable values are memoized by their contents, or not at all if they have no hashable projection
+        validated_values = []
+
+        def identity(_, value, info):  # pylint: disable=unused-argument
+            validated_values.append(value)
+            return value
+
+        memoized_identity: typing.Any = phaistos.compiler.ValidationFunctionsCompiler.memoize(identity, 8).__func__
+        context_info = types.SimpleNamespace(context={'allowed': ['a', 'b']})
+        for value in [['a', {'b': 1}], ['a', {'b': 1}], ['a', {'b': True}], {'a'}, {'a'}, bytearray(b'a')]:
+            assert memoized_identity(None, value, context_info) == value
+        assert memoized_identity(None, bytearray(b'a'), context_info) == bytearray(b'a')
+        assert len(validated_values) == 5
+        assert memoized_identity.cache_info()[:2] == (2, 3)
+
+        # The mutable results are never shared by the validations, changing a built instance keeps the memoized result
+        tags_schema: SchemaInputFile = {
+            'version': 'v1',
+            'description': 'Tags',
+            'name': 'MemoizedTags',
+            'properties': {
+                'tags': {'description': 'Tags', 'type': 'list[str]', 'validator': {'source': 'value = sorted(value)', 'mode': 'after', 'cache': True}}
+            }
+        }
+        tags_factory = manager.get_factory(manager.load_schema(tags_schema))
+        first_instance = tags_factory.build({'tags': ['b', 'a']})
+        first_instance.tags.append('c')  # type: ignore
+        second_instance = tags_factory.build({'tags': ['b', 'a']})
+        assert second_instance.tags == ['a', 'b'] and second_instance.tags is not first_instance.tags  # type: ignore
+        assert tags_factory.validator_cache_info()['MemoizedTags.tags'][:2] == (1, 1)
+
+        generated_source = phaistos.codegen.CodeGenerator.generate_module(factory, {}, {})
+        assert 'phaistos.compiler.ValidationFunctionsCompiler.memoize(' in generated_source
+        generated_module = types.ModuleType('memoized_schema')
+        exec(compile(generated_source, 'memoized_schema', 'exec'), generated_module.__dict__)  # pylint: disable=exec-used
+        generated_factory = phaistos.schema.SchemaInstancesFactory(name='MemoizedSchema', _model=generated_module.SCHEMA)  # pylint: disable=no-member
+        assert [(error.name, error.message) for error in generated_factory.validate(faulty_data).errors] == expected_errors
+        assert list(generated_factory.validator_cache_info()) == ['MemoizedSchema.database']
+
+
+@pytest.mark.order(21)
+def test_per_call_context() -> None:
+    with conftest.schema_discovery(state=False):
+        manager = phaistos.Manager.start()
+        threshold_validator: phaistos.typings.RawValidator = {
+            'mode': 'after',
+            'cache': True,
+            'source': "if value > info.context['max_value']: raise ValueError(f'{info.field_name} is too high')"
+        }
+        schema: SchemaInputFile = {
+            'version': 'v1',
+            'description': 'Measurements of a tenant',
+            'name': 'TenantMeasurements',
+            'properties': {
+                'temperature': {
+                    'type': 'int',
+                    'description': 'Temperature',
+                    'validator': threshold_validator
+                },
+                'sensor': {
+                    'description': 'Sensor of the measurements',
+                    'properties': {
+                        'voltage': {
+                            'type': 'int',
+                            'description': 'Voltage of the sensor',
+                            'validator': threshold_validator
+                        }
+                    },
+                    'context': {
+                        'max_value': 5
+                    }
+                }
+            },
+            'context': {
+                'max_value': 50
+            }
+        }
+        schema_name = manager.load_schema(schema)
+        factory = manager.get_factory(schema_name)
+        data = {'temperature': 40, 'sensor': {'voltage': 12}}
+
+        assert [error.name for error in manager.validate(data, schema_name).errors] == ['voltage']
+        assert {error.name for error in manager.validate(data, schema_name, context={'max_value': 30}).errors} == {'temperature'}
+        assert manager.validate(data, schema_name, context={'max_value': 100}).valid
+        assert manager.validate_json(json.dumps(data), schema_name, context={'max_value': 100}).valid
+        assert factory.validate_and_build(data, context={'max_value': 100})[0] is not None
+        # The context of a call is not left behind for the next ones
+        assert [error.name for error in manager.validate(data, schema_name).errors] == ['voltage']
+        assert factory._model.context == {'max_value': 50}  # pylint: disable=protected-access
+
+        factory.enable_cache()
+        assert not manager.validate(data, schema_name).valid
+        assert manager.validate(data, schema_name, context={'max_value': 100}).valid
+        assert not manager.validate(data, schema_name).valid
+        assert factory.result_cache.hits == 1  # type: ignore
+
+        with phaistos.schema.context_scope({'max_value': 100}):
+            assert factory._model(**data).validation_errors == []  # pylint: disable=protected-access
+
+        payloads = [data] * 4
+        wide_context = {'max_value': 100}
+        # The worker processes receive the context of the call along with the schema manifests
+        assert manager.validate_parallel(payloads, schema_name, processes=2, chunk_size=2, context=wide_context).valid
+
+        async def validate_asynchronously():
+            single_result = await manager.avalidate(data, schema_name, context=wide_context)
+            streamed_results = [
+                result
+                async for result in manager.avalidate_stream(payloads, schema_name, context=wide_context)
+            ]
+            return [single_result, *streamed_results]
+
+        assert all(result.valid for result in asyncio.run(validate_asynchronously()))
+        assert manager.validate_many(payloads, schema_name, context=wide_context).valid
+        assert all(record.valid for record in manager.validate_stream([json.dumps(data)] * 2, schema_name, context=wide_context))
+        # The threads validating the entries of concurrent calls each see only the context of their own call
+        factory.disable_cache()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            wide_results = executor.submit(manager.validate_concurrently, payloads * 25, schema_name, 2, 1, context=wide_context)
+            default_results = executor.submit(manager.validate_concurrently, payloads * 25, schema_name, 2, 1)
+            assert all(result.valid for result in wide_results.result())
+            assert not any(result.valid for result in default_results.result())